@@ -0,0 +1,381 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses two Television variants that several threads (the GUI, the network server, a scheduler) can drive
+at once. Television's read-modify-write methods are not atomic: volume_up reads the mute flag, may call mute(), then
+increments, and a thread switch in between loses or mixes updates.
+
+AtomicTelevision keeps the whole state in one packed word (the compact.pack layout). Every transition reads the word,
+computes the next word with a pure function (bit operations for single presses, commands.fold for batches) without
+holding anything, and publishes it with compare_and_set(), retrying if another thread got there first. CPython has
+no atomic compare-and-swap for Python objects, so compare_and_set() itself is a short critical section of one
+comparison and one store; the transition logic never runs under it.
+LockedTelevision is the fine-grained locking alternative: a Television with one re-entrant lock per instance.
+
+Running it directly compares throughput of Television (unsafe), LockedTelevision and AtomicTelevision as the number
+of threads grows, and counts the updates each one lost.
+"""
+
+### Import packages ###
+import sys
+import threading
+import time
+from commands import fold, parse
+from compact import CHANNEL_SHIFT, MUTED_BIT, STATUS_BIT, VOLUME_MASK, VOLUME_SHIFT, pack, unpack
+from remote import Television
+
+### UDF Declaration ###
+def transitions(low_volume: int, high_volume: int, low_channel: int, high_channel: int) -> dict:
+    """
+    Builds the button transitions as pure functions from one packed state word to the next
+    :param low_volume: MIN_VOLUME
+    :param high_volume: MAX_VOLUME
+    :param low_channel: MIN_CHANNEL
+    :param high_channel: MAX_CHANNEL
+    :return: dictionary of button name to function
+    """
+    channel_bits = -1 << CHANNEL_SHIFT
+    volume_bits = VOLUME_MASK << VOLUME_SHIFT
+
+    def power(state: int) -> int:
+        return state ^ STATUS_BIT
+
+    def mute(state: int) -> int:
+        return state ^ MUTED_BIT if state & STATUS_BIT else state
+
+    def channel_up(state: int) -> int:
+        if not state & STATUS_BIT:
+            return state
+        channel = state >> CHANNEL_SHIFT
+        channel = channel + 1 if channel < high_channel else low_channel
+        return (state & ~channel_bits) | (channel << CHANNEL_SHIFT)
+
+    def channel_down(state: int) -> int:
+        if not state & STATUS_BIT:
+            return state
+        channel = state >> CHANNEL_SHIFT
+        channel = channel - 1 if channel > low_channel else high_channel
+        return (state & ~channel_bits) | (channel << CHANNEL_SHIFT)
+
+    def volume_up(state: int) -> int:
+        if not state & STATUS_BIT:
+            return state
+        volume = (state >> VOLUME_SHIFT) & VOLUME_MASK
+        volume = volume + 1 if volume < high_volume else volume
+        return (state & ~(volume_bits | MUTED_BIT)) | (volume << VOLUME_SHIFT)
+
+    def volume_down(state: int) -> int:
+        if not state & STATUS_BIT:
+            return state
+        volume = (state >> VOLUME_SHIFT) & VOLUME_MASK
+        volume = volume - 1 if volume > low_volume else volume
+        return (state & ~(volume_bits | MUTED_BIT)) | (volume << VOLUME_SHIFT)
+
+    return {"power": power, "mute": mute, "channel_up": channel_up, "channel_down": channel_down,
+            "volume_up": volume_up, "volume_down": volume_down}
+
+### Class definition ###
+class AtomicTelevision:
+    """
+    A thread-safe Television whose transitions are atomic compare-and-set updates of a single packed state word
+
+    Methods
+    -------
+    Same as remote.Television, plus:
+    state():
+        Returns the packed state word
+    snapshot():
+        Returns powered, muted, volume and channel read from one state word
+    compare_and_set(expected, new):
+        Replaces the state word with new if it still equals expected
+    apply(script):
+        Applies a batch such as "POWER, VOL+ x50" as one atomic transition
+    retries : int
+        The number of transitions that had to be recomputed because another thread changed the state first
+    """
+
+    ### Class Variables ###
+    MIN_VOLUME: int = Television.MIN_VOLUME
+    MAX_VOLUME: int = Television.MAX_VOLUME
+    MIN_CHANNEL: int = Television.MIN_CHANNEL
+    MAX_CHANNEL: int = Television.MAX_CHANNEL
+
+    ### Constructors ###
+    def __init__(self) -> None:
+        """
+        Constructs the state word for the tv object, in the Television default state
+        """
+        if self.MAX_VOLUME > VOLUME_MASK:
+            raise ValueError(f"MAX_VOLUME {self.MAX_VOLUME} does not fit the packed volume field")
+        self.__state: int = pack(False, False, self.MIN_VOLUME, self.MIN_CHANNEL)
+        self.__swap = threading.Lock()
+        self.__limits: tuple = (self.MIN_VOLUME, self.MAX_VOLUME, self.MIN_CHANNEL, self.MAX_CHANNEL)
+        self.__steps: dict = transitions(*self.__limits)
+        self.retries: int = 0 # approximate: it is a statistic, so it is not itself updated atomically
+
+    ### Atomic update ###
+    def compare_and_set(self, expected: int, new: int) -> bool:
+        """
+        Replaces the state word with new if it still equals expected
+        :param expected: The state word the new one was computed from
+        :param new: The state word to publish
+        :return: True if the word was replaced, False if another thread changed it first
+        """
+        with self.__swap:
+            if self.__state != expected:
+                return False
+            self.__state = new
+            return True
+
+    def __transition(self, step) -> None:
+        """
+        Applies a transition atomically, recomputing it from the latest word until the swap succeeds
+        :param step: A pure function from the current state word to the next
+        """
+        while True:
+            current = self.__state
+            new = step(current)
+            if new == current or self.compare_and_set(current, new):
+                return
+            self.retries += 1
+
+    ### Mutators ###
+    def power(self) -> None:
+        """
+        Toggles the status to turn the tv on and off
+        """
+        self.__transition(self.__steps["power"])
+
+    def mute(self) -> None:
+        """
+        Toggles the mute state when the tv is powered on
+        """
+        self.__transition(self.__steps["mute"])
+
+    def channel_up(self) -> None:
+        """
+        Incraments the channel, cycling back to the minimum channel after the maximum
+        """
+        self.__transition(self.__steps["channel_up"])
+
+    def channel_down(self) -> None:
+        """
+        Decraments the channel, cycling to the maximum channel below the minimum
+        """
+        self.__transition(self.__steps["channel_down"])
+
+    def volume_up(self) -> None:
+        """
+        Unmutes the tv and incraments the volume until the maximum volume value is reached, in one step
+        """
+        self.__transition(self.__steps["volume_up"])
+
+    def volume_down(self) -> None:
+        """
+        Unmutes the tv and decrements the volume until the minimum volume value is reached, in one step
+        """
+        self.__transition(self.__steps["volume_down"])
+
+    def set_channel(self, value: int) -> None:
+        """
+        Assigns value to the channel when the tv is powered on
+        :param value: The integer value representing a user-inputted channel
+        """
+        self.__transition(lambda state : state if not state & STATUS_BIT else
+                          (state & ~(-1 << CHANNEL_SHIFT)) | (value << CHANNEL_SHIFT))
+
+    def apply(self, script: str) -> None:
+        """
+        Applies a batch of presses such as "POWER, VOL+ x50, CH- x13, 7" as one atomic transition (see commands.py)
+        :param script: The comma-separated batch
+        """
+        runs, limits = parse(script), self.__limits
+        self.__transition(lambda state : pack(*fold(unpack(state), runs, limits)))
+
+    ### Accessors ###
+    def state(self) -> int:
+        """
+        Returns the packed state word, as built by compact.pack()
+        :return: the state word
+        """
+        return self.__state
+
+    def snapshot(self) -> tuple:
+        """
+        Returns a consistent view of the tv, read from a single state word
+        :return: tuple of powered, muted, volume (0 while muted) and channel
+        """
+        status, muted, volume, channel = unpack(self.__state)
+        return status, muted, 0 if muted else volume, channel
+
+    def powered(self) -> bool:
+        """
+        Returns whether the tv is on, from one consistent snapshot
+        :return: the status boolean
+        """
+        return self.snapshot()[0]
+
+    def muted(self) -> bool:
+        """
+        Returns whether the tv is muted, from one consistent snapshot
+        :return: the muted boolean
+        """
+        return self.snapshot()[1]
+
+    def getVolume(self) -> int:
+        """
+        Returns the volume, from one consistent snapshot
+        :return: 0 if the tv is muted or the stored volume otherwise
+        """
+        return self.snapshot()[2]
+
+    def storedVolume(self) -> int:
+        """
+        Returns the volume, including while muted, which getVolume() hides
+        :return: the stored volume
+        """
+        return unpack(self.__state)[2]
+
+    def getChannel(self) -> int:
+        """
+        Returns the channel, from one consistent snapshot
+        :return: the channel number
+        """
+        return self.snapshot()[3]
+
+    def __str__(self) -> str:
+        """
+        Returns the formatted state, matching Television.__str__(), from one consistent snapshot
+        :return: string of the power status, mute status, channel value, and volume value
+        """
+        status, muted, volume, channel = self.snapshot()
+        return f"Power - {status}, Mute - {muted}, Channel - {channel}, Volume - {volume}"
+
+class LockedTelevision(Television):
+    """
+    A thread-safe Television that holds a per-instance re-entrant lock through every method.
+    The lock is re-entrant because volume_up and volume_down call mute().
+    """
+
+    def __init__(self) -> None:
+        """
+        Configures the Television and the lock guarding it
+        """
+        super().__init__()
+        self.__lock = threading.RLock()
+
+    def power(self) -> None:
+        """
+        Toggles the power under the lock
+        """
+        with self.__lock:
+            super().power()
+
+    def mute(self) -> None:
+        """
+        Toggles mute under the lock
+        """
+        with self.__lock:
+            super().mute()
+
+    def channel_up(self) -> None:
+        """
+        Increases the channel under the lock
+        """
+        with self.__lock:
+            super().channel_up()
+
+    def channel_down(self) -> None:
+        """
+        Decreases the channel under the lock
+        """
+        with self.__lock:
+            super().channel_down()
+
+    def volume_up(self) -> None:
+        """
+        Increases the volume under the lock
+        """
+        with self.__lock:
+            super().volume_up()
+
+    def volume_down(self) -> None:
+        """
+        Decreases the volume under the lock
+        """
+        with self.__lock:
+            super().volume_down()
+
+    def set_channel(self, value: int) -> None:
+        """
+        Tunes straight to a channel under the lock
+        :param value: The channel number
+        """
+        with self.__lock:
+            super().set_channel(value)
+
+    def apply(self, script: str) -> None:
+        """
+        Applies a batch of presses under the lock, so no other thread sees it half done
+        :param script: The comma-separated batch
+        """
+        with self.__lock:
+            super().apply(script)
+
+    def __str__(self) -> str:
+        """
+        Returns the formatted state under the lock
+        :return: string of the power status, mute status, channel value, and volume value
+        """
+        with self.__lock:
+            return super().__str__()
+
+### Benchmark ###
+def contend(factory: type, threads: int, presses: int) -> tuple:
+    """
+    Starts threads that all press channel_up on one shared tv, on a channel range too wide to wrap
+    :param factory: A class with the Television interface
+    :param threads: The number of threads
+    :param presses: channel_up presses per thread
+    :return: tuple of presses per second and the number of presses lost
+    """
+    wide = type(f"Wide{factory.__name__}", (factory,), {"MAX_CHANNEL": threads * presses + 1})
+    tv = wide()
+    tv.power()
+    barrier = threading.Barrier(threads + 1)
+
+    def press() -> None:
+        barrier.wait()
+        for _ in range(presses):
+            tv.channel_up()
+
+    workers = [threading.Thread(target=press) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    seconds = time.perf_counter() - start
+    return threads * presses / seconds, threads * presses - tv.getChannel()
+
+def benchmark(counts: tuple = (1, 2, 4, 8, 16), presses: int = 50_000) -> None:
+    """
+    Prints throughput and lost updates for each tv class and thread count. A short switch interval makes the
+    interpreter switch threads often, as a heavily loaded system would.
+    :param counts: The thread counts to try
+    :param presses: Presses per thread
+    """
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    try:
+        for factory in (Television, LockedTelevision, AtomicTelevision):
+            for threads in counts:
+                rate, lost = contend(factory, threads, presses)
+                print(f"{factory.__name__:>17} x{threads:<3}: {rate:12,.0f} presses/s, {lost:,} lost")
+    finally:
+        sys.setswitchinterval(interval)
+
+if __name__ == "__main__":
+    benchmark()
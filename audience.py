@@ -0,0 +1,274 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses the AudienceIndex, an inverted index over many tv objects that answers audience questions such as
+"how many sets are on channel 7 and unmuted?" without scanning the fleet. Every tv is filed under its (powered, muted,
+channel) key in a membership set, and per-channel viewer counters plus fleet-wide powered and muted counters are kept
+alongside. IndexedTelevision is a Television that refreshes its entry after every mutator, so each press costs one
+O(1) index update and each count query is O(1).
+
+Only powered tvs are an audience: a tv that is off counts towards no channel and is not counted as muted.
+
+Running it directly measures the per-press overhead of the index and compares an indexed query with a scan.
+"""
+
+### Import packages ###
+import heapq
+import random
+import timeit
+from collections import defaultdict
+from operator import itemgetter
+from remote import Television
+
+### Class definition ###
+class AudienceIndex:
+    """
+    A class indexing tv objects by power, mute and channel
+
+    Methods
+    -------
+    add(tv) / remove(tv):
+        Starts or stops tracking a tv
+    update(tv):
+        Re-files a tv after its state changed, in O(1)
+    watching(channel, muted):
+        Counts the powered tvs on a channel, optionally only muted or unmuted ones, in O(1)
+    members(channel, muted):
+        Returns those tvs, in O(k)
+    top(n, unmuted):
+        Ranks the n channels with the most viewers, in O(k log n) over the k channels ever watched
+    powered_count() / muted_count():
+        Count the powered tvs, and the powered tvs that are muted, in O(1)
+    """
+
+    ### Constructors ###
+    def __init__(self, tvs=()) -> None:
+        """
+        :param tvs: Tvs to track from the start
+        """
+        self.__keys: dict = {} # tv to its (powered, muted, channel) key
+        # entries are kept once emptied, so a press never allocates or frees one for a channel seen before
+        self.__members: defaultdict = defaultdict(set) # key of a powered tv to the set of tvs filed under it
+        self.__viewers: defaultdict = defaultdict(int) # channel to powered tvs on it
+        self.__unmuted: defaultdict = defaultdict(int) # channel to powered, unmuted tvs on it
+        self.__powered: int = 0
+        self.__muted: int = 0
+        for tv in tvs:
+            self.add(tv)
+
+    ### Mutators ###
+    def add(self, tv) -> None:
+        """
+        Starts tracking a tv in its current state
+        :param tv: Any object with powered(), muted() and getChannel()
+        """
+        if tv not in self.__keys:
+            self.__keys[tv] = (False, False, None)
+            self.update(tv)
+
+    def remove(self, tv) -> None:
+        """
+        Stops tracking a tv
+        :param tv: A tracked tv
+        """
+        self.__file(tv, self.__keys.pop(tv), (False, False, None))
+
+    def update(self, tv) -> None:
+        """
+        Re-files a tracked tv under its current state. Does nothing if the state that is indexed did not change.
+        :param tv: A tracked tv
+        """
+        key = (tv.powered(), tv.muted(), tv.getChannel())
+        keys = self.__keys
+        old = keys[tv]
+        if key != old:
+            keys[tv] = key
+            self.__file(tv, old, key)
+
+    def __file(self, tv, old: tuple, new: tuple) -> None:
+        """
+        Moves a tv from one key to another, adjusting every counter
+        :param tv: The tv
+        :param old: Its previous key
+        :param new: Its new key
+        """
+        if old[0]:
+            self.__members[old].discard(tv)
+            self.__viewers[old[2]] -= 1
+            self.__powered -= 1
+            if old[1]:
+                self.__muted -= 1
+            else:
+                self.__unmuted[old[2]] -= 1
+        if new[0]:
+            self.__members[new].add(tv)
+            self.__viewers[new[2]] += 1
+            self.__powered += 1
+            if new[1]:
+                self.__muted += 1
+            else:
+                self.__unmuted[new[2]] += 1
+
+    ### Accessors ###
+    def watching(self, channel: int, muted: bool = None) -> int:
+        """
+        Counts the powered tvs on a channel
+        :param channel: The channel
+        :param muted: True for muted tvs only, False for unmuted tvs only, None for both
+        :return: the number of tvs
+        """
+        viewers, unmuted = self.__viewers.get(channel, 0), self.__unmuted.get(channel, 0)
+        if muted is None:
+            return viewers
+        return viewers - unmuted if muted else unmuted
+
+    def members(self, channel: int, muted: bool = None) -> set:
+        """
+        Returns the powered tvs on a channel
+        :param channel: The channel
+        :param muted: True for muted tvs only, False for unmuted tvs only, None for both
+        :return: a new set of tvs
+        """
+        empty = set()
+        if muted is None:
+            return self.__members.get((True, False, channel), empty) | self.__members.get((True, True, channel), empty)
+        return set(self.__members.get((True, muted, channel), empty))
+
+    def top(self, n: int, unmuted: bool = False) -> list:
+        """
+        Ranks the channels with the most viewers
+        :param n: The number of channels
+        :param unmuted: Whether to count only unmuted tvs
+        :return: list of (channel, viewers) tuples, most viewers first
+        """
+        counter = self.__unmuted if unmuted else self.__viewers
+        return heapq.nlargest(n, ((channel, count) for channel, count in counter.items() if count), key=itemgetter(1))
+
+    def powered_count(self) -> int:
+        """
+        Counts the powered tvs. Named apart from Television.powered(), which returns one tv's status boolean.
+        :return: the number of powered tvs
+        """
+        return self.__powered
+
+    def muted_count(self) -> int:
+        """
+        Counts the powered tvs that are muted
+        :return: the number of muted tvs, never counting a tv that is off
+        """
+        return self.__muted
+
+    def __len__(self) -> int:
+        """
+        Returns the number of tvs tracked
+        :return: the number of tvs, powered or not
+        """
+        return len(self.__keys)
+
+    def __contains__(self, tv) -> bool:
+        """
+        Returns whether a tv is tracked
+        :param tv: Any tv
+        :return: True if the tv was added and not removed
+        """
+        return tv in self.__keys
+
+class IndexedTelevision(Television):
+    """
+    A Television that keeps its entry in an AudienceIndex current after every mutator
+    """
+
+    def __init__(self, index: AudienceIndex) -> None:
+        """
+        Configures the Television and files it in the index in its initial state
+        :param index: The index to file the tv in
+        """
+        super().__init__()
+        self.index: AudienceIndex = index
+        index.add(self)
+
+    def power(self) -> None:
+        """
+        Toggles the power, then re-files the tv
+        """
+        super().power()
+        self.index.update(self)
+
+    def mute(self) -> None:
+        """
+        Toggles mute, then re-files the tv
+        """
+        super().mute()
+        self.index.update(self)
+
+    def channel_up(self) -> None:
+        """
+        Increases the channel, then re-files the tv
+        """
+        super().channel_up()
+        self.index.update(self)
+
+    def channel_down(self) -> None:
+        """
+        Decreases the channel, then re-files the tv
+        """
+        super().channel_down()
+        self.index.update(self)
+
+    def volume_up(self) -> None:
+        """
+        Increases the volume, then re-files the tv since it may have unmuted
+        """
+        super().volume_up() # may unmute
+        self.index.update(self)
+
+    def volume_down(self) -> None:
+        """
+        Decreases the volume, then re-files the tv since it may have unmuted
+        """
+        super().volume_down()
+        self.index.update(self)
+
+    def set_channel(self, value: int) -> None:
+        """
+        Tunes straight to a channel, then re-files the tv
+        :param value: The channel number
+        """
+        super().set_channel(value)
+        self.index.update(self)
+
+    def apply(self, script: str) -> None:
+        """
+        Applies a batch of presses, then re-files the tv once
+        :param script: The comma-separated batch
+        """
+        super().apply(script)
+        self.index.update(self)
+
+### Benchmark ###
+def benchmark(size: int = 100_000, presses: int = 1_000_000) -> None:
+    """
+    Prints the cost of a press with and without the index, and of a count query indexed and by scanning
+    :param size: The number of tvs
+    :param presses: The number of presses timed
+    """
+    rng = random.Random(0)
+    actions = [rng.choice(("power", "mute", "channel_up", "channel_down", "volume_up")) for _ in range(presses)]
+    index = AudienceIndex()
+    for name, factory in (("Television", Television), ("IndexedTelevision", lambda : IndexedTelevision(index))):
+        tvs = [factory() for _ in range(size)]
+        for tv in tvs:
+            tv.power()
+        calls = [getattr(tvs[rng.randrange(size)], action) for action in actions]
+        seconds = timeit.timeit(lambda : [call() for call in calls], number=1)
+        print(f"{name:>17}: {seconds / presses * 1e9:6.0f} ns per press")
+
+    scan = timeit.timeit(lambda : sum(1 for tv in tvs if tv.powered() and tv.getChannel() == 2 and not tv.muted()), number=5) / 5
+    query = timeit.timeit(lambda : index.watching(2, muted=False), number=100_000) / 100_000
+    ranking = timeit.timeit(lambda : index.top(3), number=10_000) / 10_000
+    print(f"on 2 and unmuted: {index.watching(2, muted=False):,} of {size:,}, "
+          f"scan {scan * 1e3:.1f} ms, index {query * 1e9:.0f} ns, top 3 {ranking * 1e6:.1f} us")
+
+if __name__ == "__main__":
+    benchmark()
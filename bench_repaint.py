@@ -0,0 +1,93 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script counts how often the TVRemote volumeBar is updated and repainted while the volume is swept from 0 to 100,
+once with scripted clicks and once by holding the VOL button down with auto-repeat.
+It runs under the offscreen Qt platform unless QT_QPA_PLATFORM is already set.
+"""
+
+### Import packages ###
+import os
+import time
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtCore import QEvent, QObject, Qt
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication
+from logic import TVRemote
+
+### Class definition ###
+class PaintCounter(QObject):
+    """
+    Event filter counting the paint events a widget receives
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.paints: int = 0
+
+    def eventFilter(self, watched, event) -> bool:
+        if event.type() == QEvent.Type.Paint:
+            self.paints += 1
+        return False
+
+### UDF Declaration ###
+def settle(app: QApplication, ms: int = 50) -> None:
+    """
+    Runs the event loop for ms milliseconds so pending timers and repaints are delivered
+    :param app: The running application
+    :param ms: The time to process events for
+    """
+    deadline = time.perf_counter() + ms / 1000
+    while time.perf_counter() < deadline:
+        app.processEvents()
+
+def sweep(app: QApplication, held: bool) -> dict:
+    """
+    Sweeps a fresh remote's volume from 0 to 100 and counts volumeBar updates and repaints
+    :param app: The running application
+    :param held: True to hold VOL up with auto-repeat, False to click it once per step
+    :return: dictionary of presses, updates, paints and seconds
+    """
+    remote = TVRemote()
+    remote.show()
+    remote.buttonPOWER.click()
+    settle(app)
+
+    counter = PaintCounter()
+    remote.volumeBar.installEventFilter(counter)
+    updates = []
+    remote.volumeBar.valueChanged.connect(updates.append)
+    presses = []
+    remote.buttonVOLUP.clicked.connect(lambda : presses.append(1))
+
+    start = time.perf_counter()
+    if held:
+        QTest.mousePress(remote.buttonVOLUP, Qt.MouseButton.LeftButton)
+        while remote.getVolume() < TVRemote.MAX_VOLUME:
+            app.processEvents()
+        QTest.mouseRelease(remote.buttonVOLUP, Qt.MouseButton.LeftButton)
+    else:
+        for _ in range(TVRemote.MAX_VOLUME):
+            remote.buttonVOLUP.click()
+            app.processEvents()
+    seconds = time.perf_counter() - start
+    settle(app)
+
+    assert remote.volumeBar.value() == TVRemote.MAX_VOLUME
+    remote.close()
+    return {"presses": len(presses), "updates": len(updates), "paints": counter.paints, "seconds": seconds}
+
+## Main Function ##
+def main() -> None:
+    """
+    Runs both sweeps and prints their counts
+    """
+    app = QApplication([])
+    for label, held in (("scripted clicks", False), ("held auto-repeat", True)):
+        result = sweep(app, held)
+        print(f"{label:>16}: {result['presses']:3} presses, {result['updates']:3} volumeBar updates, "
+              f"{result['paints']:3} repaints in {result['seconds'] * 1000:6.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script is the benchmark suite for the remote. It measures:
+    per-operation throughput of every remote.Television and logic.TVRemote method
+    click-to-state latency through the button signals wired up in TVRemote.__init__
+    RemoteGUI.setupGUI() window construction time
+    process cold-start time of the headless and GUI paths
+Qt benchmarks run under the offscreen platform unless QT_QPA_PLATFORM is already set.
+
+Every result is seconds per operation (lower is better). The first run, or a run with --save, writes the results to
+a JSON baseline. Later runs compare against it and exit with status 1 if any benchmark is slower than the baseline by
+more than the tolerance. Baselines are machine specific, so benchmarks.json is not committed.
+
+Usage:
+    python benchmarks.py [--baseline PATH] [--save] [--tolerance 0.5] [--only PREFIX]
+"""
+
+### Import packages ###
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from remote import Television
+
+### Variable Declaration ###
+DEFAULT_BASELINE: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks.json")
+METHODS: tuple = ("power", "mute", "channel_up", "channel_down", "volume_up", "volume_down")
+
+### UDF Declaration ###
+def best_of(statement, number: int, repeat: int = 5) -> float:
+    """
+    Times a callable with timeit and keeps the fastest run, which is the least disturbed by other processes
+    :param statement: A zero-argument callable
+    :param number: Calls per run
+    :param repeat: The number of runs
+    :return: seconds per call
+    """
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number
+
+def bench_television() -> dict:
+    """
+    Per-operation time of every Television method, on a powered-on tv
+    :return: dictionary of benchmark name to seconds per call
+    """
+    tv = Television()
+    tv.power()
+    results = {f"television.{name}": best_of(getattr(tv, name), 20_000) for name in METHODS if name != "power"}
+    results["television.power"] = best_of(tv.power, 20_000)
+    results["television.set_channel"] = best_of(lambda : tv.set_channel(2), 20_000)
+    results["television.__str__"] = best_of(tv.__str__, 20_000)
+    return results
+
+def bench_qt(app) -> dict:
+    """
+    Per-operation time of the TVRemote methods, click-to-state latency through the button signals, and
+    RemoteGUI.setupGUI() construction time
+    :param app: The running QApplication
+    :return: dictionary of benchmark name to seconds per call
+    """
+    from PyQt6.QtWidgets import QMainWindow
+    from gui import RemoteGUI
+    from logic import TVRemote
+
+    remote = TVRemote()
+    remote.show()
+    remote.power()
+    results = {f"tvremote.{name}": best_of(getattr(remote, name), 5_000) for name in METHODS if name != "power"}
+    results["tvremote.power"] = best_of(remote.power, 5_000)
+    results["tvremote.set_channel"] = best_of(lambda : remote.set_channel(2), 5_000)
+    app.processEvents()
+
+    # click() emits pressed/released/clicked synchronously, so the state has changed when it returns
+    buttons = {"power": remote.buttonPOWER, "mute": remote.buttonMUTE, "volume_up": remote.buttonVOLUP,
+               "channel_up": remote.buttonCHUP, "set_channel": remote.button7}
+    for name, button in buttons.items():
+        results[f"click.{name}"] = best_of(button.click, 2_000)
+    app.processEvents()
+    remote.close()
+
+    def construct() -> None:
+        window = QMainWindow()
+        RemoteGUI().setupGUI(window)
+        window.deleteLater()
+    results["gui.setupGUI"] = best_of(construct, 50)
+    results["gui.TVRemote"] = best_of(lambda : TVRemote().deleteLater(), 50)
+    app.processEvents()
+    return results
+
+def bench_startup(runs: int = 5) -> dict:
+    """
+    Median process cold-start time of the headless and GUI paths, measured by main.measure_startup()
+    :param runs: The number of starts per path
+    :return: dictionary of benchmark name to seconds
+    """
+    from main import measure_startup
+    return {f"startup.{name}": seconds for name, seconds in measure_startup(runs).items()}
+
+def run(only: str = "") -> dict:
+    """
+    Runs every benchmark whose name starts with only
+    :param only: A benchmark name prefix, or "" for all
+    :return: dictionary of benchmark name to seconds per operation
+    """
+    def wanted(*groups) -> bool:
+        return any(group.startswith(only) or only.startswith(group) for group in groups)
+
+    results = {}
+    if wanted("television."):
+        results.update(bench_television())
+    if wanted("tvremote.", "click.", "gui."):
+        from PyQt6.QtWidgets import QApplication
+        results.update(bench_qt(QApplication.instance() or QApplication([])))
+    if wanted("startup."):
+        results.update(bench_startup())
+    return {name: seconds for name, seconds in results.items() if name.startswith(only)}
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Finds the benchmarks that regressed against a baseline
+    :param results: This run's results
+    :param baseline: The saved results
+    :param tolerance: Allowed slowdown as a fraction, so 0.5 allows 1.5x the baseline
+    :return: list of (name, baseline seconds, current seconds) for each regression
+    """
+    return [(name, baseline[name], seconds) for name, seconds in results.items()
+            if name in baseline and seconds > baseline[name] * (1 + tolerance)]
+
+def format_time(seconds: float) -> str:
+    """
+    Formats a duration with a readable unit
+    :param seconds: The duration
+    :return: string such as "412.0 ns" or "63.1 ms"
+    """
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:7.1f} {unit}"
+    return f"{seconds / 1e-9:7.1f} ns"
+
+## Main Function ##
+def main(argv: list = None) -> int:
+    """
+    Runs the suite, prints the results against the baseline and saves or checks it
+    :param argv: Command line arguments, defaulting to sys.argv[1:]
+    :return: 1 if any benchmark regressed, 0 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Remote benchmark suite")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON baseline file")
+    parser.add_argument("--save", action="store_true", help="overwrite the baseline with this run")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown, 0.5 = 1.5x baseline")
+    parser.add_argument("--only", default="", help="only run benchmarks whose name starts with this")
+    args = parser.parse_args(argv)
+
+    results = run(args.only)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+
+    for name, seconds in results.items():
+        change = f"{seconds / baseline[name]:6.2f}x" if name in baseline else "   new"
+        print(f"{name:<26} {format_time(seconds)}   {change}")
+
+    if args.save or not baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump({"python": sys.version.split()[0], "machine": platform.machine(), "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+                       "results": {**baseline, **results}}, file, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for name, before, after in regressions:
+        print(f"REGRESSION {name}: {format_time(before).strip()} -> {format_time(after).strip()}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
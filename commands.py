@@ -0,0 +1,105 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses the batched command language used by Television.apply() and TVRemote.apply().
+A batch is a comma-separated list of presses, each optionally repeated with xN:
+
+    POWER, VOL+ x50, CH- x13, 7
+
+parse() turns a batch into (action, count, value) runs, and fold() applies the runs to a tv state in closed form, so a
+run of N presses costs the same as one press and ends in the same state as N individual method calls:
+    power / mute        toggle when N is odd
+    volume_up / down    clamped to MIN/MAX_VOLUME, and unmute like a single press
+    channel_up / down   wrap modulo the channel range, or index arithmetic over a lineup.ChannelLineup
+    set_channel         the last value wins
+"""
+
+### Import packages ###
+from functools import lru_cache
+
+### Variable Declaration ###
+ALIASES: dict = {
+    "power": "power", "mute": "mute",
+    "vol+": "volume_up", "volup": "volume_up", "volume_up": "volume_up",
+    "vol-": "volume_down", "voldown": "volume_down", "volume_down": "volume_down",
+    "ch+": "channel_up", "chup": "channel_up", "channel_up": "channel_up",
+    "ch-": "channel_down", "chdown": "channel_down", "channel_down": "channel_down",
+}
+
+### UDF Declaration ###
+@lru_cache(maxsize=256)
+def parse(script: str) -> tuple:
+    """
+    Parses a batch such as "POWER, VOL+ x50, CH- x13, 7". Names are case-insensitive, a bare number is set_channel,
+    and the repeat count may be written "x50" or "x 50".
+    :param script: The batch
+    :return: tuple of (action, count, value) runs, value being the channel for set_channel and None otherwise
+    """
+    runs = []
+    for press in script.split(","):
+        words = press.lower().split()
+        if not words:
+            continue
+        count = 1
+        if len(words) > 1:
+            repeat = "".join(words[1:])
+            if not (repeat.startswith("x") and repeat[1:].isdigit()):
+                raise ValueError(f"bad repeat count in {press.strip()!r}")
+            count = int(repeat[1:])
+        name = words[0]
+        if name.isdigit():
+            runs.append(("set_channel", count, int(name)))
+        elif name in ALIASES:
+            runs.append((ALIASES[name], count, None))
+        else:
+            raise ValueError(f"unknown command {press.strip()!r}")
+    return tuple(runs)
+
+def fold(state: tuple, runs, limits: tuple, lineup=None) -> tuple:
+    """
+    Applies parsed runs to a tv state, each in constant time (O(log n) for channel runs over a lineup)
+    :param state: tuple of status, muted, stored volume and channel, as in compact.unpack()
+    :param runs: (action, count, value) runs from parse()
+    :param limits: tuple of MIN_VOLUME, MAX_VOLUME, MIN_CHANNEL and MAX_CHANNEL
+    :param lineup: A lineup.ChannelLineup that channel_up/down step through instead of the channel limits
+    :return: the new state tuple
+    """
+    status, muted, volume, channel = state
+    low_volume, high_volume, low_channel, high_channel = limits
+    span = high_channel - low_channel + 1
+    for action, count, value in runs:
+        if action == "power":
+            status ^= count & 1
+        elif not status or not count:
+            continue
+        elif action == "mute":
+            muted ^= count & 1
+        elif action == "volume_up":
+            muted = False
+            volume = max(volume, min(high_volume, volume + count))
+        elif action == "volume_down":
+            muted = False
+            volume = min(volume, max(low_volume, volume - count))
+        elif action == "set_channel":
+            channel = value
+        elif lineup is not None:
+            channel = lineup.step(channel, count if action == "channel_up" else -count)
+        elif action == "channel_up":
+            # a channel outside the range, possible after set_channel, walks back into it before wrapping
+            if channel > high_channel:
+                channel, count = low_channel, count - 1
+            elif channel < low_channel:
+                step = min(count, low_channel - channel)
+                channel, count = channel + step, count - step
+            if channel >= low_channel:
+                channel = low_channel + (channel - low_channel + count) % span
+        else:
+            if channel < low_channel:
+                channel, count = high_channel, count - 1
+            elif channel > high_channel:
+                step = min(count, channel - high_channel)
+                channel, count = channel - step, count - step
+            if channel <= high_channel:
+                channel = low_channel + (channel - low_channel - count) % span
+    return bool(status), bool(muted), volume, channel
@@ -0,0 +1,249 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses CompactTelevision, a memory-lean Television that keeps its whole state in one packed integer
+behind __slots__, along with the pack() and unpack() helpers that define the packed layout.
+Running it directly compares the memory of one million CompactTelevision and Television objects with tracemalloc.
+
+Packed layout (the low 16 bits fit an array('H') slot while the channel stays below 128):
+    bit 0       status
+    bit 1       muted
+    bits 2-8    volume
+    bits 9+     channel
+"""
+
+### Import packages ###
+import gc
+import sys
+import tracemalloc
+from remote import Television
+
+### Variable Declaration ###
+STATUS_BIT: int = 0x1
+MUTED_BIT: int = 0x2
+VOLUME_SHIFT: int = 2
+VOLUME_MASK: int = 0x7F
+CHANNEL_SHIFT: int = 9
+
+# Every 16-bit state as one shared int object. Without this each instance would also own a 28 byte int,
+# since CPython only caches ints up to 256.
+SHARED_STATES: int = 1 << 16
+_SHARED: list = list(range(SHARED_STATES))
+
+### UDF Declaration ###
+def pack(status: bool, muted: bool, volume: int, channel: int) -> int:
+    """
+    Packs the four tv fields into one integer
+    :param status: Whether the tv is powered on
+    :param muted: Whether the tv is muted
+    :param volume: The stored volume, between 0 and VOLUME_MASK
+    :param channel: The channel, 0 or greater
+    :return: the packed state
+    """
+    return (STATUS_BIT if status else 0) | (MUTED_BIT if muted else 0) | (volume << VOLUME_SHIFT) | (channel << CHANNEL_SHIFT)
+
+def unpack(state: int) -> tuple:
+    """
+    Unpacks an integer built by pack()
+    :param state: the packed state
+    :return: tuple of status, muted, volume, channel
+    """
+    return bool(state & STATUS_BIT), bool(state & MUTED_BIT), (state >> VOLUME_SHIFT) & VOLUME_MASK, state >> CHANNEL_SHIFT
+
+def _intern(state: int) -> int:
+    """
+    Swaps a 16-bit state for its shared int object, so storing it costs an instance no int of its own
+    :param state: the packed state
+    :return: the shared int equal to state, or state itself when it is outside the shared range
+    """
+    return _SHARED[state] if 0 <= state < SHARED_STATES else state
+
+### Class definition ###
+class CompactTelevision:
+    """
+    A drop-in stand-in for remote.Television that stores status, muted, volume and channel in a single packed integer.
+    It has no __dict__, so each instance costs one object header and one slot.
+
+    Methods
+    -------
+    Same as remote.Television, plus:
+    state():
+        Returns the packed state integer
+    """
+
+    __slots__ = ("__state",)
+
+    ### Class Variables ###
+    MIN_VOLUME: int = Television.MIN_VOLUME
+    MAX_VOLUME: int = Television.MAX_VOLUME
+    MIN_CHANNEL: int = Television.MIN_CHANNEL
+    MAX_CHANNEL: int = Television.MAX_CHANNEL
+
+    ### Constructors ###
+    def __init__(self, state: int = None) -> None:
+        """
+        Constructs the packed state for the tv object
+        :param state: A packed state to start from, defaulting to the Television default state
+        """
+        if state is None:
+            state = pack(False, False, self.MIN_VOLUME, self.MIN_CHANNEL)
+        self.__state: int = _intern(state)
+
+    ### Mutators ###
+    def power(self) -> None:
+        """
+        Toggles the status bit to turn the tv on and off
+        """
+        state = self.__state ^ STATUS_BIT
+        self.__state = _intern(state)
+
+    def mute(self) -> None:
+        """
+        Toggles the muted bit to mute and unmute the tv.
+        """
+        state = self.__state
+        if state & STATUS_BIT:
+            state ^= MUTED_BIT
+            self.__state = _intern(state)
+
+    def channel_up(self) -> None:
+        """
+        Incraments the channel until the maximum channel value is reached, after which cycles back to the minimum channel value.
+        """
+        state = self.__state
+        if state & STATUS_BIT:
+            channel = state >> CHANNEL_SHIFT
+            channel = channel + 1 if channel < self.MAX_CHANNEL else self.MIN_CHANNEL
+            state = (state & ~(-1 << CHANNEL_SHIFT)) | (channel << CHANNEL_SHIFT)
+            self.__state = _intern(state)
+
+    def channel_down(self) -> None:
+        """
+        Decraments the channel until the minimum channel value is reached, after which it cycles to the maximum channel value
+        """
+        state = self.__state
+        if state & STATUS_BIT:
+            channel = state >> CHANNEL_SHIFT
+            channel = channel - 1 if channel > self.MIN_CHANNEL else self.MAX_CHANNEL
+            state = (state & ~(-1 << CHANNEL_SHIFT)) | (channel << CHANNEL_SHIFT)
+            self.__state = _intern(state)
+
+    def volume_up(self) -> None:
+        """
+        Incraments the volume until the maximum volume value is reached. Automatically unmutes the tv.
+        """
+        state = self.__state
+        if state & STATUS_BIT:
+            state &= ~MUTED_BIT
+            if (state >> VOLUME_SHIFT) & VOLUME_MASK < self.MAX_VOLUME:
+                state += 1 << VOLUME_SHIFT
+            self.__state = _intern(state)
+
+    def volume_down(self) -> None:
+        """
+        Decrements the volume until the minimum volume vaule is reached. Automatically unmutes the tv.
+        """
+        state = self.__state
+        if state & STATUS_BIT:
+            state &= ~MUTED_BIT
+            if (state >> VOLUME_SHIFT) & VOLUME_MASK > self.MIN_VOLUME:
+                state -= 1 << VOLUME_SHIFT
+            self.__state = _intern(state)
+
+    def set_channel(self, value: int) -> None:
+        """
+        Assigns value to the channel when the tv is powered on
+        :param value: The integer value representing a user-inputted channel
+        """
+        state = self.__state
+        if state & STATUS_BIT:
+            state = (state & ~(-1 << CHANNEL_SHIFT)) | (value << CHANNEL_SHIFT)
+            self.__state = _intern(state)
+
+    ### Accessors ###
+    def powered(self) -> bool:
+        """
+        Returns the state of the status bit
+        :return: True if the tv is powered on
+        """
+        return bool(self.__state & STATUS_BIT)
+
+    def muted(self) -> bool:
+        """
+        Returns the state of the muted bit
+        :return: True if the tv is muted
+        """
+        return bool(self.__state & MUTED_BIT)
+
+    def getVolume(self) -> int:
+        """
+        Returns the integer value of volume
+        :return: 0 if the tv is muted or the stored volume otherwise
+        """
+        state = self.__state
+        return 0 if state & MUTED_BIT else (state >> VOLUME_SHIFT) & VOLUME_MASK
+
+    def storedVolume(self) -> int:
+        """
+        Returns the integer value of volume, including while muted, which getVolume() hides
+        :return: the stored volume
+        """
+        return (self.__state >> VOLUME_SHIFT) & VOLUME_MASK
+
+    def getChannel(self) -> int:
+        """
+        Returns the integer value of channel
+        :return: the stored channel
+        """
+        return self.__state >> CHANNEL_SHIFT
+
+    def state(self) -> int:
+        """
+        Returns the packed state, as built by pack()
+        :return: the packed state integer
+        """
+        return self.__state
+
+    def __str__(self) -> str:
+        """
+        Returns a formatted string which calls powered(), muted(), getChannel(), and getVolume() to display the given state of a tv object
+        :return: string of the power status, mute status, channel value, and volume value
+        """
+        return f"Power - {self.powered()}, Mute - {self.muted()}, Channel - {self.getChannel()}, Volume - {self.getVolume()}"
+
+### Benchmark ###
+def measure(factory, count: int) -> int:
+    """
+    Returns the bytes tracemalloc attributes to count objects built by factory, each powered on with its volume and channel raised
+    :param factory: A class with the Television interface
+    :param count: The number of instances
+    :return: traced bytes held by the instances
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tvs = [factory() for _ in range(count)]
+    for tv in tvs:
+        tv.power()
+        tv.volume_up()
+        tv.channel_up()
+    used = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(tvs)
+    tracemalloc.stop()
+    del tvs
+    return used
+
+def benchmark(count: int = 1_000_000) -> dict:
+    """
+    Compares the memory of count Television and CompactTelevision instances and prints a summary
+    :param count: The number of instances of each class
+    :return: dictionary of class name to traced bytes
+    """
+    results = {factory.__name__: measure(factory, count) for factory in (Television, CompactTelevision)}
+    for name, used in results.items():
+        print(f"{name:>18}: {used / 2**20:8.1f} MiB, {used / count:6.1f} bytes per tv")
+    print(f"{'ratio':>18}: {results['Television'] / results['CompactTelevision']:8.1f}x")
+    return results
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,279 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses a dashboard window that shows and controls a whole fleet of tvs at once.
+The fleet lives in a fleet.TelevisionFleet and is exposed through FleetTableModel, so the QTableView only asks for the
+rows that are on screen. Bulk changes emit one dataChanged per run of changed rows rather than one per cell.
+The remote keypad from gui.RemoteGUI sits beside the table and acts on every selected row.
+
+Usage:
+    python dashboard.py [DEVICES]             opens the dashboard, 100000 devices by default
+    python dashboard.py [DEVICES] --benchmark times construction, scrolling and bulk updates offscreen
+"""
+
+### Import packages ###
+import os
+import sys
+import time
+import numpy as np
+from PyQt6.QtCore import QAbstractTableModel, QItemSelectionModel, QModelIndex, Qt
+from PyQt6.QtWidgets import QAbstractItemView, QApplication, QHBoxLayout, QHeaderView, QMainWindow, QTableView, QWidget
+from fleet import TelevisionFleet
+from gui import KEYPAD, RemoteGUI
+from logic import TVRemote
+
+### Variable Declaration ###
+HEADERS: tuple = ("Device", "Power", "Mute", "Volume", "Channel")
+MAX_RANGES: int = 32 # above this many runs of changed rows, a single spanning dataChanged is cheaper
+# The remote's keypad without its keyboard shortcuts, which would take the arrow keys from the table
+DASHBOARD_KEYPAD: tuple = tuple(key._replace(shortcut=None) for key in KEYPAD)
+FLEET_ACTIONS: dict = {"enter_digit": "set_channel"} # keypad actions a fleet names differently
+
+### Class definition ###
+class FleetTableModel(QAbstractTableModel):
+    """
+    A table model over a TelevisionFleet, with one row per tv
+
+    Attributes
+    ----------
+    fleet : TelevisionFleet
+        The fleet the model shows
+
+    Methods
+    -------
+    apply(action, rows, value):
+        Applies a TelevisionFleet action to the given rows and emits batched dataChanged signals
+    """
+
+    ### Constructors ###
+    def __init__(self, fleet: TelevisionFleet, parent=None) -> None:
+        """
+        Constructs the model
+        :param fleet: The fleet to show
+        :param parent: The model's QObject parent
+        """
+        super().__init__(parent)
+        self.fleet: TelevisionFleet = fleet
+        self.__rows: int = len(fleet) # Qt asks for the counts several times per selected row, so keep them cheap
+        self.__columns: int = len(HEADERS)
+
+    ### Model interface ###
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """
+        Returns the number of rows, one per tv
+        :param parent: The parent index, invalid for the top level
+        :return: the fleet size, or 0 under a valid parent since the table is flat
+        """
+        return 0 if parent.isValid() else self.__rows
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """
+        Returns the number of columns, one per header
+        :param parent: The parent index, invalid for the top level
+        :return: the number of headers, or 0 under a valid parent since the table is flat
+        """
+        return 0 if parent.isValid() else self.__columns
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Returns a column title
+        :param section: The column number
+        :param orientation: Only horizontal headers have titles
+        :param role: Only the display role has titles
+        :return: the title string, or None
+        """
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Returns one cell, read from the fleet when Qt asks for it
+        :param index: The cell's row and column
+        :param role: Only the display role has data
+        :return: the tv name, power, mute, volume or channel, or None
+        """
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if column == 0:
+            return f"tv-{row}"
+        powered, muted, volume, channel = self.fleet.state(row)
+        return ("On" if powered else "Off", "Muted" if muted else "", volume, channel)[column - 1]
+
+    ### Mutators ###
+    def apply(self, action: str, rows: np.ndarray, value: int = None) -> None:
+        """
+        Applies a fleet action to the given rows, then emits one dataChanged per run of consecutive rows
+        (or a single spanning one when the rows are scattered)
+        :param action: A TelevisionFleet method name
+        :param rows: Boolean mask over the fleet, or array of row numbers
+        :param value: The channel, for set_channel
+        """
+        if value is None:
+            getattr(self.fleet, action)(rows)
+        else:
+            getattr(self.fleet, action)(value, rows)
+        rows = np.asarray(rows)
+        changed = np.flatnonzero(rows) if rows.dtype == np.bool_ else np.unique(rows)
+        if len(changed) == 0:
+            return
+        breaks = np.flatnonzero(np.diff(changed) > 1)
+        if len(breaks) + 1 > MAX_RANGES:
+            ranges = [(changed[0], changed[-1])]
+        else:
+            ranges = zip(np.concatenate(([changed[0]], changed[breaks + 1])), np.concatenate((changed[breaks], [changed[-1]])))
+        last = len(HEADERS) - 1
+        for top, bottom in ranges:
+            self.dataChanged.emit(self.index(int(top), 1), self.index(int(bottom), last))
+
+class Dashboard(QMainWindow):
+    """
+    A window showing a fleet in a table, with the remote keypad acting on the selected rows
+
+    Attributes
+    ----------
+    model : FleetTableModel
+        The model over the fleet
+    table : QTableView
+        The view of the fleet
+    keypad : RemoteGUI
+        The remote buttons, built by RemoteGUI.setupGUI() into an embedded window
+    """
+
+    ### Constructors ###
+    def __init__(self, fleet: TelevisionFleet) -> None:
+        """
+        Constructs the dashboard window
+        :param fleet: The fleet to show and control
+        """
+        super().__init__()
+        self.setWindowTitle(f"TV Dashboard - {len(fleet):,} devices")
+        self.model = FleetTableModel(fleet, self)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        # fixed row heights let the view map scroll offsets to rows without measuring any
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(22)
+        self.table.verticalHeader().hide()
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        # the header repaints by asking isColumnSelected() per column, which walks every row of a large selection;
+        # a private selection model keeps it out of the table's selection
+        self.table.horizontalHeader().setSelectionModel(QItemSelectionModel(self.model, self.table))
+        self.table.horizontalHeader().setSectionsClickable(False)
+
+        self.__keypadWindow = QMainWindow()
+        self.__keypadWindow.setWindowFlags(Qt.WindowType.Widget)
+        self.keypad = RemoteGUI()
+        self.keypad.setupGUI(self.__keypadWindow, DASHBOARD_KEYPAD)
+
+        central = QWidget()
+        layout = QHBoxLayout(central)
+        layout.addWidget(self.table, stretch=1)
+        layout.addWidget(self.__keypadWindow)
+        self.setCentralWidget(central)
+        self.resize(800, 480)
+
+        ### Buttion actions ###
+        self.keypad.buttonGroup.idClicked.connect(self.__keypadPressed)
+        self.table.selectionModel().currentRowChanged.connect(lambda current, _ : self.__showVolume(current.row()))
+
+    ### Mutators ###
+    def selectedRows(self) -> np.ndarray:
+        """
+        Builds a mask of the selected rows from the selection ranges, without listing every selected index
+        :return: boolean numpy array over the fleet
+        """
+        mask = np.zeros(len(self.model.fleet), dtype=np.bool_)
+        for selected in self.table.selectionModel().selection():
+            mask[selected.top():selected.bottom() + 1] = True
+        return mask
+
+    def press(self, action: str, value: int = None) -> None:
+        """
+        Applies a keypad action to every selected row
+        :param action: A TelevisionFleet method name
+        :param value: The channel, for set_channel
+        """
+        self.model.apply(action, self.selectedRows(), value)
+        self.__showVolume(self.table.currentIndex().row())
+
+    def __keypadPressed(self, id: int) -> None:
+        """
+        Presses the clicked keypad button on the selected rows
+        :param id: The button's id, its index in the keypad layout
+        """
+        key = self.keypad.keys[id]
+        self.press(FLEET_ACTIONS.get(key.action, key.action), key.argument)
+
+    def __showVolume(self, row: int) -> None:
+        """
+        Shows the volume of the current row on the keypad's volumeBar
+        :param row: The current row, or -1 for none
+        """
+        self.keypad.volumeBar.setProperty("value", 0 if row < 0 else self.model.data(self.model.index(row, 3)))
+
+### Benchmark ###
+def benchmark(app: QApplication, size: int) -> dict:
+    """
+    Times dashboard construction, scrolling through the table and a bulk update of every row
+    :param app: The running application
+    :param size: The number of devices
+    :return: dictionary of step name to seconds
+    """
+    results = {}
+    start = time.perf_counter()
+    dashboard = Dashboard(TelevisionFleet(size, model=TVRemote))
+    dashboard.show()
+    app.processEvents()
+    results["construct"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scrollbar = dashboard.table.verticalScrollBar()
+    for step in range(100):
+        scrollbar.setValue(scrollbar.maximum() * step // 99)
+        dashboard.table.viewport().repaint()
+    results["scroll x100"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dashboard.table.selectAll()
+    for action in ("power", "volume_up", "channel_up", "mute"):
+        dashboard.press(action)
+        dashboard.table.viewport().repaint()
+    results["bulk x4"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rows = np.arange(0, size, 7) # scattered rows collapse into one spanning dataChanged
+    dashboard.model.apply("channel_down", rows)
+    dashboard.table.viewport().repaint()
+    results["scattered"] = time.perf_counter() - start
+
+    dashboard.close()
+    return results
+
+## Main Function ##
+def main() -> None:
+    """
+    Opens the dashboard, or times it under the offscreen platform with --benchmark
+    """
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    size = int(args[0]) if args else 100_000
+    if "--benchmark" in sys.argv:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        app = QApplication([])
+        for step, seconds in benchmark(app, size).items():
+            print(f"{step:>12}: {seconds * 1000:8.1f} ms")
+        return
+    app = QApplication([])
+    dashboard = Dashboard(TelevisionFleet(size, model=TVRemote))
+    dashboard.show()
+    dashboard.table.selectionModel().select(dashboard.model.index(0, 0),
+        QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows)
+    app.exec()
+
+if __name__ == "__main__":
+    main()
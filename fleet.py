@@ -0,0 +1,257 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses the TelevisionFleet object, which holds the state of many televisions at once as NumPy arrays.
+Each batch method mirrors the matching method in remote.Television, applied to every selected tv in a single vectorized call.
+"""
+
+### Import packages ###
+import numpy as np
+from remote import Television
+
+### Class definition ###
+class TelevisionFleet:
+    """
+    A class representing a fleet of televisions stored column-wise. Every method behaves exactly like the matching
+    remote.Television method, only applied to each tv picked out by the `where` argument.
+
+    `where` may be None (every tv), a boolean mask of len(fleet), or an array of integer indices.
+    Repeated indices are collapsed, so each selected tv receives the action once per call.
+
+    Attributes
+    ----------
+    status : numpy.ndarray[bool]
+        Determines if each television (tv) is powered on or not
+    muted : numpy.ndarray[bool]
+        Determines if each tv has been muted
+    volume : numpy.ndarray[int16]
+        Represents the volume of each tv
+    channel : numpy.ndarray[int32]
+        Represents the selected channel of each tv
+
+    Methods
+    -------
+    power(where):
+        Toggles the status of the selected tvs
+    mute(where):
+        Toggles the muted state of the selected tvs that are powered on
+    channel_up(where) / channel_down(where):
+        Steps the channel of the selected tvs, cycling around at the channel limits
+    volume_up(where) / volume_down(where):
+        Steps the volume of the selected tvs, unmuting them and clamping at the volume limits
+    set_channel(value, where):
+        Assigns value to the channel of the selected tvs
+    powered() / muted() / getVolume() / getChannel():
+        Return the state of every tv as an array
+    storedVolume():
+        Returns the volume every tv returns to when unmuted
+    from_columns(status, muted, volume, channel):
+        Builds a fleet from existing state arrays
+    state(index: int):
+        Returns the powered, muted, volume and channel of a single tv
+    describe(index: int):
+        Returns the same string Television.__str__() would for a single tv
+    """
+
+    ### Constructors ###
+    def __init__(self, size: int, model: type = Television) -> None:
+        """
+        Constructs the state arrays for the fleet, with every tv in its default (off) state
+        :param size: The number of tvs in the fleet
+        :param model: The class whose MIN/MAX_VOLUME and MIN/MAX_CHANNEL limits the fleet follows
+        """
+        if size < 0:
+            raise ValueError(f"Fleet size must be non-negative, got {size}")
+
+        self.MIN_VOLUME: int = model.MIN_VOLUME
+        self.MAX_VOLUME: int = model.MAX_VOLUME
+        self.MIN_CHANNEL: int = model.MIN_CHANNEL
+        self.MAX_CHANNEL: int = model.MAX_CHANNEL
+
+        self.__status = np.zeros(size, dtype=np.bool_)
+        self.__muted = np.zeros(size, dtype=np.bool_)
+        self.__volume = np.full(size, self.MIN_VOLUME, dtype=np.int16)
+        self.__channel = np.full(size, self.MIN_CHANNEL, dtype=np.int32)
+
+    @classmethod
+    def from_columns(cls, status, muted, volume, channel, model: type = Television) -> "TelevisionFleet":
+        """
+        Builds a fleet holding copies of existing state arrays, such as the columns of a snapshot
+        :param status: Array-like of each tv's power status
+        :param muted: Array-like of each tv's muted state
+        :param volume: Array-like of each tv's stored volume
+        :param channel: Array-like of each tv's channel
+        :param model: The class whose limits the fleet follows
+        :return: the fleet
+        """
+        fleet = cls(0, model)
+        fleet.__status = np.array(status, dtype=np.bool_)
+        fleet.__muted = np.array(muted, dtype=np.bool_)
+        fleet.__volume = np.array(volume, dtype=np.int16)
+        fleet.__channel = np.array(channel, dtype=np.int32)
+        if not len(fleet.__status) == len(fleet.__muted) == len(fleet.__volume) == len(fleet.__channel):
+            raise ValueError("Fleet columns must all have the same length")
+        return fleet
+
+    def __len__(self) -> int:
+        """
+        Returns the number of tvs in the fleet
+        :return: len(self.__status)
+        """
+        return len(self.__status)
+
+    ### Helpers ###
+    def _select(self, where) -> np.ndarray:
+        """
+        Converts a `where` argument into a boolean mask over the whole fleet
+        :param where: None, a boolean mask, or an array of integer indices
+        :return: boolean numpy array of len(self)
+        """
+        if where is None:
+            return np.ones(len(self), dtype=np.bool_)
+        where = np.asarray(where)
+        if where.dtype == np.bool_:
+            if where.shape != self.__status.shape:
+                raise ValueError(f"Boolean mask must have shape {self.__status.shape}, got {where.shape}")
+            return where
+        mask = np.zeros(len(self), dtype=np.bool_)
+        mask[where.astype(np.intp, copy=False)] = True
+        return mask
+
+    def _active(self, where) -> np.ndarray:
+        """
+        Narrows a `where` argument down to the selected tvs that are powered on
+        :param where: None, a boolean mask, or an array of integer indices
+        :return: boolean numpy array of len(self)
+        """
+        if where is None:
+            return self.__status.copy()
+        return self._select(where) & self.__status
+
+    ### Mutators ###
+    def power(self, where=None) -> None:
+        """
+        Toggles the status of every selected tv
+        :param where: None, a boolean mask, or an array of integer indices
+        """
+        np.logical_xor(self.__status, self._select(where), out=self.__status)
+
+    def mute(self, where=None) -> None:
+        """
+        Toggles the muted state of every selected tv that is powered on
+        :param where: None, a boolean mask, or an array of integer indices
+        """
+        np.logical_xor(self.__muted, self._active(where), out=self.__muted)
+
+    def channel_up(self, where=None) -> None:
+        """
+        Incraments the channel of every selected tv that is powered on, cycling back to the minimum channel after the maximum
+        :param where: None, a boolean mask, or an array of integer indices
+        """
+        channel = self.__channel
+        stepped = np.where(channel < self.MAX_CHANNEL, channel + 1, self.MIN_CHANNEL)
+        np.copyto(channel, stepped, where=self._active(where), casting="unsafe")
+
+    def channel_down(self, where=None) -> None:
+        """
+        Decraments the channel of every selected tv that is powered on, cycling to the maximum channel below the minimum
+        :param where: None, a boolean mask, or an array of integer indices
+        """
+        channel = self.__channel
+        stepped = np.where(channel > self.MIN_CHANNEL, channel - 1, self.MAX_CHANNEL)
+        np.copyto(channel, stepped, where=self._active(where), casting="unsafe")
+
+    def volume_up(self, where=None) -> None:
+        """
+        Incraments the volume of every selected tv that is powered on until the maximum volume value is reached.
+        Muted tvs are automatically unmuted.
+        :param where: None, a boolean mask, or an array of integer indices
+        """
+        active = self._active(where)
+        self.__muted &= ~active
+        volume = self.__volume
+        stepped = np.where(volume < self.MAX_VOLUME, volume + 1, volume)
+        np.copyto(volume, stepped, where=active, casting="unsafe")
+
+    def volume_down(self, where=None) -> None:
+        """
+        Decrements the volume of every selected tv that is powered on until the minimum volume value is reached.
+        Muted tvs are automatically unmuted.
+        :param where: None, a boolean mask, or an array of integer indices
+        """
+        active = self._active(where)
+        self.__muted &= ~active
+        volume = self.__volume
+        stepped = np.where(volume > self.MIN_VOLUME, volume - 1, volume)
+        np.copyto(volume, stepped, where=active, casting="unsafe")
+
+    def set_channel(self, value, where=None) -> None:
+        """
+        Assigns value to the channel of every selected tv that is powered on
+        :param value: An integer channel, or an array of len(fleet) holding one channel per tv
+        :param where: None, a boolean mask, or an array of integer indices
+        """
+        np.copyto(self.__channel, value, where=self._active(where), casting="unsafe")
+
+    ### Accessors ###
+    def powered(self) -> np.ndarray:
+        """
+        Returns a read-only view of the status of every tv
+        :return: boolean numpy array
+        """
+        view = self.__status.view()
+        view.flags.writeable = False
+        return view
+
+    def muted(self) -> np.ndarray:
+        """
+        Returns a read-only view of the muted state of every tv
+        :return: boolean numpy array
+        """
+        view = self.__muted.view()
+        view.flags.writeable = False
+        return view
+
+    def getVolume(self) -> np.ndarray:
+        """
+        Returns the volume of every tv
+        :return: integer numpy array, holding 0 for muted tvs
+        """
+        return np.where(self.__muted, 0, self.__volume)
+
+    def storedVolume(self) -> np.ndarray:
+        """
+        Returns a read-only view of the volume of every tv, including muted ones
+        :return: integer numpy array
+        """
+        view = self.__volume.view()
+        view.flags.writeable = False
+        return view
+
+    def getChannel(self) -> np.ndarray:
+        """
+        Returns a read-only view of the channel of every tv
+        :return: integer numpy array
+        """
+        view = self.__channel.view()
+        view.flags.writeable = False
+        return view
+
+    def state(self, index: int) -> tuple:
+        """
+        Returns the state of a single tv as plain Python values
+        :param index: The position of the tv in the fleet
+        :return: tuple of powered, muted, volume (0 while muted) and channel
+        """
+        muted = bool(self.__muted[index])
+        return bool(self.__status[index]), muted, 0 if muted else int(self.__volume[index]), int(self.__channel[index])
+
+    def describe(self, index: int) -> str:
+        """
+        Returns the formatted state of a single tv, matching Television.__str__()
+        :param index: The position of the tv in the fleet
+        :return: string of the power status, mute status, channel value, and volume value
+        """
+        status, muted, volume, channel = self.state(index)
+        return f"Power - {status}, Mute - {muted}, Channel - {channel}, Volume - {volume}"
@@ -0,0 +1,233 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script differentially fuzzes remote.Television against logic.TVRemote, which implement the same buttons
+separately. Random press sequences are generated up front and played into a fresh pair of tvs, one Television given
+TVRemote's limits and one TVRemote under the offscreen Qt platform, comparing powered, muted, volume and channel after
+every press. The first divergence is shrunk by delta debugging to a short press sequence and printed as a reproducer.
+The same pregenerated presses are then replayed into each implementation alone to measure presses per second, so the
+harness doubles as a load test.
+
+set_channel values are drawn from the lineup, as typed channel numbers are. --wild also draws channels outside it,
+where Television counts through the gap while TVRemote jumps to the lineup's neighbour.
+
+Usage:
+    python fuzz.py [--sequences N] [--length N] [--seed N] [--wild] [--limit N] [--load N]
+"""
+
+### Import packages ###
+import argparse
+import os
+import random
+import time
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtCore import QCoreApplication, QEvent
+from PyQt6.QtWidgets import QApplication
+from logic import TVRemote
+from remote import Television
+
+### Variable Declaration ###
+# Methods shared by both implementations, and how often each is pressed
+ACTIONS: tuple = ("power", "mute", "channel_up", "channel_down", "volume_up", "volume_down", "set_channel", "apply")
+WEIGHTS: tuple = (2, 3, 8, 8, 10, 10, 3, 1)
+BATCH_PRESSES: tuple = ("POWER", "MUTE", "VOL+", "VOL-", "CH+", "CH-")
+APPLICATION: QApplication = None
+
+# Television with TVRemote's limits, so the two only differ in their logic
+MatchedTelevision: type = type("MatchedTelevision", (Television,), {
+    "MIN_VOLUME": TVRemote.MIN_VOLUME, "MAX_VOLUME": TVRemote.MAX_VOLUME,
+    "MIN_CHANNEL": TVRemote.MIN_CHANNEL, "MAX_CHANNEL": TVRemote.MAX_CHANNEL})
+
+### UDF Declaration ###
+def application() -> QApplication:
+    """
+    Returns the running QApplication, creating one if needed, as TVRemote is a widget
+    :return: the application
+    """
+    global APPLICATION
+    APPLICATION = QApplication.instance() or QApplication([]) # kept referenced, or it would be collected
+    return APPLICATION
+
+def discard(tv) -> None:
+    """
+    Frees a tv at once. A TVRemote is a window, and thousands of them waiting for the event loop would pile up.
+    :param tv: The tv to free
+    """
+    if isinstance(tv, TVRemote):
+        tv.close()
+        tv.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+def generate(rng: random.Random, count: int, wild: bool = False) -> list:
+    """
+    Generates random presses
+    :param rng: The random source
+    :param count: The number of presses
+    :param wild: Whether set_channel may pick channels outside MIN_CHANNEL to MAX_CHANNEL
+    :return: list of (action, value) tuples, value being the channel, the batch script, or None
+    """
+    low, high = TVRemote.MIN_CHANNEL, TVRemote.MAX_CHANNEL
+    if wild:
+        low, high = low - 5, high + 5
+    presses = []
+    for action in rng.choices(ACTIONS, WEIGHTS, k=count):
+        if action == "set_channel":
+            presses.append((action, rng.randint(low, high)))
+        elif action == "apply":
+            batch = ", ".join(f"{rng.choice(BATCH_PRESSES)} x{rng.randint(1, 30)}" for _ in range(rng.randint(1, 4)))
+            presses.append((action, batch))
+        else:
+            presses.append((action, None))
+    return presses
+
+def observe(tv) -> tuple:
+    """
+    Reads the state both implementations expose
+    :param tv: A Television or TVRemote
+    :return: tuple of powered, muted, volume and channel
+    """
+    return tv.powered(), tv.muted(), tv.getVolume(), tv.getChannel()
+
+def divergence(presses: list, factories: tuple = (MatchedTelevision, TVRemote)):
+    """
+    Plays presses into a fresh tv of each factory, comparing them after every press
+    :param presses: list of (action, value) tuples
+    :param factories: The two classes to compare
+    :return: tuple of the index of the first press after which they differ and both states, or None if they never do
+    """
+    first, second = factories[0](), factories[1]()
+    try:
+        for index, (action, value) in enumerate(presses):
+            for tv in (first, second):
+                if value is None:
+                    getattr(tv, action)()
+                else:
+                    getattr(tv, action)(value)
+            if observe(first) != observe(second):
+                return index, observe(first), observe(second)
+        return None
+    finally:
+        discard(first)
+        discard(second)
+
+def minimize(presses: list, factories: tuple = (MatchedTelevision, TVRemote)) -> list:
+    """
+    Shrinks a diverging press sequence by delta debugging: chunks are removed for as long as the rest still diverges,
+    halving the chunk size whenever no chunk can go, and then pairs of presses are removed
+    :param presses: A press sequence that diverges
+    :param factories: The two classes to compare
+    :return: a shorter sequence that still diverges, which no single press or pair of presses can be removed from
+    """
+    found = divergence(presses, factories)
+    presses = presses[:found[0] + 1]
+    chunk = max(1, len(presses) // 2)
+    while True:
+        start, removed = 0, False
+        while start < len(presses):
+            candidate = presses[:start] + presses[start + chunk:]
+            if candidate and divergence(candidate, factories) is not None:
+                presses, removed = candidate, True
+            else:
+                start += chunk
+        if chunk == 1 and not removed:
+            break
+        chunk = max(1, chunk // 2) if not removed else chunk
+    # toggles such as power only cancel out in pairs, which single removals cannot find
+    first = 0
+    while first < len(presses):
+        for second in range(first + 1, len(presses)):
+            candidate = presses[:first] + presses[first + 1:second] + presses[second + 1:]
+            if candidate and divergence(candidate, factories) is not None:
+                presses = candidate
+                break
+        else:
+            first += 1
+    return presses
+
+def reproducer(presses: list, factories: tuple = (MatchedTelevision, TVRemote)) -> str:
+    """
+    Formats a press sequence as a script that shows the divergence
+    :param presses: list of (action, value) tuples
+    :param factories: The two classes compared
+    :return: the reproducer, one line per press
+    """
+    found = divergence(presses, factories)
+    lines = [f"for tv in ({factories[0].__name__}(), {factories[1].__name__}()):"]
+    for action, value in presses:
+        lines.append(f"    tv.{action}({'' if value is None else repr(value)})")
+    lines.append(f"# {factories[0].__name__}: {found[1]}")
+    lines.append(f"# {factories[1].__name__}: {found[2]}")
+    return "\n".join(lines)
+
+def fuzz(sequences: int, length: int, seed: int = 0, wild: bool = False, limit: int = 3) -> tuple:
+    """
+    Runs random sequences through both implementations
+    :param sequences: The number of sequences, each on a fresh pair of tvs
+    :param length: Presses per sequence
+    :param seed: The random seed
+    :param wild: Whether set_channel may pick channels outside the channel range
+    :param limit: The most diverging sequences to minimize, as shrinking costs far more than finding
+    :return: tuple of the number of diverging sequences and a list of distinct minimized ones
+    """
+    application()
+    rng = random.Random(seed)
+    diverged, found = 0, []
+    for _ in range(sequences):
+        presses = generate(rng, length, wild)
+        if divergence(presses) is not None:
+            diverged += 1
+            if len(found) < limit:
+                smallest = minimize(presses)
+                if smallest not in found:
+                    found.append(smallest)
+    return diverged, found
+
+def throughput(factory: type, presses: list) -> float:
+    """
+    Plays presses into one tv, as fast as it takes them
+    :param factory: The class to load
+    :param presses: list of (action, value) tuples
+    :return: presses per second
+    """
+    tv = factory()
+    calls = [(getattr(tv, action), value) for action, value in presses]
+    start = time.perf_counter()
+    for method, value in calls:
+        if value is None:
+            method()
+        else:
+            method(value)
+    seconds = time.perf_counter() - start
+    discard(tv)
+    return len(calls) / seconds
+
+## Main Function ##
+def main() -> None:
+    """
+    Fuzzes both implementations, prints every minimized divergence, then load-tests each one
+    """
+    parser = argparse.ArgumentParser(description="Differential fuzzing of Television against TVRemote")
+    parser.add_argument("--sequences", type=int, default=2_000, help="random sequences to compare")
+    parser.add_argument("--length", type=int, default=200, help="presses per sequence")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--wild", action="store_true", help="also set channels outside the channel range")
+    parser.add_argument("--limit", type=int, default=3, help="most divergences to minimize")
+    parser.add_argument("--load", type=int, default=1_000_000, help="presses per load test")
+    args = parser.parse_args()
+
+    application()
+    start = time.perf_counter()
+    diverged, found = fuzz(args.sequences, args.length, args.seed, args.wild, args.limit)
+    seconds = time.perf_counter() - start
+    print(f"compared {args.sequences * args.length:,} presses in {seconds:.1f}s: "
+          f"{diverged} of {args.sequences} sequences diverged")
+    for presses in found:
+        print(reproducer(presses), end="\n\n")
+
+    presses = generate(random.Random(args.seed), args.load, args.wild)
+    for factory in (MatchedTelevision, TVRemote):
+        print(f"{factory.__name__:>17}: {throughput(factory, presses):12,.0f} presses/s")
+
+if __name__ == "__main__":
+    main()
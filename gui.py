@@ -10,10 +10,71 @@ The GUI provides features for the following actions:
     Incramenting and decramenting the TV channel
     Incramenting and decramenting the TV volume
     0-9 keypad to allow disctrete channel selection
+
+The buttons are declared in KEYPAD, one Key per button: its attribute name, label, geometry, the TVRemote method it
+triggers with an optional argument, a keyboard shortcut, and whether it repeats while held. A layout is compiled once
+into Qt geometry and key sequences and cached, and every button joins one QButtonGroup, so the window dispatches all
+clicks through a single slot by looking the button's id up in the compiled layout. Extra buttons, such as favourite
+channels or batches, are more Keys, either in code or from a JSON file read by load_layout().
 """
 ### Import packages ###
+import json
+from collections import namedtuple
+from functools import lru_cache
 from PyQt6 import QtCore, QtGui, QtWidgets
 
+### Variable Declaration ###
+# One keypad button. action is a TVRemote method name, called with argument unless it is None.
+Key = namedtuple("Key", ("name", "label", "geometry", "action", "argument", "shortcut", "repeat"),
+                 defaults=(None, None, False))
+
+WINDOW_SIZE: tuple = (303, 455)
+VOLUME_BAR: tuple = (60, 80, 171, 23)
+KEYPAD: tuple = (
+    # State buttons
+    Key("buttonPOWER", "I/O", (30, 30, 31, 25), "power", shortcut="P"),
+    Key("buttonMUTE", "MUTE", (230, 30, 41, 25), "mute", shortcut="M"),
+    # Directional buttons
+    Key("buttonCHUP", "CH", (130, 130, 31, 25), "channel_up", shortcut="Up", repeat=True),
+    Key("buttonCHDWN", "CH", (130, 190, 31, 25), "channel_down", shortcut="Down", repeat=True),
+    Key("buttonVOLUP", "VOL", (170, 160, 31, 25), "volume_up", shortcut="Right", repeat=True),
+    Key("buttonVOLDWN", "VOL", (90, 160, 31, 25), "volume_down", shortcut="Left", repeat=True),
+    # Channel buttons, 1-9 in a 3x3 grid and 0 centred below
+    *(Key(f"button{digit}", str(digit), (90 + 40 * ((digit - 1) % 3), 240 + 40 * ((digit - 1) // 3), 31, 25),
+          "enter_digit", digit, str(digit)) for digit in range(1, 10)),
+    Key("button0", "0", (130, 360, 31, 25), "enter_digit", 0, "0"),
+)
+
+### UDF Declaration ###
+@lru_cache(maxsize=8)
+def compile_layout(layout: tuple) -> tuple:
+    """
+    Converts a layout into the Qt values setupGUI() applies, once per distinct layout
+    :param layout: tuple of Keys
+    :return: tuple of (Key, QRect, QKeySequence or None) in button id order
+    """
+    compiled = []
+    names = set()
+    for key in layout:
+        if key.name in names:
+            raise ValueError(f"Duplicate keypad button {key.name!r}")
+        names.add(key.name)
+        shortcut = QtGui.QKeySequence(key.shortcut) if key.shortcut else None
+        compiled.append((key, QtCore.QRect(*key.geometry), shortcut))
+    return tuple(compiled)
+
+def load_layout(path: str, base: tuple = KEYPAD) -> tuple:
+    """
+    Reads extra buttons from a JSON list of objects with the Key fields, such as
+    {"name": "buttonFAV1", "label": "NEWS", "geometry": [230, 400, 41, 25], "action": "set_channel", "argument": 7}
+    :param path: The JSON file
+    :param base: The layout the buttons are added to
+    :return: the combined layout
+    """
+    with open(path, encoding="utf-8") as file:
+        buttons = json.load(file)
+    return base + tuple(Key(**{**button, "geometry": tuple(button["geometry"])}) for button in buttons)
+
 ### Class definition ###
 class RemoteGUI(object):
     """
@@ -22,112 +83,45 @@ class RemoteGUI(object):
     ----------
     centralwidget : QWidget
         widget object that will possess all other widgets for this GUI
-    buttonPOWER : QPushButton
-        calls the TVRemote.power() method
-    buttonMUTE : QPushButton
-        calls the TVRemote.mute() method
-    buttonCHUP : QPushButton
-        calls the TVRemote.channel_up() method
-    buttonCHDWN : QPushButton
-        calls the TVRemote.channel_down() method
-    buttonVOLUP : QPushButton
-        calls the TVRemote.volume_up() method
-    buttonVOLDWN : QPushButton
-        calls the TVRemote.volume_down() method
-    button0 : QPushButton
-        calls the TVRemote.set_channel(0) method
-    button1 : QPushButton
-        calls the TVRemote.set_channel(1) method
-    button2 : QPushButton
-        calls the TVRemote.set_channel(2) method
-    button3 : QPushButton
-        calls the TVRemote.set_channel(3) method
-    button4 : QPushButton
-        calls the TVRemote.set_channel(4) method
-    button5 : QPushButton
-        calls the TVRemote.set_channel(5) method
-    button6 : QPushButton
-        calls the TVRemote.set_channel(6) method
-    button7 : QPushButton
-        calls the TVRemote.set_channel(7) method
-    button8 : QPushButton
-        calls the TVRemote.set_channel(8) method
-    button9 : QPushButton
-        calls the TVRemote.set_channel(9) method
+    buttonPOWER, buttonMUTE, buttonCHUP, buttonCHDWN, buttonVOLUP, buttonVOLDWN, button0 ... button9 : QPushButton
+        one attribute per Key in the layout, named by Key.name
+    buttonGroup : QButtonGroup
+        every keypad button, with its index in the layout as its id
+    keys : tuple
+        the layout's Keys, indexed by button id
     volumeBar : QProgressBar
         displays the volume value in percentage by calling TVRemote.getVolume()    
     
     Methods
     -------
-    setupGUI(window: QWidget):
+    setupGUI(window: QWidget, layout: tuple):
         Generates widgets and window default state
     """
-    def setupGUI(self, window) -> None:
+    def setupGUI(self, window, layout: tuple = KEYPAD) -> None:
         ### Window presets ###
         window.setWindowTitle("TV Remote")
-        window.setFixedSize(303, 455)
+        window.setFixedSize(*WINDOW_SIZE)
         self.centralwidget = QtWidgets.QWidget(parent=window)
 
         ### Generating Widgets ###
         # Volume bar
         self.volumeBar = QtWidgets.QProgressBar(parent=self.centralwidget)
-        self.volumeBar.setGeometry(QtCore.QRect(60, 80, 171, 23))
+        self.volumeBar.setGeometry(*VOLUME_BAR)
         self.volumeBar.setProperty("value", 0)
-        
-        # Channel Buttons
-        # Button 1
-        self.button1 = QtWidgets.QPushButton("1", parent=self.centralwidget)
-        self.button1.setGeometry(QtCore.QRect(90, 240, 31, 25))
-        # Button 2
-        self.button2 = QtWidgets.QPushButton("2", parent=self.centralwidget)
-        self.button2.setGeometry(QtCore.QRect(130, 240, 31, 25))
-        # Button 3
-        self.button3 = QtWidgets.QPushButton("3", parent=self.centralwidget)
-        self.button3.setGeometry(QtCore.QRect(170, 240, 31, 25))
-        # Button 4
-        self.button4 = QtWidgets.QPushButton("4", parent=self.centralwidget)
-        self.button4.setGeometry(QtCore.QRect(90, 280, 31, 25))
-        # Button 5
-        self.button5 = QtWidgets.QPushButton("5", parent=self.centralwidget)
-        self.button5.setGeometry(QtCore.QRect(130, 280, 31, 25))
-        # Button 6
-        self.button6 = QtWidgets.QPushButton("6", parent=self.centralwidget)
-        self.button6.setGeometry(QtCore.QRect(170, 280, 31, 25))
-        # Button 7
-        self.button7 = QtWidgets.QPushButton("7", parent=self.centralwidget)
-        self.button7.setGeometry(QtCore.QRect(90, 320, 31, 25))
-        # Button 8
-        self.button8 = QtWidgets.QPushButton("8", parent=self.centralwidget)
-        self.button8.setGeometry(QtCore.QRect(130, 320, 31, 25))
-        # Button 9
-        self.button9 = QtWidgets.QPushButton("9", parent=self.centralwidget)
-        self.button9.setGeometry(QtCore.QRect(170, 320, 31, 25))
-        # Button 0
-        self.button0 = QtWidgets.QPushButton("0", parent=self.centralwidget)
-        self.button0.setGeometry(QtCore.QRect(130, 360, 31, 25))
-        
-        # Directional buttons
-        # Channel UP
-        self.buttonCHUP = QtWidgets.QPushButton("CH", parent=self.centralwidget)
-        self.buttonCHUP.setGeometry(QtCore.QRect(130, 130, 31, 25))
-        # Channel DOWN
-        self.buttonCHDWN = QtWidgets.QPushButton("CH", parent=self.centralwidget)
-        self.buttonCHDWN.setGeometry(QtCore.QRect(130, 190, 31, 25))
-        # Volume UP
-        self.buttonVOLUP = QtWidgets.QPushButton("VOL", parent=self.centralwidget)
-        self.buttonVOLUP.setGeometry(QtCore.QRect(170, 160, 31, 25))
-        # Volume DOWN
-        self.buttonVOLDWN = QtWidgets.QPushButton("VOL", parent=self.centralwidget)
-        self.buttonVOLDWN.setGeometry(QtCore.QRect(90, 160, 31, 25))
 
-        # State buttons
-        # Power button
-        self.buttonPOWER = QtWidgets.QPushButton("I/O", parent=self.centralwidget)
-        self.buttonPOWER.setGeometry(QtCore.QRect(30, 30, 31, 25))
-        # Mute Button
-        self.buttonMUTE = QtWidgets.QPushButton("MUTE", parent=self.centralwidget)
-        self.buttonMUTE.setGeometry(QtCore.QRect(230, 30, 41, 25))
+        # Keypad
+        self.buttonGroup = QtWidgets.QButtonGroup(window)
+        self.buttonGroup.setExclusive(False)
+        compiled = compile_layout(layout)
+        self.keys = tuple(key for key, _, _ in compiled)
+        for index, (key, geometry, shortcut) in enumerate(compiled):
+            button = QtWidgets.QPushButton(key.label, parent=self.centralwidget)
+            button.setGeometry(geometry)
+            if shortcut is not None:
+                button.setShortcut(shortcut)
+            button.setAutoRepeat(key.repeat)
+            self.buttonGroup.addButton(button, index)
+            setattr(self, key.name, button)
 
         ### Assemble our window ###
         window.setCentralWidget(self.centralwidget) # assigning the Window's central widget GUI.centralwidget
-        QtCore.QMetaObject.connectSlotsByName(window) # Compiling window metaobject
\ No newline at end of file
@@ -0,0 +1,316 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses the program guide. XMLTV files are parsed incrementally with iterparse, clearing every element once
+it is read, into a columnar index file sorted by channel number and start time. ProgramGuide memory-maps that index,
+so finding what is on a channel at a given time is two binary searches over mapped columns, and opening a guide only
+rebuilds the index when the XMLTV file has changed since the index was written.
+
+Index layout (little-endian), written next to the XMLTV file as FILE.idx:
+    INDEX_HEADER   magic, version, source size, source mtime_ns, programme count, title bytes
+    channel        int32[count]    sorted ascending
+    start, stop    int64[count]    unix seconds, start sorted ascending within each channel
+    title offsets  uint32[count + 1] into the title bytes
+    title bytes    utf-8
+
+XMLTV channels are numbered from their <lcn> element, else a numeric <display-name>, else the leading digits of their
+id. Programmes on channels without a number are skipped.
+
+Usage:
+    python guide.py XMLTV [CHANNEL]             builds or reuses the index, and prints what is on now
+    python guide.py --synthesize XMLTV COUNT    writes a random XMLTV file for benchmarking
+"""
+
+### Import packages ###
+import argparse
+import calendar
+import mmap
+import os
+import random
+import struct
+import time
+import xml.etree.ElementTree as ElementTree
+from array import array
+from functools import lru_cache
+import numpy as np
+
+### Variable Declaration ###
+MAGIC: bytes = b"TVGD"
+VERSION: int = 1
+INDEX_HEADER: struct.Struct = struct.Struct("<4sHxxQqQQ")
+COLUMNS: tuple = (("channel", np.int32), ("start", np.int64), ("stop", np.int64))
+
+### UDF Declaration ###
+@lru_cache(maxsize=1 << 16) # one programme's stop is usually the next one's start, and channels share slot times
+def parse_time(text: str) -> int:
+    """
+    Parses an XMLTV timestamp such as "20261018203000 +0200"
+    :param text: The timestamp, with an optional UTC offset
+    :return: unix seconds
+    """
+    text = text.strip()
+    digits = text[:14].ljust(14, "0")
+    seconds = calendar.timegm((int(digits[:4]), int(digits[4:6]), int(digits[6:8]), int(digits[8:10]),
+                               int(digits[10:12]), int(digits[12:14]), 0, 0, 0))
+    offset = text[14:].strip()
+    if offset:
+        sign = -1 if offset[0] == "-" else 1
+        seconds -= sign * (int(offset[1:3]) * 3600 + int(offset[3:5]) * 60)
+    return seconds
+
+def channel_number(element) -> int:
+    """
+    Finds the channel number of an XMLTV <channel> element
+    :param element: The <channel> element
+    :return: the number, or None if the channel has none
+    """
+    lcn = element.findtext("lcn")
+    if lcn and lcn.strip().isdigit():
+        return int(lcn)
+    for name in element.iterfind("display-name"):
+        if name.text and name.text.strip().isdigit():
+            return int(name.text)
+    digits = ""
+    for character in element.get("id", ""):
+        if not character.isdigit():
+            break
+        digits += character
+    return int(digits) if digits else None
+
+def build_index(source: str, index: str) -> int:
+    """
+    Streams an XMLTV file into an index file. Memory use grows with the number of programmes kept, not the file size.
+    :param source: The XMLTV file
+    :param index: The index file to write, replaced atomically
+    :return: the number of programmes indexed
+    """
+    numbers = {} # channel id to number
+    ids, starts, stops, offsets = array("l"), array("q"), array("q"), array("L", [0])
+    titles = bytearray()
+    id_slots = {} # channel id to a small integer, so programmes store an int until channel numbers are known
+    root = None
+    for event, element in ElementTree.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            continue
+        if element.tag == "programme":
+            channel = element.get("channel", "")
+            ids.append(id_slots.setdefault(channel, len(id_slots)))
+            starts.append(parse_time(element.get("start")))
+            stops.append(parse_time(element.get("stop") or element.get("start")))
+            titles += (element.findtext("title") or "").encode("utf-8")
+            offsets.append(len(titles))
+        elif element.tag == "channel":
+            number = channel_number(element)
+            if number is not None:
+                numbers[element.get("id")] = number
+        else:
+            continue
+        root.clear() # drop the finished element, and everything before it, from the tree
+
+    # resolve channel ids to numbers, drop unnumbered channels, and sort by channel then start
+    slot_numbers = np.full(len(id_slots), -1, dtype=np.int64)
+    for channel, slot in id_slots.items():
+        slot_numbers[slot] = numbers.get(channel, -1)
+    channel = slot_numbers[np.frombuffer(ids, dtype=np.int32 if ids.itemsize == 4 else np.int64)]
+    start = np.frombuffer(starts, dtype=np.int64)
+    stop = np.frombuffer(stops, dtype=np.int64)
+    keep = np.flatnonzero(channel >= 0)
+    order = keep[np.lexsort((start[keep], channel[keep]))]
+
+    bounds = np.frombuffer(offsets, dtype=np.uint32 if offsets.itemsize == 4 else np.uint64)
+    lengths = (bounds[1:] - bounds[:-1])[order]
+    new_offsets = np.zeros(len(order) + 1, dtype=np.uint32)
+    np.cumsum(lengths, out=new_offsets[1:])
+    blob = bytearray(int(new_offsets[-1]))
+    view = memoryview(titles)
+    for position, (begin, end) in enumerate(zip(bounds[order].tolist(), bounds[order + 1].tolist())):
+        blob[new_offsets[position]:new_offsets[position + 1]] = view[begin:end]
+
+    status = os.stat(source)
+    with open(f"{index}.tmp", "wb") as file:
+        file.write(INDEX_HEADER.pack(MAGIC, VERSION, status.st_size, status.st_mtime_ns, len(order), len(blob)))
+        file.write(channel[order].astype(np.int32).tobytes())
+        file.write(start[order].tobytes())
+        file.write(stop[order].tobytes())
+        file.write(new_offsets.tobytes())
+        file.write(blob)
+    os.replace(f"{index}.tmp", index)
+    return len(order)
+
+def synthesize(path: str, count: int, channels: int = 500, seed: int = 0) -> None:
+    """
+    Writes a random XMLTV file, for benchmarking
+    :param path: The file to write
+    :param count: The number of programmes
+    :param channels: The number of channels, numbered sparsely
+    :param seed: The random seed
+    """
+    rng = random.Random(seed)
+    numbers = sorted(rng.sample(range(1, 10 * channels), channels))
+    per_channel = max(1, count // channels)
+    begin = calendar.timegm(time.gmtime()[:3] + (0, 0, 0, 0, 0, 0)) - 86400
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('<?xml version="1.0" encoding="UTF-8"?>\n<tv>\n')
+        for number in numbers:
+            file.write(f'  <channel id="ch{number}.example"><display-name>Channel {number}</display-name>'
+                       f'<display-name>{number}</display-name></channel>\n')
+        for number in numbers:
+            start = begin
+            for show in range(per_channel):
+                stop = start + rng.choice((1800, 3600, 5400))
+                file.write(f'  <programme start="{time.strftime("%Y%m%d%H%M%S", time.gmtime(start))} +0000" '
+                           f'stop="{time.strftime("%Y%m%d%H%M%S", time.gmtime(stop))} +0000" channel="ch{number}.example">'
+                           f'<title>Show {number}-{show}</title><desc>Episode {show} of a synthetic programme.</desc></programme>\n')
+                start = stop
+        file.write("</tv>\n")
+
+### Class definition ###
+class ProgramGuide:
+    """
+    A class giving read access to a memory-mapped guide index
+
+    Attributes
+    ----------
+    source : str
+        The XMLTV file
+    index : str
+        The index file
+    rebuilt : bool
+        Whether opening the guide had to rebuild the index
+
+    Methods
+    -------
+    now(channel, when):
+        Returns the programme on a channel at a time
+    schedule(channel):
+        Returns every programme on a channel
+    close():
+        Unmaps the index
+    """
+
+    ### Constructors ###
+    def __init__(self, source: str, index: str = None) -> None:
+        """
+        Opens the guide for an XMLTV file, building its index first if it is missing or older than the file
+        :param source: The XMLTV file
+        :param index: The index file, defaulting to source + ".idx"
+        """
+        self.source: str = source
+        self.index: str = index or f"{source}.idx"
+        self.rebuilt: bool = not self.fresh()
+        if self.rebuilt:
+            build_index(self.source, self.index)
+
+        with open(self.index, "rb") as file:
+            self.__mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        _, _, _, _, count, _ = INDEX_HEADER.unpack_from(self.__mapped)
+        offset = INDEX_HEADER.size
+        columns = []
+        for _, dtype in COLUMNS:
+            columns.append(np.frombuffer(self.__mapped, dtype=dtype, count=count, offset=offset))
+            offset += count * np.dtype(dtype).itemsize
+        self.__channel, self.__start, self.__stop = columns
+        self.__offsets = np.frombuffer(self.__mapped, dtype=np.uint32, count=count + 1, offset=offset)
+        self.__titles: int = offset + (count + 1) * 4
+
+    def fresh(self) -> bool:
+        """
+        Returns whether the index exists and was built from the current XMLTV file
+        :return: True if the index matches the source file's size and modification time
+        """
+        try:
+            with open(self.index, "rb") as file:
+                header = file.read(INDEX_HEADER.size)
+            status = os.stat(self.source)
+        except OSError:
+            return False
+        if len(header) != INDEX_HEADER.size:
+            return False
+        magic, version, size, mtime, _, _ = INDEX_HEADER.unpack(header)
+        return magic == MAGIC and version == VERSION and size == status.st_size and mtime == status.st_mtime_ns
+
+    def close(self) -> None:
+        """
+        Unmaps the index
+        """
+        self.__channel = self.__start = self.__stop = self.__offsets = None
+        self.__mapped.close()
+
+    def __enter__(self) -> "ProgramGuide":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    ### Accessors ###
+    def __len__(self) -> int:
+        return len(self.__channel)
+
+    def __programme(self, row: int) -> tuple:
+        begin, end = int(self.__offsets[row]), int(self.__offsets[row + 1])
+        title = self.__mapped[self.__titles + begin:self.__titles + end].decode("utf-8")
+        return title, int(self.__start[row]), int(self.__stop[row])
+
+    def __rows(self, channel: int) -> tuple:
+        """
+        Returns the rows of a channel's programmes
+        :return: tuple of the first row and one past the last
+        """
+        key = np.int32(channel) # a key of another dtype would make searchsorted convert the whole column
+        return (int(np.searchsorted(self.__channel, key, side="left")),
+                int(np.searchsorted(self.__channel, key, side="right")))
+
+    def now(self, channel: int, when: float = None) -> tuple:
+        """
+        Returns the programme on a channel at a time, in O(log n)
+        :param channel: The channel number
+        :param when: Unix seconds, defaulting to now
+        :return: tuple of title, start and stop, or None if nothing is on
+        """
+        when = time.time() if when is None else when
+        first, last = self.__rows(channel)
+        row = first + int(np.searchsorted(self.__start[first:last], np.int64(when // 1), side="right")) - 1
+        if row < first or self.__stop[row] <= when:
+            return None
+        return self.__programme(row)
+
+    def schedule(self, channel: int) -> list:
+        """
+        Returns every programme on a channel
+        :param channel: The channel number
+        :return: list of (title, start, stop) tuples in start order
+        """
+        first, last = self.__rows(channel)
+        return [self.__programme(row) for row in range(first, last)]
+
+## Main Function ##
+def main() -> None:
+    """
+    Opens a guide and prints what is on now, or writes a synthetic XMLTV file with --synthesize
+    """
+    parser = argparse.ArgumentParser(description="XMLTV program guide")
+    parser.add_argument("xmltv", help="XMLTV file")
+    parser.add_argument("number", nargs="?", type=int, help="channel to look up, or programmes to write with --synthesize")
+    parser.add_argument("--synthesize", action="store_true", help="write a random XMLTV file")
+    args = parser.parse_args()
+
+    if args.synthesize:
+        synthesize(args.xmltv, args.number or 1_000_000)
+        return
+    start = time.perf_counter()
+    with ProgramGuide(args.xmltv) as guide:
+        opened = time.perf_counter() - start
+        print(f"{'built' if guide.rebuilt else 'opened'} index of {len(guide):,} programmes in {opened:.3f}s")
+        if args.number is None:
+            return
+        rounds = 10_000
+        start = time.perf_counter()
+        for _ in range(rounds):
+            playing = guide.now(args.number)
+        print(f"now on {args.number}: {playing} ({(time.perf_counter() - start) / rounds * 1e6:.1f} us per lookup)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses StateHistory, the bounded undo/redo history behind TVRemote. Each change is stored as the XOR of
+the packed states (compact.pack) before and after it, in a fixed-size ring buffer of 64-bit integers, so undo and redo
+are one XOR each and a kiosk left running for millions of presses never holds more than `capacity` entries.
+When the buffer is full, the oldest change is forgotten.
+"""
+
+### Import packages ###
+from array import array
+
+### Class definition ###
+class StateHistory:
+    """
+    A class holding the most recent packed state changes in a ring buffer
+
+    Attributes
+    ----------
+    capacity : int
+        The most changes kept
+
+    Methods
+    -------
+    record(before, after):
+        Stores a change and forgets anything that could have been redone
+    undo(state) / redo(state):
+        Return the state before the last change / after the next undone change, or None if there is none
+    canUndo() / canRedo():
+        Return whether undo() / redo() would succeed
+    clear():
+        Forgets every change
+    """
+
+    ### Constructors ###
+    def __init__(self, capacity: int = 1024) -> None:
+        """
+        Allocates the ring buffer
+        :param capacity: The most changes kept, at 8 bytes each
+        """
+        if capacity < 1:
+            raise ValueError(f"History capacity must be positive, got {capacity}")
+        self.capacity: int = capacity
+        self.__deltas: array = array("q", bytes(8 * capacity))
+        self.__head: int = 0 # slot the next change is written to
+        self.__undoable: int = 0 # changes in the slots before head
+        self.__redoable: int = 0 # undone changes from head onwards
+
+    ### Mutators ###
+    def record(self, before: int, after: int) -> None:
+        """
+        Stores a change, overwriting the oldest one when the buffer is full. Changes that leave the state as it was
+        are not stored.
+        :param before: The packed state before the change
+        :param after: The packed state after the change
+        """
+        if before == after:
+            return
+        self.__deltas[self.__head] = before ^ after
+        self.__head = (self.__head + 1) % self.capacity
+        self.__undoable = min(self.__undoable + 1, self.capacity)
+        self.__redoable = 0
+
+    def undo(self, state: int):
+        """
+        Steps back over the last change
+        :param state: The current packed state, which must be the state after the last change
+        :return: the packed state before it, or None if there is nothing to undo
+        """
+        if not self.__undoable:
+            return None
+        self.__head = (self.__head - 1) % self.capacity
+        self.__undoable -= 1
+        self.__redoable += 1
+        return state ^ self.__deltas[self.__head]
+
+    def redo(self, state: int):
+        """
+        Steps forward over the last undone change
+        :param state: The current packed state
+        :return: the packed state after the change, or None if there is nothing to redo
+        """
+        if not self.__redoable:
+            return None
+        delta = self.__deltas[self.__head]
+        self.__head = (self.__head + 1) % self.capacity
+        self.__redoable -= 1
+        self.__undoable += 1
+        return state ^ delta
+
+    def clear(self) -> None:
+        """
+        Forgets every change
+        """
+        self.__undoable = self.__redoable = 0
+
+    ### Accessors ###
+    def canUndo(self) -> bool:
+        """
+        Returns whether there is a change to undo
+        :return: True if undo() would return a state
+        """
+        return self.__undoable > 0
+
+    def canRedo(self) -> bool:
+        """
+        Returns whether there is an undone change to redo
+        :return: True if redo() would return a state
+        """
+        return self.__redoable > 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of changes that can be undone
+        :return: the undo depth
+        """
+        return self.__undoable
@@ -0,0 +1,301 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses the instrumentation layer for the remote actions. instrument() wraps the power, mute, volume_*,
+channel_* and set_channel methods of a TVRemote or Television instance so each call is counted and its latency
+recorded in an HDR-style log-linear histogram. Metrics are read in-process through Metrics.snapshot() or pushed to
+pluggable exporters such as PrometheusFileExporter.
+
+Instrumentation is opt-in: an uninstrumented object runs its methods untouched, so disabled metrics cost nothing.
+TVRemote instruments itself with the shared METRICS registry when the TVREMOTE_METRICS environment variable is set,
+and main.py writes METRICS in Prometheus text format to the file it names when the GUI exits.
+"""
+
+### Import packages ###
+import os
+import time
+from functools import wraps
+
+### Variable Declaration ###
+ACTIONS: tuple = ("power", "mute", "channel_up", "channel_down", "volume_up", "volume_down", "set_channel")
+ENV_VARIABLE: str = "TVREMOTE_METRICS"
+
+SUB_BITS: int = 5 # 2**(SUB_BITS - 1) sub-buckets per power of two, so bucket widths stay within ~6% of their values
+HALF: int = 1 << (SUB_BITS - 1)
+BUCKETS: int = 64 * HALF # enough for any 64-bit nanosecond value
+
+# Prometheus bucket bounds: powers of two from ~1 us to ~1 s, which line up with histogram bucket edges
+EXPORT_BOUNDS: tuple = tuple(1 << power for power in range(10, 31))
+
+### UDF Declaration ###
+def enabled() -> bool:
+    """
+    Returns whether metrics were requested through the TVREMOTE_METRICS environment variable
+    :return: True if TVREMOTE_METRICS is set to a non-empty value
+    """
+    return bool(os.environ.get(ENV_VARIABLE))
+
+def bucket_index(value: int) -> int:
+    """
+    Returns the histogram bucket holding value. Values below 2**SUB_BITS get a bucket each, and every power of two
+    above that is split into HALF equal buckets.
+    :param value: A non-negative integer
+    :return: bucket index
+    """
+    shift = value.bit_length() - SUB_BITS
+    if shift <= 0:
+        return value
+    return (shift << (SUB_BITS - 1)) + (value >> shift)
+
+def bucket_bounds(index: int) -> tuple:
+    """
+    Returns the range of values a bucket holds, the inverse of bucket_index()
+    :param index: bucket index
+    :return: tuple of the lowest and highest value in the bucket
+    """
+    if index < 2 * HALF:
+        return index, index
+    shift = (index >> (SUB_BITS - 1)) - 1
+    mantissa = index - (shift << (SUB_BITS - 1))
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+### Class definition ###
+class LatencyHistogram:
+    """
+    A log-linear histogram of nanosecond latencies, in the style of HdrHistogram.
+    Recording is one bit_length(), a shift and a list increment.
+
+    Attributes
+    ----------
+    count : int
+        The number of recorded values
+    total : int
+        The sum of recorded values
+    maximum : int
+        The largest recorded value
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructs an empty histogram
+        """
+        self.counts: list = [0] * BUCKETS
+        self.count: int = 0
+        self.total: int = 0
+        self.maximum: int = 0
+
+    def record(self, value: int) -> None:
+        """
+        Records one value
+        :param value: A latency in nanoseconds
+        """
+        shift = value.bit_length() - SUB_BITS
+        self.counts[value if shift <= 0 else (shift << (SUB_BITS - 1)) + (value >> shift)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+
+    def reset(self) -> None:
+        """
+        Empties the histogram in place, so wrappers holding it keep recording into it
+        """
+        self.counts[:] = [0] * BUCKETS
+        self.count = 0
+        self.total = 0
+        self.maximum = 0
+
+    def percentile(self, fraction: float) -> int:
+        """
+        Returns an upper estimate of a percentile, accurate to the width of its bucket
+        :param fraction: The percentile as a fraction, such as 0.99
+        :return: nanoseconds, or 0 if nothing was recorded
+        """
+        if not self.count:
+            return 0
+        rank = max(1, round(fraction * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bucket_bounds(index)[1], self.maximum)
+        return self.maximum
+
+    def cumulative(self, bounds) -> list:
+        """
+        Returns how many values are at or below each bound
+        :param bounds: Ascending bucket-edge values, such as EXPORT_BOUNDS
+        :return: list of counts, one per bound
+        """
+        out, seen, index = [], 0, 0
+        for bound in bounds:
+            while index < BUCKETS and bucket_bounds(index)[1] <= bound:
+                seen += self.counts[index]
+                index += 1
+            out.append(seen)
+        return out
+
+class Metrics:
+    """
+    A registry of call counts and latency histograms, one per action
+
+    Methods
+    -------
+    histogram(action):
+        Returns the histogram of an action, creating it on first use
+    snapshot():
+        Returns a plain dictionary of every action's count and latency summary
+    add_exporter(exporter) / export():
+        Register exporters and push the current metrics to all of them
+    reset():
+        Empties every histogram in place
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructs an empty registry
+        """
+        self.histograms: dict = {}
+        self.exporters: list = []
+
+    def histogram(self, action: str) -> LatencyHistogram:
+        """
+        Returns the histogram of an action
+        :param action: The action name
+        :return: the action's LatencyHistogram
+        """
+        histogram = self.histograms.get(action)
+        if histogram is None:
+            histogram = self.histograms[action] = LatencyHistogram()
+        return histogram
+
+    def snapshot(self) -> dict:
+        """
+        Returns every action's call count and latency summary in nanoseconds
+        :return: dictionary of action to a dictionary of count, mean, p50, p90, p99 and max
+        """
+        return {action: {
+            "count": histogram.count,
+            "mean": histogram.total / histogram.count if histogram.count else 0.0,
+            "p50": histogram.percentile(0.50),
+            "p90": histogram.percentile(0.90),
+            "p99": histogram.percentile(0.99),
+            "max": histogram.maximum,
+        } for action, histogram in sorted(self.histograms.items())}
+
+    def add_exporter(self, exporter) -> None:
+        """
+        Registers an exporter
+        :param exporter: An object with an export(metrics) method
+        """
+        self.exporters.append(exporter)
+
+    def export(self) -> None:
+        """
+        Pushes the current metrics to every registered exporter
+        """
+        for exporter in self.exporters:
+            exporter.export(self)
+
+    def reset(self) -> None:
+        """
+        Empties every histogram, keeping the ones instrumented methods record into
+        """
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+class PrometheusFileExporter:
+    """
+    Writes metrics to a file in the Prometheus text exposition format, replacing the file atomically so a
+    node_exporter textfile collector never reads a partial dump
+    """
+
+    def __init__(self, path: str, prefix: str = "tvremote") -> None:
+        """
+        :param path: The file to write
+        :param prefix: Prefix for every metric name
+        """
+        self.path: str = path
+        self.prefix: str = prefix
+
+    def render(self, metrics: Metrics) -> str:
+        """
+        Renders metrics as Prometheus text
+        :param metrics: The registry to render
+        :return: the exposition text
+        """
+        calls, latency = f"{self.prefix}_action_calls_total", f"{self.prefix}_action_latency_seconds"
+        lines = [f"# HELP {calls} Number of remote actions handled.", f"# TYPE {calls} counter"]
+        for action, histogram in sorted(metrics.histograms.items()):
+            lines.append(f'{calls}{{action="{action}"}} {histogram.count}')
+        lines += [f"# HELP {latency} Time spent handling remote actions.", f"# TYPE {latency} histogram"]
+        for action, histogram in sorted(metrics.histograms.items()):
+            for bound, count in zip(EXPORT_BOUNDS, histogram.cumulative(EXPORT_BOUNDS)):
+                lines.append(f'{latency}_bucket{{action="{action}",le="{bound / 1e9:.9g}"}} {count}')
+            lines.append(f'{latency}_bucket{{action="{action}",le="+Inf"}} {histogram.count}')
+            lines.append(f'{latency}_sum{{action="{action}"}} {histogram.total / 1e9:.9g}')
+            lines.append(f'{latency}_count{{action="{action}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, metrics: Metrics) -> None:
+        """
+        Writes metrics to the file
+        :param metrics: The registry to write
+        """
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(self.render(metrics))
+        os.replace(temporary, self.path)
+
+### Instrumentation ###
+def _timed(method, histogram: LatencyHistogram):
+    """
+    Wraps a bound method so every call is recorded in histogram
+    :param method: The bound method
+    :param histogram: The histogram that receives each call's latency
+    :return: the wrapper
+    """
+    clock = time.perf_counter_ns
+    record = histogram.record
+
+    @wraps(method)
+    def wrapper(*args):
+        start = clock()
+        try:
+            return method(*args)
+        finally:
+            record(clock() - start)
+    wrapper.__wrapped_method__ = method
+    return wrapper
+
+def instrument(target, metrics: Metrics = None, actions: tuple = ACTIONS) -> Metrics:
+    """
+    Wraps the action methods of one object with timing wrappers. The wrappers are instance attributes, so the
+    button lambdas in TVRemote.__init__, which look the methods up on self, pick them up without being rewired.
+    Nested calls, like the automatic unmute inside volume_up, are recorded too.
+    :param target: A TVRemote, Television or similar instance
+    :param metrics: The registry to record into, defaulting to the shared METRICS
+    :param actions: The method names to wrap
+    :return: the registry
+    """
+    metrics = METRICS if metrics is None else metrics
+    for action in actions:
+        method = getattr(target, action)
+        if hasattr(method, "__wrapped_method__"):
+            continue
+        setattr(target, action, _timed(method, metrics.histogram(action)))
+    return metrics
+
+def uninstrument(target, actions: tuple = ACTIONS) -> None:
+    """
+    Removes the wrappers added by instrument(), restoring the plain methods
+    :param target: An instrumented instance
+    :param actions: The method names to unwrap
+    """
+    for action in actions:
+        if hasattr(target.__dict__.get(action), "__wrapped_method__"):
+            delattr(target, action)
+
+# Registry shared by TVRemote and main.py
+METRICS: Metrics = Metrics()
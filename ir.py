@@ -0,0 +1,499 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses the infrared output backend, used to drive real sets through an IR blaster. A TVRemote press is
+encoded as an NEC or RC5 frame, a pulse train of alternating mark and space durations in microseconds, which is output
+either as raw timings or as PCM audio for an audio-jack blaster. IREncoder encodes and renders the frame of every button
+once when it is built, so a press sequence is rendered with one NumPy gather from the cached frames into a single
+contiguous buffer, and no pulses are generated per press.
+
+Protocols:
+    NEC   38 kHz carrier. A 9 ms mark and 4.5 ms space, then 32 bits LSB first (address, ~address, command, ~command),
+          each a 562.5 us mark followed by a 562.5 us space for 0 or 1687.5 us for 1, a closing mark, and 108 ms
+          from one frame to the next
+    RC5   36 kHz carrier. 14 Manchester bits of 1.778 ms MSB first (two start bits, toggle, 5 address bits, 6 command
+          bits), a 1 being a half-bit space then a half-bit mark, and 113.8 ms from one frame to the next. The toggle
+          bit flips on every new press, so each button has a cached frame per toggle value.
+
+Presses are (action, value) tuples, as fuzz.py generates them, named after TVRemote's methods: set_channel N and
+enter_digit N send digit buttons, and apply sends every press of its batch (see commands.py). CODES holds the RC5 TV
+command numbers, which NEC sets are sent under their own address.
+
+Audio blasters wire two IR LEDs back to back across the left and right channels, so the PCM output is a sine at half
+the carrier, in antiphase on the two channels: the LEDs flash at the full carrier during a mark and stay dark during a
+space, and 48 kHz audio can carry a 38 kHz carrier. File sinks stand in for the hardware: WAVSink writes a stereo
+16-bit WAV file and TimingSink writes timings in LIRC's mode2 text format ("pulse N" and "space N" lines). IRBlaster
+sends presses to a sink in chunks, and attach() sends every keypad click of a TVRemote.
+
+Usage:
+    python ir.py [--protocol nec|rc5] [--presses N] [--output FILE]     benchmarks rendering a long macro
+"""
+
+### Import packages ###
+import argparse
+import random
+import sys
+import time
+import wave
+import numpy as np
+from commands import parse
+
+### Variable Declaration ###
+# RC5 system 0 (TV) command numbers
+CODES: dict = {"power": 12, "mute": 13, "volume_up": 16, "volume_down": 17, "channel_up": 32, "channel_down": 33,
+               **{str(digit): digit for digit in range(10)}}
+RATE: int = 48_000 # PCM samples per second
+AMPLITUDE: float = 0.8 # of full scale
+CHUNK: int = 1_024 # buttons rendered per sink write
+
+### UDF Declaration ###
+def buttons(presses) -> list:
+    """
+    Translates presses into the buttons an IR remote sends for them
+    :param presses: Iterable of (action, value) tuples, value being the channel, digit or batch script, or None
+    :return: list of button names, keys of CODES
+    """
+    sent = []
+    for action, value in presses:
+        if action == "set_channel" or action == "enter_digit":
+            if value < 0:
+                raise ValueError(f"Channel {value} cannot be typed")
+            sent.extend(str(value))
+        elif action == "apply":
+            for action, count, value in parse(value):
+                sent.extend(buttons(((action, value),)) * count)
+        else:
+            sent.append(action)
+    return sent
+
+def pulses(timings: np.ndarray, rate: int, carrier: int) -> np.ndarray:
+    """
+    Renders a pulse train as stereo PCM: a sine at half the carrier during each mark, in antiphase on the two channels
+    :param timings: Alternating mark and space durations in us, starting with a mark
+    :param rate: Samples per second
+    :param carrier: The carrier frequency in Hz
+    :return: int16 array of shape (samples, 2)
+    """
+    edges = np.rint(np.cumsum(timings) * rate / 1e6).astype(np.int64)
+    envelope = np.repeat(np.resize(np.array([1.0, 0.0]), len(edges)), np.diff(edges, prepend=0))
+    sine = np.sin(np.pi * carrier / rate * np.arange(len(envelope)))
+    samples = np.empty((len(envelope), 2), dtype="<i2")
+    samples[:, 0] = AMPLITUDE * np.iinfo(np.int16).max * sine * envelope
+    samples[:, 1] = -samples[:, 0]
+    return samples
+
+def open_sink(path: str, rate: int = RATE):
+    """
+    Opens a file sink: a WAVSink for a .wav path and a TimingSink for anything else
+    :param path: The file
+    :param rate: PCM samples per second, for a WAV file
+    :return: the sink
+    """
+    return WAVSink(path, rate) if path.lower().endswith(".wav") else TimingSink(path)
+
+### Class definition ###
+class NEC:
+    """
+    A class encoding NEC frames
+
+    Attributes
+    ----------
+    address : int
+        The 8-bit device address
+
+    Methods
+    -------
+    encode(command, toggle):
+        Returns the pulse train of one frame
+    """
+    CARRIER: int = 38_000 # Hz
+    PERIOD: float = 108_000 # us from one frame's start to the next
+    UNIT: float = 562.5 # us
+    TOGGLES: int = 1 # frames per button
+
+    def __init__(self, address: int = 0) -> None:
+        """
+        :param address: The 8-bit device address
+        """
+        if not 0 <= address <= 0xFF:
+            raise ValueError(f"NEC address {address} is not 8 bits")
+        self.address: int = address
+
+    def encode(self, command: int, toggle: int = 0) -> np.ndarray:
+        """
+        Encodes one frame
+        :param command: The 8-bit command
+        :param toggle: Unused, NEC has no toggle bit
+        :return: float array of alternating mark and space durations in us, ending with the space before the next frame
+        """
+        unit = NEC.UNIT
+        bits = self.address | (~self.address & 0xFF) << 8 | command << 16 | (~command & 0xFF) << 24
+        timings = [16 * unit, 8 * unit]
+        for bit in range(32):
+            timings += (unit, 3 * unit if bits >> bit & 1 else unit)
+        timings.append(unit)
+        timings.append(NEC.PERIOD - sum(timings))
+        return np.array(timings)
+
+class RC5:
+    """
+    A class encoding RC5 frames
+
+    Attributes
+    ----------
+    address : int
+        The 5-bit system address, 0 for TVs
+
+    Methods
+    -------
+    encode(command, toggle):
+        Returns the pulse train of one frame
+    """
+    CARRIER: int = 36_000 # Hz
+    HALF_BIT: float = 32e6 / 36_000 # us, 32 carrier cycles
+    PERIOD: float = 128 * HALF_BIT # us from one frame's start to the next
+    TOGGLES: int = 2 # frames per button
+
+    def __init__(self, address: int = 0) -> None:
+        """
+        :param address: The 5-bit system address
+        """
+        if not 0 <= address <= 0x1F:
+            raise ValueError(f"RC5 address {address} is not 5 bits")
+        self.address: int = address
+
+    def encode(self, command: int, toggle: int = 0) -> np.ndarray:
+        """
+        Encodes one frame. Commands from 64 to 127 clear the second start bit, as in RC5X.
+        :param command: The 7-bit command
+        :param toggle: The toggle bit
+        :return: float array of alternating mark and space durations in us, ending with the space before the next frame
+        """
+        bits = [1, 0 if command & 0x40 else 1, toggle & 1]
+        bits += [self.address >> shift & 1 for shift in range(4, -1, -1)]
+        bits += [command >> shift & 1 for shift in range(5, -1, -1)]
+        halves = [half for bit in bits for half in ((0, 1) if bit else (1, 0))][1:] # the first half-bit is always a space
+        timings, level = [], 1
+        for half in halves:
+            if half == level and timings:
+                timings[-1] += RC5.HALF_BIT
+            else:
+                timings.append(RC5.HALF_BIT)
+                level = half
+        if level:
+            timings.append(0.0)
+        timings[-1] += RC5.PERIOD - sum(timings) # the next frame's leading half-bit space is part of the gap
+        return np.array(timings)
+
+class IREncoder:
+    """
+    A class rendering presses for one protocol from cached frames
+
+    Attributes
+    ----------
+    protocol : NEC or RC5
+        The protocol presses are encoded in
+    codes : dict
+        Button name to command number
+    rate : int
+        PCM samples per second
+
+    Methods
+    -------
+    rows(presses):
+        Returns the cached frame of each button sent for the presses
+    render(presses):
+        Renders presses as one contiguous stereo PCM buffer
+    timings(presses):
+        Renders presses as one array of mark and space durations
+    duration():
+        Returns the time each press takes to send
+    """
+
+    ### Constructors ###
+    def __init__(self, protocol=None, codes: dict = CODES, rate: int = RATE) -> None:
+        """
+        Encodes and renders the frame of every button, once per toggle value
+        :param protocol: An NEC or RC5, defaulting to NEC()
+        :param codes: Button name to command number
+        :param rate: PCM samples per second
+        """
+        self.protocol = protocol or NEC()
+        self.codes: dict = codes
+        self.rate: int = rate
+        self.__index: dict = {button: index for index, button in enumerate(codes)} # button to its first row
+        self.__toggle: int = 0 # toggle value of the next press
+        toggles = self.protocol.TOGGLES
+        self.__timings: list = [self.protocol.encode(codes[button], toggle) for button in codes for toggle in range(toggles)]
+        frames = [pulses(timings, rate, self.protocol.CARRIER) for timings in self.__timings]
+        length = min(len(frame) for frame in frames) # rounding may differ by a sample between frames
+        self.__frames: np.ndarray = np.stack([frame[:length] for frame in frames]) # (rows, samples, 2)
+
+    ### Accessors ###
+    def rows(self, presses) -> np.ndarray:
+        """
+        Looks up the cached frame of each button sent for the presses, flipping the toggle bit on each one
+        :param presses: Iterable of (action, value) tuples
+        :return: int array of row numbers into the cached frames
+        """
+        index = self.__index
+        try:
+            rows = np.fromiter((index[button] for button in buttons(presses)), dtype=np.intp)
+        except KeyError as error:
+            raise ValueError(f"No IR code for button {error.args[0]!r}") from None
+        toggles = self.protocol.TOGGLES
+        if toggles > 1:
+            rows *= toggles
+            rows += (np.arange(len(rows)) + self.__toggle) % toggles
+            self.__toggle = (self.__toggle + len(rows)) % toggles
+        return rows
+
+    def render(self, presses) -> np.ndarray:
+        """
+        Renders presses as PCM, each frame followed by the silence before the next
+        :param presses: Iterable of (action, value) tuples
+        :return: contiguous int16 array of shape (samples, 2)
+        """
+        frames = self.__frames
+        return frames[self.rows(presses)].reshape(-1, 2)
+
+    def timings(self, presses) -> np.ndarray:
+        """
+        Renders presses as raw timings
+        :param presses: Iterable of (action, value) tuples
+        :return: float array of alternating mark and space durations in us, starting with a mark
+        """
+        cached = self.__timings
+        rows = self.rows(presses)
+        if not len(rows):
+            return np.empty(0)
+        return np.concatenate([cached[row] for row in rows.tolist()])
+
+    def duration(self) -> float:
+        """
+        Returns the time each press takes to send
+        :return: seconds per frame
+        """
+        return self.__frames.shape[1] / self.rate
+
+class WAVSink:
+    """
+    A class writing PCM to a stereo 16-bit WAV file, in place of an audio-jack IR blaster
+    """
+
+    def __init__(self, path: str, rate: int = RATE) -> None:
+        """
+        :param path: The WAV file
+        :param rate: PCM samples per second, which the encoder must match
+        """
+        self.rate: int = rate
+        self.__file = wave.open(path, "wb")
+        self.__file.setnchannels(2)
+        self.__file.setsampwidth(2)
+        self.__file.setframerate(rate)
+
+    def write(self, encoder: IREncoder, presses) -> None:
+        """
+        Renders presses and appends them to the file
+        :param encoder: The encoder to render with
+        :param presses: Iterable of (action, value) tuples
+        """
+        if encoder.rate != self.rate:
+            raise ValueError(f"Encoder renders {encoder.rate} Hz, the file is {self.rate} Hz")
+        self.__file.writeframes(memoryview(encoder.render(presses)).cast("B"))
+
+    def close(self) -> None:
+        """
+        Closes the WAV file, which fills in the frame count in its header
+        """
+        self.__file.close()
+
+    def __enter__(self) -> "WAVSink":
+        """
+        Returns the sink, so a with block closes it
+        :return: self
+        """
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """
+        Closes the sink when the with block ends, even on an exception
+        """
+        self.close()
+
+class TimingSink:
+    """
+    A class writing raw timings as LIRC mode2 text, in place of a timing-driven IR blaster
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: The text file
+        """
+        self.__file = open(path, "w", encoding="utf-8")
+
+    def write(self, encoder: IREncoder, presses) -> None:
+        """
+        Renders presses and appends them to the file, one pulse or space per line in whole us
+        :param encoder: The encoder to render with
+        :param presses: Iterable of (action, value) tuples
+        """
+        durations = np.rint(encoder.timings(presses)).astype(np.int64).tolist()
+        self.__file.write("".join(f"pulse {mark}\nspace {space}\n" for mark, space in zip(durations[0::2], durations[1::2])))
+
+    def close(self) -> None:
+        """
+        Closes the timing file, flushing any buffered lines
+        """
+        self.__file.close()
+
+    def __enter__(self) -> "TimingSink":
+        """
+        Returns the sink, so a with block closes it
+        :return: self
+        """
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """
+        Closes the sink when the with block ends, even on an exception
+        """
+        self.close()
+
+class IRBlaster:
+    """
+    A class sending presses through an encoder to a sink
+
+    Attributes
+    ----------
+    encoder : IREncoder
+        Renders the presses
+    sink : WAVSink or TimingSink
+        Receives them
+
+    Methods
+    -------
+    send(presses):
+        Sends a press sequence, CHUNK buttons per sink write
+    press(action, value):
+        Sends one press
+    attach(remote):
+        Sends every keypad click of a TVRemote
+    """
+
+    def __init__(self, encoder: IREncoder, sink) -> None:
+        """
+        :param encoder: Renders the presses
+        :param sink: Receives them
+        """
+        self.encoder: IREncoder = encoder
+        self.sink = sink
+
+    @classmethod
+    def to_file(cls, path: str, protocol: str = "nec") -> "IRBlaster":
+        """
+        Builds a blaster writing to a file: a WAVSink for a .wav path and a TimingSink for anything else
+        :param path: The file
+        :param protocol: "nec" or "rc5"
+        :return: the blaster
+        """
+        encoder = IREncoder(PROTOCOLS[protocol.lower()]())
+        return cls(encoder, open_sink(path, encoder.rate))
+
+    def send(self, presses) -> None:
+        """
+        Sends a press sequence, rendering at most CHUNK buttons at a time so long macros stream through the sink
+        :param presses: Iterable of (action, value) tuples
+        """
+        sent = [(button, None) for button in buttons(presses)] # digits and batches expanded, so chunks are bounded
+        for start in range(0, len(sent), CHUNK):
+            self.sink.write(self.encoder, sent[start:start + CHUNK])
+
+    def press(self, action: str, value=None) -> None:
+        """
+        Sends one press
+        :param action: A TVRemote method name
+        :param value: The channel, digit or batch script, or None
+        """
+        self.send(((action, value),))
+
+    def attach(self, remote) -> None:
+        """
+        Sends the action of every keypad button clicked on a TVRemote. Buttons with no IR code, such as an undo button
+        added to the layout, are skipped with a warning here, as an error raised in a Qt slot would abort the GUI.
+        :param remote: The TVRemote
+        """
+        presses = {}
+        for id, key in enumerate(remote.keys):
+            try:
+                missing = [button for button in buttons(((key.action, key.argument),)) if button not in self.encoder.codes]
+            except ValueError as error:
+                missing = [str(error)]
+            if missing:
+                print(f"ir: not sending {key.name}, which has no IR code for {', '.join(missing)}", file=sys.stderr)
+            else:
+                presses[id] = ((key.action, key.argument),)
+        remote.buttonGroup.idClicked.connect(lambda id : id in presses and self.send(presses[id]))
+
+    def close(self) -> None:
+        """
+        Closes the sink. Presses sent after this fail.
+        """
+        self.sink.close()
+
+PROTOCOLS: dict = {"nec": NEC, "rc5": RC5}
+
+### Benchmark ###
+def benchmark(protocol, presses: int, output: str = None) -> None:
+    """
+    Prints the time to render a long macro per press in Python and from the cached frames, as PCM and as timings
+    :param protocol: An NEC or RC5
+    :param presses: The number of presses in the macro
+    :param output: A .wav or mode2 file to write the macro to, or None
+    """
+    rng = random.Random(0)
+    macro = [rng.choice((("volume_up", None), ("volume_down", None), ("channel_up", None), ("channel_down", None),
+                         ("mute", None), ("set_channel", rng.randint(0, 99)))) for _ in range(presses)]
+    encoder = IREncoder(protocol)
+    sent = len(buttons(macro))
+    print(f"{type(protocol).__name__}: {presses:,} presses, {sent:,} buttons, "
+          f"{sent * encoder.duration() / 60:.1f} minutes of IR")
+
+    start = time.perf_counter()
+    toggle = 0
+    frames = []
+    for button in buttons(macro):
+        frames.append(pulses(protocol.encode(CODES[button], toggle), encoder.rate, protocol.CARRIER))
+        toggle ^= 1
+    np.concatenate(frames)
+    per_press = time.perf_counter() - start
+    print(f"per press : {per_press:8.3f} s, {sent / per_press:12,.0f} buttons/s")
+    for name, render in (("cached pcm", encoder.render), ("timings", encoder.timings)):
+        start = time.perf_counter()
+        rendered = render(macro)
+        seconds = time.perf_counter() - start
+        print(f"{name:<10}: {seconds:8.3f} s, {sent / seconds:12,.0f} buttons/s, {rendered.nbytes / 1e6:8.1f} MB, "
+              f"{per_press / seconds:6.0f}x")
+
+    if output:
+        blaster = IRBlaster(encoder, open_sink(output, encoder.rate))
+        start = time.perf_counter()
+        blaster.send(macro)
+        blaster.close()
+        print(f"{output}: {time.perf_counter() - start:.3f} s to write {sent:,} buttons")
+
+## Main Function ##
+def main() -> None:
+    """
+    Benchmarks rendering a long macro
+    """
+    parser = argparse.ArgumentParser(description="IR encoder benchmark")
+    parser.add_argument("--protocol", choices=tuple(PROTOCOLS), default="nec", help="IR protocol")
+    parser.add_argument("--presses", type=int, default=2_000, help="presses in the macro")
+    parser.add_argument("--output", help="also write the macro to a .wav or mode2 timing file")
+    args = parser.parse_args()
+    benchmark(PROTOCOLS[args.protocol](), args.presses, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses JournaledFleet, a fleet of tv states that survives restarts. Every state change is appended to a
+binary journal, and the whole fleet is periodically written to a compact snapshot. Recovery memory-maps the latest
+snapshot (copy-on-write, so nothing is read up front) and replays only the journal written after it, so restart time
+depends on the snapshot interval rather than on how long the fleet has been running.
+Journal appends use group commit: records are buffered and written with one write() and fsync() per group.
+
+Store layout (one directory):
+    snapshot-SEQ.bin   header SNAPSHOT_HEADER, then one int64 packed state (compact.pack) per device
+    journal-SEQ.log    JOURNAL_RECORD entries for sequence numbers after SEQ
+
+Running it directly benchmarks append throughput and recovery time.
+"""
+
+### Import packages ###
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from compact import CompactTelevision
+
+### Variable Declaration ###
+MAGIC: bytes = b"TVSN"
+VERSION: int = 2 # version 1 stored uint32 states, which could not hold negative or large channels
+SNAPSHOT_HEADER: struct.Struct = struct.Struct("<4sHHQQ") # magic, version, bytes per state, last sequence number, device count
+JOURNAL_RECORD: struct.Struct = struct.Struct("<QIq") # sequence number, device, packed state after the change
+STATE_TYPE: str = "q"
+
+### Class definition ###
+class JournaledFleet:
+    """
+    A class holding packed tv states for devices 0..size-1, made durable by a journal and snapshots
+
+    Attributes
+    ----------
+    directory : str
+        The store directory
+    sequence : int
+        The sequence number of the last journaled change
+
+    Methods
+    -------
+    apply(device, action, value):
+        Applies a Television action to a device and journals the change
+    state(device) / tv(device):
+        Return a device's packed state, or a CompactTelevision holding it
+    commit():
+        Writes and fsyncs the pending group of journal records
+    snapshot():
+        Writes a snapshot of every device and starts a new journal segment
+    close():
+        Commits and closes the journal
+    """
+
+    ### Constructors ###
+    def __init__(self, directory: str, size: int = 0, group_size: int = 4096, group_interval: float = 0.05,
+                 snapshot_every: int = 1_000_000, durable: bool = True) -> None:
+        """
+        Opens the store in directory, recovering its state, or creates it with size devices
+        :param directory: The store directory, created if missing
+        :param size: The number of devices for a new store. Ignored when the store already exists.
+        :param group_size: The most journal records buffered before a commit
+        :param group_interval: The longest time in seconds a record stays buffered, checked on each apply()
+        :param snapshot_every: The number of journaled changes between automatic snapshots, or 0 for manual only
+        :param durable: Whether commits and snapshots call fsync()
+        """
+        self.directory: str = directory
+        self.group_size: int = group_size
+        self.group_interval: float = group_interval
+        self.snapshot_every: int = snapshot_every
+        self.durable: bool = durable
+        os.makedirs(directory, exist_ok=True)
+
+        self.__pending: bytearray = bytearray()
+        self.__pending_count: int = 0
+        self.__pending_since: float = 0.0
+        self.__since_snapshot: int = 0
+        self.__mapped = None
+        self.__journal = None
+
+        snapshot = self.__latest("snapshot-", ".bin")
+        if snapshot is None:
+            self.sequence: int = 0
+            self.__states = array(STATE_TYPE, [CompactTelevision().state()]) * size
+            self.snapshot()
+        else:
+            self.__load(snapshot)
+            self.__replay()
+            self.__journal = open(self.__path("journal-", self.__snapshot_sequence, ".log"), "ab")
+
+    ### Helpers ###
+    def __path(self, prefix: str, sequence: int, suffix: str) -> str:
+        return os.path.join(self.directory, f"{prefix}{sequence:020d}{suffix}")
+
+    def __files(self, prefix: str, suffix: str) -> list:
+        """
+        Lists the store files of one kind, oldest first
+        :return: list of (sequence number, path)
+        """
+        found = []
+        for name in os.listdir(self.directory):
+            if name.startswith(prefix) and name.endswith(suffix) and name[len(prefix):-len(suffix)].isdigit():
+                found.append((int(name[len(prefix):-len(suffix)]), os.path.join(self.directory, name)))
+        return sorted(found)
+
+    def __latest(self, prefix: str, suffix: str):
+        files = self.__files(prefix, suffix)
+        return files[-1][1] if files else None
+
+    def __sync(self, file) -> None:
+        file.flush()
+        if self.durable:
+            os.fsync(file.fileno())
+
+    ### Recovery ###
+    def __load(self, path: str) -> None:
+        """
+        Maps a snapshot copy-on-write and views its states in place, so loading does not depend on the fleet size
+        :param path: The snapshot file
+        """
+        with open(path, "rb") as file:
+            self.__mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, width, sequence, count = SNAPSHOT_HEADER.unpack_from(self.__mapped)
+        if magic != MAGIC or version != VERSION or width != array(STATE_TYPE).itemsize:
+            raise ValueError(f"{path} is not a version {VERSION} tv snapshot")
+        self.__states = memoryview(self.__mapped)[SNAPSHOT_HEADER.size:SNAPSHOT_HEADER.size + count * width].cast(STATE_TYPE)
+        self.sequence = self.__snapshot_sequence = sequence
+
+    def __replay(self) -> None:
+        """
+        Applies the journal records written after the loaded snapshot. A torn record at the end of the journal,
+        left by a crash mid-write, is ignored and truncated away.
+        """
+        states = self.__states
+        for start, path in self.__files("journal-", ".log"):
+            if start < self.__snapshot_sequence:
+                continue
+            with open(path, "rb") as file:
+                data = file.read()
+            whole = len(data) - len(data) % JOURNAL_RECORD.size
+            for sequence, device, state in JOURNAL_RECORD.iter_unpack(memoryview(data)[:whole]):
+                if sequence > self.sequence:
+                    states[device] = state
+                    self.sequence = sequence
+                    self.__since_snapshot += 1
+            if whole != len(data):
+                with open(path, "r+b") as file:
+                    file.truncate(whole)
+
+    ### Mutators ###
+    def apply(self, device: int, action: str, value: int = None) -> int:
+        """
+        Applies a Television action to a device and journals the new state if it changed
+        :param device: The device number
+        :param action: A Television method name
+        :param value: The channel, for set_channel
+        :return: the device's packed state after the action
+        """
+        before = self.__states[device]
+        tv = CompactTelevision(before)
+        if value is None:
+            getattr(tv, action)()
+        else:
+            getattr(tv, action)(value)
+        after = tv.state()
+        if not -1 << 63 <= after < 1 << 63:
+            raise ValueError(f"channel {tv.getChannel()} does not fit a journaled state")
+        if after != before:
+            self.__states[device] = after
+            self.sequence += 1
+            if not self.__pending_count:
+                self.__pending_since = time.monotonic()
+            self.__pending += JOURNAL_RECORD.pack(self.sequence, device, after)
+            self.__pending_count += 1
+            self.__since_snapshot += 1
+        if self.__pending_count >= self.group_size or (self.__pending_count and time.monotonic() - self.__pending_since >= self.group_interval):
+            self.commit()
+        if self.snapshot_every and self.__since_snapshot >= self.snapshot_every:
+            self.snapshot()
+        return after
+
+    def commit(self) -> None:
+        """
+        Writes the pending group of journal records with one write() and one fsync()
+        """
+        if self.__pending_count:
+            self.__journal.write(self.__pending)
+            self.__sync(self.__journal)
+            self.__pending.clear()
+            self.__pending_count = 0
+
+    def snapshot(self) -> str:
+        """
+        Writes every device state to a new snapshot, then starts a new journal segment and removes the files it replaces.
+        The snapshot is written to a temporary file and renamed, so a crash leaves either the old or the new one.
+        :return: the snapshot path
+        """
+        if self.__journal is not None:
+            self.commit()
+        path = self.__path("snapshot-", self.sequence, ".bin")
+        with open(f"{path}.tmp", "wb") as file:
+            file.write(SNAPSHOT_HEADER.pack(MAGIC, VERSION, self.__states.itemsize, self.sequence, len(self.__states)))
+            file.write(self.__states)
+            self.__sync(file)
+        os.replace(f"{path}.tmp", path)
+
+        if self.__journal is not None:
+            self.__journal.close()
+        self.__journal = open(self.__path("journal-", self.sequence, ".log"), "ab")
+        self.__snapshot_sequence = self.sequence
+        self.__since_snapshot = 0
+        for sequence, old in self.__files("snapshot-", ".bin") + self.__files("journal-", ".log"):
+            if sequence < self.sequence:
+                os.remove(old)
+        return path
+
+    def close(self) -> None:
+        """
+        Commits pending records and closes the journal
+        """
+        self.commit()
+        self.__journal.close()
+        if self.__mapped is not None:
+            self.__states = array(STATE_TYPE, self.__states) # release the view so the mapping can close
+            self.__mapped.close()
+            self.__mapped = None
+
+    def __enter__(self) -> "JournaledFleet":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    ### Accessors ###
+    def __len__(self) -> int:
+        return len(self.__states)
+
+    def state(self, device: int) -> int:
+        """
+        Returns the packed state of a device
+        :param device: The device number
+        :return: the packed state, as built by compact.pack()
+        """
+        return self.__states[device]
+
+    def tv(self, device: int) -> CompactTelevision:
+        """
+        Returns a detached CompactTelevision holding a device's state
+        :param device: The device number
+        :return: a CompactTelevision
+        """
+        return CompactTelevision(self.__states[device])
+
+### Benchmark ###
+def benchmark(directory: str, devices: int = 1_000_000, changes: int = 1_000_000) -> None:
+    """
+    Times journaled changes with group commit, then recovery with and without a fresh snapshot
+    :param directory: An empty scratch directory
+    :param devices: The number of devices
+    :param changes: The number of actions applied
+    """
+    import random
+    rng = random.Random(0)
+    actions = ["power", "mute", "channel_up", "channel_down", "volume_up", "volume_down"]
+    start = time.perf_counter()
+    store = JournaledFleet(directory, devices, snapshot_every=0)
+    print(f"create {devices:,} devices: {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    for _ in range(changes):
+        store.apply(rng.randrange(devices), rng.choice(actions))
+    store.close()
+    seconds = time.perf_counter() - start
+    print(f"apply {changes:,} actions: {seconds:.3f}s - {changes / seconds:,.0f} actions/s, {store.sequence:,} journaled")
+
+    for label in ("recover, full journal tail", "recover, fresh snapshot"):
+        start = time.perf_counter()
+        store = JournaledFleet(directory)
+        print(f"{label}: {(time.perf_counter() - start) * 1000:.1f} ms")
+        store.snapshot()
+        store.close()
+
+if __name__ == "__main__":
+    benchmark(sys.argv[1] if len(sys.argv) > 1 else "journal-bench")
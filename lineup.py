@@ -0,0 +1,134 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses ChannelLineup, a sorted index of the valid channel numbers of a tv, which are often sparse.
+TVRemote steps channel_up/channel_down through the lineup with a bisect, so a press costs O(log n) however far apart
+the channels are, and uses extendable() to decide when a typed channel number is complete.
+
+Lineup files hold one channel per line, as "NUMBER" or "NUMBER NAME" or "NUMBER,NAME".
+Blank lines and lines starting with # are ignored.
+"""
+
+### Import packages ###
+from array import array
+from bisect import bisect_left, bisect_right
+
+### Class definition ###
+class ChannelLineup:
+    """
+    A class representing a sorted set of channel numbers with optional names
+
+    Attributes
+    ----------
+    channels : array
+        The channel numbers in ascending order
+    names : dict
+        Channel number to name, for the channels that have one
+    digits : int
+        The number of digits of the highest channel
+
+    Methods
+    -------
+    load(path):
+        Reads a lineup file
+    step(channel, count):
+        Returns the channel count positions above (or below, if negative) channel, wrapping around the lineup
+    extendable(value, length):
+        Returns whether typing more digits after value could still reach a channel
+    """
+
+    ### Constructors ###
+    def __init__(self, channels, names: dict = None) -> None:
+        """
+        Builds the index
+        :param channels: An iterable of non-negative channel numbers, in any order and possibly repeated
+        :param names: Channel number to name
+        """
+        self.channels: array = array("l", sorted(set(channels)))
+        if not self.channels:
+            raise ValueError("A channel lineup needs at least one channel")
+        if self.channels[0] < 0:
+            raise ValueError(f"Channel numbers must be non-negative, got {self.channels[0]}")
+        self.names: dict = dict(names or {})
+        self.digits: int = len(str(self.channels[-1]))
+
+    @classmethod
+    def load(cls, path: str) -> "ChannelLineup":
+        """
+        Reads a lineup file
+        :param path: The file to read
+        :return: a ChannelLineup
+        """
+        channels, names = [], {}
+        with open(path, encoding="utf-8") as file:
+            for number, line in enumerate(file, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                fields = line.split(",", 1) if "," in line else line.split(None, 1)
+                try:
+                    channel = int(fields[0])
+                except ValueError:
+                    raise ValueError(f"{path} line {number}: bad channel number {fields[0]!r}") from None
+                channels.append(channel)
+                if len(fields) > 1 and fields[1].strip():
+                    names[channel] = fields[1].strip()
+        return cls(channels, names)
+
+    ### Accessors ###
+    def __len__(self) -> int:
+        return len(self.channels)
+
+    def __contains__(self, channel: int) -> bool:
+        index = bisect_left(self.channels, channel)
+        return index < len(self.channels) and self.channels[index] == channel
+
+    def first(self) -> int:
+        """
+        Returns the lowest channel
+        :return: channel number
+        """
+        return self.channels[0]
+
+    def step(self, channel: int, count: int) -> int:
+        """
+        Returns the channel reached by count channel_up presses (channel_down when count is negative), wrapping from
+        the highest channel to the lowest. A channel missing from the lineup first moves to its neighbour.
+        :param channel: The current channel
+        :param count: The number of presses, negative for channel_down
+        :return: channel number
+        """
+        channels = self.channels
+        if count == 0:
+            return channel
+        index = bisect_left(channels, channel)
+        if index == len(channels) or channels[index] != channel:
+            # the first press lands on the neighbour in the direction of travel
+            index = bisect_right(channels, channel) if count > 0 else index - 1
+            count += -1 if count > 0 else 1
+        return channels[(index + count) % len(channels)]
+
+    def extendable(self, value: int, length: int = None) -> bool:
+        """
+        Returns whether some channel starts with the digits typed so far and has more digits, in O(digits * log n)
+        :param value: The number typed so far
+        :param length: The number of digits typed, which may include leading zeros, defaulting to len(str(value))
+        :return: True if another digit could still complete a channel
+        """
+        length = len(str(value)) if length is None else length
+        channels = self.channels
+        for extra in range(1, self.digits - length + 1):
+            low, high = value * 10 ** extra, (value + 1) * 10 ** extra
+            index = bisect_left(channels, low)
+            if index < len(channels) and channels[index] < high:
+                return True
+        return False
+
+    def name(self, channel: int) -> str:
+        """
+        Returns the name of a channel
+        :param channel: The channel number
+        :return: the name, or "" if it has none
+        """
+        return self.names.get(channel, "")
@@ -6,8 +6,16 @@ This script houses the object TVRemote to represent the behavior commonly found
 """
 
 ### Import packages ###
+from functools import partial
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QKeySequence, QShortcut
 from PyQt6.QtWidgets import *
 from gui import *
+from commands import fold, parse
+from compact import pack, unpack
+from history import StateHistory
+from lineup import ChannelLineup
+import instrumentation
 
 ### Class definition ###
 class TVRemote(QMainWindow, RemoteGUI):
@@ -25,6 +33,16 @@ class TVRemote(QMainWindow, RemoteGUI):
         Represents the volume of the tv
     channel : int
         Represents the selected channel of the tv
+    lineup : ChannelLineup
+        The valid channels, which channel_up/channel_down and typed channel numbers are limited to
+    guide : ProgramGuide
+        The program guide whose current programme is shown in the window title, or None
+    tuner : PrefetchingTuner
+        The tuner asked to switch after every channel change, or None
+    history : StateHistory
+        The last HISTORY_SIZE actions, as packed state deltas, for undo() and redo() (Ctrl+Z / Ctrl+Y)
+    keys : tuple
+        The keypad layout, whose buttons all click through one slot that calls the method each Key names
     
     Methods
     -------
@@ -42,14 +60,26 @@ class TVRemote(QMainWindow, RemoteGUI):
         Decrements the volume variable until the minimum volume vaule is reached.
     set_channel(value: int):
         Assigns 
+    enter_digit(digit: int):
+        Adds a digit to the channel number being typed, tuning once it is complete
+    apply(script: str):
+        Applies a batch of presses such as "POWER, VOL+ x50, CH- x13, 7" in closed form
+    undo() / redo():
+        Reverts the last action / repeats the last undone one
+    state():
+        Returns the whole tv state as one packed integer
     powered():
         Returns the state of the status boolean
     muted():
         Returns the state of the muted boolean
     getVolume():
         Returns the integer value of volume
+    storedVolume():
+        Returns the integer value of volume, including while muted
     getChannel():
         Returns the integer value of channel
+    nowPlaying():
+        Returns the title of the programme on the current channel
     __str__():
         returns a formatted string which calls getDevice(), powered(), muted(), getChannel(), and getVolume() to display the given state of a tv object
     """
@@ -58,12 +88,24 @@ class TVRemote(QMainWindow, RemoteGUI):
     MIN_VOLUME: int = 0
     MAX_VOLUME: int = 100 #increased value to represetn 100% volume
     MIN_CHANNEL: int = 0
-    MAX_CHANNEL: int = 9 # increased value for all button functionality
+    MAX_CHANNEL: int = 9 # increased value for all button functionality, and the default lineup's highest channel
+
+    REPEAT_DELAY: int = 300 # ms a VOL/CH button is held before it starts repeating
+    REPEAT_INTERVAL: int = 50 # ms between repeats while held
+    REPEAT_ACCELERATE: int = 8 # repeats before each extra step per repeat
+    REPEAT_MAX_STEP: int = 5 # most steps taken per repeat
+    FRAME_INTERVAL: int = 16 # ms between volumeBar repaints, roughly one frame at 60 Hz
+    DIGIT_TIMEOUT: int = 1500 # ms after the last digit before a partly typed channel number is tuned
+    HISTORY_SIZE: int = 1024 # most actions that can be undone, at 8 bytes each
 
     ### Constructors ###
-    def __init__(self) -> None:
+    def __init__(self, lineup: ChannelLineup = None, guide=None, tuner=None, layout: tuple = KEYPAD) -> None:
         """
         Constructs the instance attributes for the tv object
+        :param lineup: The valid channels, defaulting to every channel from MIN_CHANNEL to MAX_CHANNEL
+        :param guide: A guide.ProgramGuide to show the current programme from
+        :param tuner: A tuner.PrefetchingTuner, whose request() returns at once so the event loop never waits on a tune
+        :param layout: The keypad, as a tuple of gui.Key, each naming the TVRemote method its button calls
         """
         super().__init__() # we need access to widget functions called from QWidgets, which GUI is a child of
 
@@ -71,93 +113,198 @@ class TVRemote(QMainWindow, RemoteGUI):
         self.__muted: bool = False
         self.__volume: int = TVRemote.MIN_VOLUME
         self.__channel: int = TVRemote.MIN_CHANNEL
+        self.lineup: ChannelLineup = lineup or ChannelLineup(range(TVRemote.MIN_CHANNEL, TVRemote.MAX_CHANNEL + 1))
+        self.guide = guide
+        self.tuner = tuner
+        self.history: StateHistory = StateHistory(TVRemote.HISTORY_SIZE)
+        self.__nested: bool = False # set while one action calls another, so only the outer action is recorded
+
+        self.setupGUI(self, layout) # configures GUI object by calling PromptWindow.setupGUI()
+
+        # volumeBar updates are coalesced: state changes only mark the bar stale, and this timer repaints it once per frame
+        self.__volumeTimer = QTimer(self)
+        self.__volumeTimer.setSingleShot(True)
+        self.__volumeTimer.setInterval(TVRemote.FRAME_INTERVAL)
+        self.__volumeTimer.timeout.connect(self.__updateVolumeBar)
+        self.__repeats: int = 0
+
+        # digits are buffered until the number is complete or this timer runs out
+        self.__digits: str = ""
+        self.__digitTimer = QTimer(self)
+        self.__digitTimer.setSingleShot(True)
+        self.__digitTimer.setInterval(TVRemote.DIGIT_TIMEOUT)
+        self.__digitTimer.timeout.connect(self.__commitDigits)
 
-        self.setupGUI(self) # configures GUI object by calling PromptWindow.setupGUI()
+        # held VOL/CH buttons repeat, as marked in the layout
+        for id, key in enumerate(self.keys):
+            if key.repeat:
+                self.buttonGroup.button(id).setAutoRepeatDelay(TVRemote.REPEAT_DELAY)
+                self.buttonGroup.button(id).setAutoRepeatInterval(TVRemote.REPEAT_INTERVAL)
 
         ### Buttion actions ###
-        self.buttonPOWER.clicked.connect(lambda : self.power())
-        self.buttonMUTE.clicked.connect(lambda : self.mute())
-
-        self.buttonCHUP.clicked.connect(lambda : self.channel_up())
-        self.buttonVOLUP.clicked.connect(lambda : self.volume_up())
-        self.buttonCHDWN.clicked.connect(lambda : self.channel_down())
-        self.buttonVOLDWN.clicked.connect(lambda : self.volume_down())
-
-        self.button0.clicked.connect(lambda : self.set_channel(0))
-        self.button1.clicked.connect(lambda : self.set_channel(1))
-        self.button2.clicked.connect(lambda : self.set_channel(2))
-        self.button3.clicked.connect(lambda : self.set_channel(3))
-        self.button4.clicked.connect(lambda : self.set_channel(4))
-        self.button5.clicked.connect(lambda : self.set_channel(5))
-        self.button6.clicked.connect(lambda : self.set_channel(6))
-        self.button7.clicked.connect(lambda : self.set_channel(7))
-        self.button8.clicked.connect(lambda : self.set_channel(8))
-        self.button9.clicked.connect(lambda : self.set_channel(9))
+        self.buttonGroup.idClicked.connect(self.__dispatch) # one slot for every button in the layout
+
+        QShortcut(QKeySequence.StandardKey.Undo, self).activated.connect(lambda : self.undo())
+        QShortcut(QKeySequence.StandardKey.Redo, self).activated.connect(lambda : self.redo())
+
+        if instrumentation.enabled(): # opt-in, so uninstrumented remotes keep their plain methods
+            instrumentation.instrument(self)
+
+    ### Display ###
+    def __dispatch(self, id: int) -> None:
+        """
+        Runs the action of the clicked keypad button. Methods are looked up on each click, so instrumented methods
+        are the ones called.
+        :param id: The button's id, its index in the layout
+        """
+        key = self.keys[id]
+        action = getattr(self, key.action)
+        if key.repeat:
+            self.__repeat(self.buttonGroup.button(id), action if key.argument is None else partial(action, key.argument))
+        elif key.argument is None:
+            action()
+        else:
+            action(key.argument)
+
+    def __repeat(self, button, action) -> None:
+        """
+        Runs a VOL/CH action for a click. While the button is held down, Qt repeats the click, and each repeat
+        takes more steps the longer the button has been held.
+        :param button: The button that was clicked
+        :param action: The bound method the button triggers
+        """
+        # isDown() is only still True for clicks fired by the auto-repeat timer, not the final release or click()
+        self.__repeats = self.__repeats + 1 if button.isDown() else 0
+        for _ in range(min(TVRemote.REPEAT_MAX_STEP, 1 + self.__repeats // TVRemote.REPEAT_ACCELERATE)):
+            action()
+
+    def __scheduleVolumeBar(self) -> None:
+        """
+        Marks the volumeBar stale, starting the frame timer unless a repaint is already pending
+        """
+        if not self.__volumeTimer.isActive():
+            self.__volumeTimer.start()
+
+    def __updateVolumeBar(self) -> None:
+        """
+        Shows the current volume on the volumeBar
+        """
+        self.volumeBar.setProperty("value", self.getVolume())
+
+    def __channelChanged(self) -> None:
+        """
+        Asks the tuner for the current channel and shows its programme in the window title, when there are a tuner
+        and a guide
+        """
+        if self.tuner is not None and self.powered():
+            self.tuner.request(self.__channel)
+        if self.guide is not None:
+            title = self.nowPlaying()
+            self.setWindowTitle(f"TV Remote - {self.getChannel()}: {title}" if title else "TV Remote")
+
+    def __record(self, before: int) -> None:
+        """
+        Adds the change an action made to the undo history, unless the action ran inside another one
+        :param before: The packed state from before the action
+        """
+        if not self.__nested:
+            self.history.record(before, self.state())
+
+    def __restore(self, state: int) -> None:
+        """
+        Sets every field from a packed state and shows it at once, without recording it
+        :param state: A packed state from state()
+        """
+        self.__status, self.__muted, self.__volume, self.__channel = unpack(state)
+        self.__volumeTimer.stop()
+        self.__updateVolumeBar()
+        self.__channelChanged()
+
+    def __commitDigits(self) -> None:
+        """
+        Tunes to the typed channel number if it is in the lineup, and clears the digit buffer
+        """
+        self.__digitTimer.stop()
+        value, self.__digits = int(self.__digits), ""
+        if value in self.lineup:
+            self.set_channel(value)
 
     ### Mutators ###
     def power(self) -> None:
         """
         Toggles the status boolean to turn the tv on and off
         """
+        before = self.state()
         self.__status = False if self.powered() else True
+        self.__channelChanged()
+        self.__record(before)
         
     def mute(self) -> None:
         """
         Toggles the mute boolean to mute and unmute the tv.
         """
         if self.powered():
+            before = self.state()
             if self.muted():
                 self.__muted = False
-                self.volumeBar.setProperty("value", self.getVolume())
             else:
                 self.__muted = True
-                self.volumeBar.setProperty("value", 0)
+            self.__scheduleVolumeBar()
+            self.__record(before)
 
     def channel_up(self) -> None:
         """
         Incraments the channel variable until the maximum channel value is reached, after which cycles back to the minimum channel value.
         """
         if self.powered():
-            if self.__channel < TVRemote.MAX_CHANNEL:
-                self.__channel += 1
-            else:
-                # If on maximum channel value and called again, cycles back to min channel value
-                self.__channel = TVRemote.MIN_CHANNEL
+            # next channel in the lineup by bisect, cycling back to the lowest channel after the highest
+            before = self.state()
+            self.__channel = self.lineup.step(self.__channel, 1)
+            self.__channelChanged()
+            self.__record(before)
         
     def channel_down(self) -> None:
         """
         Decraments the channel variable until the minimum channel value is reached, after which it cycles to the maximum channel value
         """
         if self.powered():
-            if self.__channel > TVRemote.MIN_CHANNEL:
-                self.__channel -= 1
-            else:
-                # Cycles back to max channel called at min value
-                self.__channel = TVRemote.MAX_CHANNEL
+            # previous channel in the lineup by bisect, cycling to the highest channel below the lowest
+            before = self.state()
+            self.__channel = self.lineup.step(self.__channel, -1)
+            self.__channelChanged()
+            self.__record(before)
         
     def volume_up(self) -> None:
         """
         Incraments the volume variable until the maximum volume value is reached.
         """
         if self.powered():
+            before = self.state()
             if self.muted():
-                # automatically unmutes tv
+                # automatically unmutes tv, as part of this action rather than an undo step of its own
+                nested, self.__nested = self.__nested, True
                 self.mute()
+                self.__nested = nested
             if self.__volume < TVRemote.MAX_VOLUME:
                 self.__volume += 1
-        self.volumeBar.setProperty("value", self.getVolume())
+            self.__record(before)
+        self.__scheduleVolumeBar()
     
     def volume_down(self) -> None:
         """
         Decrements the volume variable until the minimum volume vaule is reached.
         """
         if self.powered():
+            before = self.state()
             if self.muted():
-                # automatically unmutes tv
+                # automatically unmutes tv, as part of this action rather than an undo step of its own
+                nested, self.__nested = self.__nested, True
                 self.mute()
+                self.__nested = nested
             if self.__volume > TVRemote.MIN_VOLUME:
                 self.__volume -= 1
-        self.volumeBar.setProperty("value", self.getVolume())
+            self.__record(before)
+        self.__scheduleVolumeBar()
         
     def set_channel(self, value: int) -> None:
         """
@@ -165,9 +312,69 @@ class TVRemote(QMainWindow, RemoteGUI):
         :param value: The integer value representing a user-inputted channel
         """
         if self.powered():
+            before = self.state()
             self.__channel = value
+            self.__channelChanged()
+            self.__record(before)
+
+    def enter_digit(self, digit: int) -> None:
+        """
+        Adds a digit to the channel number being typed. The number is tuned as soon as no longer channel in the
+        lineup starts with it, or DIGIT_TIMEOUT ms after the last digit otherwise.
+        :param digit: The digit pressed, 0 to 9
+        """
+        if not self.powered():
+            return
+        self.__digits += str(digit)
+        if self.lineup.extendable(int(self.__digits), len(self.__digits)):
+            self.__digitTimer.start()
+        else:
+            self.__commitDigits()
+
+    def apply(self, script: str) -> None:
+        """
+        Applies a batch of presses such as "POWER, VOL+ x50, CH- x13, 7" in closed form (see commands.py),
+        with a single volumeBar update for the whole batch
+        :param script: The comma-separated batch
+        """
+        before = self.state()
+        self.__status, self.__muted, self.__volume, self.__channel = fold(
+            (self.__status, self.__muted, self.__volume, self.__channel), parse(script),
+            (TVRemote.MIN_VOLUME, TVRemote.MAX_VOLUME, TVRemote.MIN_CHANNEL, TVRemote.MAX_CHANNEL), self.lineup)
+        self.__scheduleVolumeBar()
+        self.__channelChanged()
+        self.__record(before)
+
+    def undo(self) -> bool:
+        """
+        Reverts the last action, restoring the model and the volumeBar in O(1)
+        :return: True if there was an action to undo
+        """
+        state = self.history.undo(self.state())
+        if state is None:
+            return False
+        self.__restore(state)
+        return True
+
+    def redo(self) -> bool:
+        """
+        Repeats the last undone action, restoring the model and the volumeBar in O(1)
+        :return: True if there was an action to redo
+        """
+        state = self.history.redo(self.state())
+        if state is None:
+            return False
+        self.__restore(state)
+        return True
 
     ### Accessors ###
+    def state(self) -> int:
+        """
+        Returns the whole tv state as one integer, in the compact.pack() layout used by the undo history
+        :return: the packed state
+        """
+        return pack(self.__status, self.__muted, self.__volume, self.__channel)
+
     def powered(self) -> bool:
         """
         Returns the state of the status boolean
@@ -188,6 +395,13 @@ class TVRemote(QMainWindow, RemoteGUI):
         :return: 0 if the tv is muted or self.__volume otherwise
         """
         return 0 if self.muted() else self.__volume
+
+    def storedVolume(self) -> int:
+        """
+        Returns the integer value of volume, including while muted, which getVolume() hides
+        :return: self.__volume
+        """
+        return self.__volume
         
     def getChannel(self) -> int:
         """
@@ -195,6 +409,16 @@ class TVRemote(QMainWindow, RemoteGUI):
         :return: self.__channel
         """
         return self.__channel
+
+    def nowPlaying(self) -> str:
+        """
+        Returns the title of the programme on the current channel, from the memory-mapped guide index
+        :return: the title, or "" without a guide, while the tv is off, or when nothing is on
+        """
+        if self.guide is None or not self.powered():
+            return ""
+        programme = self.guide.now(self.__channel)
+        return programme[0] if programme else ""
         
     def __str__(self) -> str:
         """
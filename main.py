@@ -4,25 +4,249 @@
 :Description:
 
 Executes the program to prompt a user with a UI used to help compute a bill of sale.
+
+Usage:
+    python main.py [--lineup FILE]       opens the remote GUI, limited to the channels listed in FILE (see lineup.py)
+                   [--guide XMLTV]       and showing the programme on the current channel (see guide.py)
+                   [--tune-delay SEC]    and switching channels on a simulated tuner with prefetch (see tuner.py)
+                   [--sleep MIN]         and powering the tv off after MIN minutes (see scheduler.py)
+                   [--keypad FILE]       and adding the extra buttons listed in FILE (see gui.load_layout)
+                   [--ir FILE]           and sending every button press as IR to a .wav or mode2 FILE (see ir.py)
+                   [--ir-protocol P]     in the nec (default) or rc5 protocol
+    python main.py --headless [SCRIPT]   drives the remote from SCRIPT (or stdin) without importing Qt
+                   [--ir FILE]           sending every command as IR, as in the GUI
+    python main.py --measure-startup     reports cold-start time of both paths
+
+Set TVREMOTE_METRICS=PATH to record per-action call counts and latencies (see instrumentation.py) and write them to
+PATH in Prometheus text format while the GUI runs.
+
+Profiling is opt-in on both paths (see profiling.py): --profile PATH or TVREMOTE_PROFILE=PATH writes cProfile stats,
+--tracemalloc PATH or TVREMOTE_TRACEMALLOC=PATH appends allocation dumps, and in the GUI --stall-ms MS or
+TVREMOTE_STALL_MS=MS prints the main-thread stack whenever the event loop is blocked for longer than MS.
+
+Headless scripts hold one command per line: power, mute, channel_up, channel_down, volume_up, volume_down,
+set_channel N (or just N), status, and apply BATCH, which runs a batch such as "apply POWER, VOL+ x50, CH- x13, 7" in
+one step (see commands.py). Blank lines and lines starting with # are ignored.
 """
 ### Import packages ###
-from gui import *
-from logic import *
+# PyQt6, gui and logic are imported inside main_gui() so the headless path never pays for them
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from remote import Television
 
 ### Variable Declaration ###
+BUTTONS: frozenset = frozenset({"power", "mute", "channel_up", "channel_down", "volume_up", "volume_down"})
+METRICS_INTERVAL: int = 10_000 # ms between Prometheus dumps when TVREMOTE_METRICS is set
+
+### Class definition ###
+class HeadlessRemote(Television):
+    """
+    The Television logic with the limits of logic.TVRemote, used by the headless path.
+    The limits are repeated here because logic.py cannot be imported without loading Qt.
+    """
+    MAX_VOLUME: int = 100
+    MAX_CHANNEL: int = 9
 
 ### UDF Declaration ###
+def run_headless(lines, out=sys.stdout, err=sys.stderr, blaster=None) -> int:
+    """
+    Applies headless commands to a HeadlessRemote, printing the tv state after each one
+    :param lines: An iterable of command lines, such as an open file or sys.stdin
+    :param out: Stream the tv state is printed to
+    :param err: Stream errors are printed to
+    :param blaster: An ir.IRBlaster sent every command, or None
+    :return: 0 if every command was understood, 1 otherwise
+    """
+    tv = HeadlessRemote()
+    status = 0
+    for number, line in enumerate(lines, start=1):
+        words = line.split()
+        if not words or words[0].startswith("#"):
+            continue
+        command, args = words[0].lower(), words[1:]
+        if command.isdigit() and not args:
+            command, args = "set_channel", [command]
+        try:
+            if command in BUTTONS and not args:
+                value = None
+                getattr(tv, command)()
+            elif command == "set_channel" and len(args) == 1:
+                value = int(args[0])
+                tv.set_channel(value)
+            elif command == "apply" and args:
+                value = " ".join(args)
+                tv.apply(value)
+            elif command != "status" or args:
+                raise ValueError(f"unknown command {line.strip()!r}")
+            if blaster is not None and command != "status":
+                blaster.press(command, value)
+        except ValueError as error:
+            print(f"line {number}: {error}", file=err)
+            status = 1
+            continue
+        print(tv, file=out)
+    return status
 
-## Main Function ##
-def main():
+def main_gui(exit_after_start: bool = False, lineup: str = None, guide: str = None, tune_delay: float = None,
+             sleep: float = None, profiler=None, stall_ms: float = None, keypad: str = None, ir: str = None,
+             ir_protocol: str = "nec") -> int:
     """
     Callstack:
     main.py > logic.Logic() > gui.GUI().setupGUI()
+    :param exit_after_start: Quit as soon as the event loop starts, used to time startup
+    :param lineup: A channel lineup file for the remote
+    :param guide: An XMLTV file for the remote, indexed on first use
+    :param tune_delay: Seconds per tune of a simulated tuner behind the remote, or None for no tuner
+    :param sleep: Minutes until a sleep timer powers the tv off, or None for no timer
+    :param profiler: A profiling.Profiler run around the event loop and dumped periodically, or None
+    :param stall_ms: Milliseconds the event loop may be blocked before the watchdog records a stack, or None
+    :param keypad: A JSON file of extra keypad buttons, or None
+    :param ir: A .wav or mode2 file that stands in for an IR blaster, or None
+    :param ir_protocol: The IR protocol, "nec" or "rc5"
+    :return: the application exit code
     """
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QApplication
+    from gui import KEYPAD, load_layout
+    from logic import TVRemote
+    from lineup import ChannelLineup
+    import instrumentation
+
+    if guide:
+        from guide import ProgramGuide # loads NumPy, so only when a guide is wanted
+        guide = ProgramGuide(guide)
+
+    # the remote's own default lineup, built here so a tuner prefetches the same channels the remote can reach
+    lineup = ChannelLineup.load(lineup) if lineup else ChannelLineup(range(TVRemote.MIN_CHANNEL, TVRemote.MAX_CHANNEL + 1))
+    tuner = None
+    if tune_delay is not None:
+        from tuner import PrefetchingTuner, SimulatedTuner
+        tuner = PrefetchingTuner(SimulatedTuner(tune_delay), lineup)
+
     app = QApplication([]) # Generate an application
-    remote = TVRemote() # Calling Logic to initiate applet
+    remote = TVRemote(lineup, guide, tuner, load_layout(keypad) if keypad else KEYPAD) # Calling Logic to initiate applet
     remote.show() # Calls window to show
-    app.exec() # Execute application
+    if exit_after_start:
+        QTimer.singleShot(0, app.quit)
+
+    if instrumentation.enabled():
+        # TVRemote instrumented itself; dump its metrics periodically and once more on exit
+        instrumentation.METRICS.add_exporter(instrumentation.PrometheusFileExporter(os.environ[instrumentation.ENV_VARIABLE]))
+        exporter = QTimer(app)
+        exporter.timeout.connect(instrumentation.METRICS.export)
+        exporter.start(METRICS_INTERVAL)
+        app.aboutToQuit.connect(instrumentation.METRICS.export)
+    if sleep is not None:
+        from scheduler import POWER_OFF, Scheduler, attach_qt
+        scheduler = Scheduler()
+        attach_qt(scheduler, app)
+        scheduler.schedule_in(sleep * 60, remote, POWER_OFF)
+    if ir:
+        from ir import IRBlaster # loads NumPy, so only when IR output is wanted
+        blaster = IRBlaster.to_file(ir, ir_protocol)
+        blaster.attach(remote)
+        app.aboutToQuit.connect(blaster.close)
+    if tuner is not None:
+        app.aboutToQuit.connect(lambda : print(f"tuner: {tuner.report()}"))
+        app.aboutToQuit.connect(tuner.close)
+    if stall_ms:
+        from profiling import StallWatchdog
+        watchdog = StallWatchdog(stall_ms, parent=app)
+        watchdog.start()
+        app.aboutToQuit.connect(watchdog.stop)
+        app.aboutToQuit.connect(lambda : print(watchdog.report(), file=sys.stderr))
+    if profiler is None:
+        return app.exec() # Execute application
+
+    from profiling import DUMP_INTERVAL
+    dumper = QTimer(app)
+    dumper.timeout.connect(profiler.dump)
+    dumper.start(DUMP_INTERVAL)
+    profiler.start()
+    try:
+        return app.exec()
+    finally:
+        profiler.stop()
+
+def measure_startup(runs: int = 5) -> dict:
+    """
+    Times cold starts of the headless and GUI paths in fresh interpreters, using the offscreen Qt platform for the GUI
+    :param runs: The number of starts per path
+    :return: dictionary of path name to median seconds
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    paths = {
+        "headless": [sys.executable, __file__, "--headless"],
+        "gui": [sys.executable, __file__, "--exit-after-start"],
+    }
+    results = {}
+    for name, command in paths.items():
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run(command, input=b"", env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            samples.append(time.perf_counter() - start)
+        results[name] = statistics.median(samples)
+    return results
+
+## Main Function ##
+def main(argv: list = None) -> int:
+    """
+    Parses the command line and starts the requested path
+    :param argv: Command line arguments, defaulting to sys.argv[1:]
+    :return: the process exit code
+    """
+    parser = argparse.ArgumentParser(description="TV remote")
+    parser.add_argument("--headless", action="store_true", help="drive the remote from commands instead of the GUI")
+    parser.add_argument("script", nargs="?", help="headless command file, defaulting to stdin")
+    parser.add_argument("--lineup", help="channel lineup file for the GUI")
+    parser.add_argument("--guide", help="XMLTV program guide for the GUI")
+    parser.add_argument("--tune-delay", type=float, help="seconds per channel change on a simulated tuner")
+    parser.add_argument("--sleep", type=float, help="minutes until the tv powers itself off")
+    parser.add_argument("--keypad", help="JSON file of extra buttons for the GUI")
+    parser.add_argument("--ir", metavar="FILE", help="send button presses as IR to a .wav or mode2 timing file")
+    parser.add_argument("--ir-protocol", choices=("nec", "rc5"), default="nec", help="IR protocol for --ir")
+    parser.add_argument("--profile", metavar="PATH", help="write cProfile stats to PATH")
+    parser.add_argument("--tracemalloc", metavar="PATH", help="append allocation dumps to PATH")
+    parser.add_argument("--stall-ms", type=float, help="report event-loop stalls longer than this many ms")
+    parser.add_argument("--measure-startup", action="store_true", help="report cold-start time of both paths")
+    parser.add_argument("--exit-after-start", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.measure_startup:
+        runs = 5
+        for name, seconds in measure_startup(runs).items():
+            print(f"{name:>8}: {seconds * 1000:7.1f} ms median over {runs} runs")
+        return 0
+    profiler = None
+    if args.profile or args.tracemalloc or os.environ.get("TVREMOTE_PROFILE") or os.environ.get("TVREMOTE_TRACEMALLOC"):
+        from profiling import Profiler
+        profiler = Profiler.from_environment(args.profile, args.tracemalloc)
+        profiler.trace() # from the start, so startup allocations are seen too
+    if args.headless:
+        blaster = None
+        if args.ir:
+            from ir import IRBlaster
+            blaster = IRBlaster.to_file(args.ir, args.ir_protocol)
+        if profiler is not None:
+            profiler.start()
+        try:
+            if args.script:
+                with open(args.script, encoding="utf-8") as script:
+                    return run_headless(script, blaster=blaster)
+            return run_headless(sys.stdin, blaster=blaster)
+        finally:
+            if profiler is not None:
+                profiler.stop()
+            if blaster is not None:
+                blaster.close()
+    stall_ms = args.stall_ms or float(os.environ.get("TVREMOTE_STALL_MS") or 0) or None
+    return main_gui(args.exit_after_start, args.lineup, args.guide, args.tune_delay, args.sleep, profiler, stall_ms,
+                    args.keypad, args.ir, args.ir_protocol)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,424 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script serves a fleet of virtual tvs over the network with asyncio, the way a hotel head-end controls its sets.
+It also houses the matching async client and a load generator that reports command latency and throughput.
+
+Protocol (TCP lines or UDP datagrams, ASCII):
+    request:  DEVICE ACTION [VALUE]           e.g. "lobby-3 set_channel 7", "lobby-3 get"; only set_channel takes a VALUE, a
+                                              non-negative channel
+    batch:    several requests joined by ";"   answered by one response line, results joined by ";"
+    response: POWER MUTE VOLUME CHANNEL        e.g. "1 0 12 7", or "ERR message"
+Clients may pipeline: requests are answered in order, and a connection stops being read while its replies back up.
+
+Usage:
+    python netserver.py serve [--host H] [--port P]
+    python netserver.py load [--host H] [--port P] [--connections N] [--commands N] [--depth N]
+    python netserver.py bench [--connections N] ...     starts a local server and runs the load generator against it
+For 10k+ connections run serve and load as separate processes, since bench needs two descriptors per connection.
+"""
+
+### Import packages ###
+import argparse
+import asyncio
+import gc
+import random
+import statistics
+import time
+from compact import CompactTelevision
+from replay import ACTIONS
+
+### Variable Declaration ###
+DEFAULT_PORT: int = 5151
+BUTTONS: list = sorted(ACTIONS - {"set_channel"})
+
+### Class definition ###
+class TVServer:
+    """
+    A class holding the fleet of virtual tvs and serving it over TCP and UDP
+
+    Attributes
+    ----------
+    devices : dict
+        Maps each device id to its tv object, created on first use
+    commands : int
+        The number of requests handled
+
+    Methods
+    -------
+    execute(line):
+        Applies one request or batch line and returns its response line
+    start(host, port, udp):
+        Starts listening, returning once the sockets are bound
+    close():
+        Stops listening and waits for the servers to shut down
+    """
+
+    ### Constructors ###
+    def __init__(self, factory: type = CompactTelevision) -> None:
+        """
+        Constructs an empty fleet
+        :param factory: The class built for each new device id
+        """
+        self.factory: type = factory
+        self.devices: dict = {}
+        self.commands: int = 0
+        self.__tcp = None
+        self.__udp = None
+
+    ### Protocol ###
+    def __apply(self, request: str) -> str:
+        """
+        Applies a single request
+        :param request: "DEVICE ACTION [VALUE]"
+        :return: the state of the device after the request, or an error message
+        """
+        words = request.split()
+        if len(words) < 2:
+            return "ERR expected DEVICE ACTION [VALUE]"
+        device, action = words[0], words[1]
+        if action != "get" and action not in ACTIONS:
+            return f"ERR unknown action {action}"
+        if action == "set_channel":
+            if len(words) != 3 or not words[2].isdigit():
+                return "ERR set_channel needs a non-negative integer VALUE"
+        elif len(words) != 2:
+            return f"ERR {action} takes no VALUE"
+        tv = self.devices.get(device)
+        if tv is None:
+            tv = self.devices[device] = self.factory()
+        if action == "set_channel":
+            tv.set_channel(int(words[2]))
+        elif action != "get":
+            getattr(tv, action)()
+        self.commands += 1
+        return f"{tv.powered():d} {tv.muted():d} {tv.getVolume()} {tv.getChannel()}"
+
+    def execute(self, line: str) -> str:
+        """
+        Applies one request or a ";"-separated batch of requests
+        :param line: The request line, without its newline
+        :return: the response line, without its newline
+        """
+        if not line.isascii(): # undecodable bytes arrive as U+FFFD, which must not be echoed into an ASCII reply
+            return "ERR requests must be ASCII"
+        if ";" in line:
+            return ";".join(self.__apply(request) for request in line.split(";"))
+        return self.__apply(line)
+
+    async def __handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serves one TCP connection. The reader stops pulling from the socket when its buffer fills, and drain()
+        stops reading new requests while the replies are backed up, so slow clients are throttled instead of buffered.
+        :param reader: The connection's stream reader
+        :param writer: The connection's stream writer
+        """
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError: # longer than the stream limit; the reader has dropped what it buffered
+                    writer.write(b"ERR request too long\n")
+                    await writer.drain()
+                    continue
+                if not line:
+                    break
+                writer.write(self.execute(line.decode("ascii", "replace").strip()).encode("ascii", "replace") + b"\n")
+                # drain only waits when the transport is above its high-water mark
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    ### Lifecycle ###
+    async def start(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT, udp: bool = True) -> int:
+        """
+        Starts the TCP server, and the UDP endpoint on the same port if udp is set
+        :param host: The address to bind
+        :param port: The port to bind, or 0 for any free port
+        :param udp: Whether to also answer UDP datagrams
+        :return: the bound TCP port
+        """
+        self.__tcp = await asyncio.start_server(self.__handle, host, port, backlog=4096)
+        port = self.__tcp.sockets[0].getsockname()[1]
+        if udp:
+            loop = asyncio.get_running_loop()
+            self.__udp, _ = await loop.create_datagram_endpoint(lambda: _DatagramProtocol(self), local_addr=(host, port))
+        return port
+
+    async def close(self) -> None:
+        """
+        Stops listening on every socket
+        """
+        if self.__udp is not None:
+            self.__udp.close()
+        if self.__tcp is not None:
+            self.__tcp.close()
+            await self.__tcp.wait_closed()
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    """
+    Answers each UDP datagram with one response datagram
+    """
+
+    def __init__(self, server: TVServer) -> None:
+        """
+        :param server: The server whose fleet the datagrams act on
+        """
+        self.server: TVServer = server
+        self.transport = None
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self.transport.sendto(self.server.execute(data.decode("ascii", "replace").strip()).encode("ascii", "replace"), addr)
+
+class TVClient:
+    """
+    An async TCP client for TVServer. Requests may be pipelined: send() can be awaited from many tasks at once,
+    and replies are matched to requests in order.
+
+    Methods
+    -------
+    connect(host, port):
+        Opens the connection and starts the reply reader
+    send(device, action, value):
+        Sends one request and returns its response line
+    batch(requests):
+        Sends several (device, action, value) requests in one line and returns their responses
+    close():
+        Closes the connection
+    """
+
+    ### Constructors ###
+    def __init__(self) -> None:
+        """
+        Constructs an unconnected client
+        """
+        self.__reader = None
+        self.__writer = None
+        self.__pending = None
+        self.__task = None
+
+    async def connect(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> "TVClient":
+        """
+        Opens the connection
+        :param host: The server address
+        :param port: The server port
+        :return: self, so calls can be chained
+        """
+        self.__reader, self.__writer = await asyncio.open_connection(host, port)
+        self.__pending = asyncio.Queue()
+        self.__task = asyncio.create_task(self.__read_replies())
+        return self
+
+    async def __read_replies(self) -> None:
+        """
+        Resolves pending requests in order as reply lines arrive
+        """
+        try:
+            while True:
+                line = await self.__reader.readline()
+                if not line:
+                    break
+                future = self.__pending.get_nowait()
+                if not future.done():
+                    future.set_result(line.decode("ascii").rstrip("\n"))
+        finally:
+            while not self.__pending.empty():
+                future = self.__pending.get_nowait()
+                if not future.done():
+                    future.set_exception(ConnectionError("connection closed"))
+
+    async def __request(self, line: str) -> str:
+        """
+        Writes a request line and waits for its reply
+        :param line: The request line, without its newline
+        :return: the response line
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.__pending.put_nowait(future)
+        self.__writer.write(line.encode("ascii") + b"\n")
+        await self.__writer.drain()
+        return await future
+
+    ### Requests ###
+    async def send(self, device: str, action: str, value: int = None) -> str:
+        """
+        Sends one request
+        :param device: The device id
+        :param action: A Television method name or "get"
+        :param value: The channel, for set_channel
+        :return: the response line
+        """
+        return await self.__request(f"{device} {action}" if value is None else f"{device} {action} {value}")
+
+    async def batch(self, requests) -> list:
+        """
+        Sends several requests as one batch line
+        :param requests: An iterable of (device, action, value) tuples, with value None for buttons
+        :return: list of response strings, one per request
+        """
+        line = ";".join(f"{d} {a}" if v is None else f"{d} {a} {v}" for d, a, v in requests)
+        return (await self.__request(line)).split(";")
+
+    async def close(self) -> None:
+        """
+        Closes the connection
+        """
+        self.__writer.close()
+        try:
+            await self.__writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self.__task
+
+### UDF Declaration ###
+def raise_file_limit() -> None:
+    """
+    Raises the soft open-file limit to the hard limit, since every connection holds a descriptor
+    (two when the server and load generator share a process)
+    """
+    try:
+        import resource
+    except ImportError: # not available on Windows
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    try:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    except (ValueError, OSError): # an unlimited hard limit can't be copied into the soft limit
+        pass
+
+def percentile(samples: list, fraction: float) -> float:
+    """
+    Returns a percentile of sorted samples by nearest rank
+    :param samples: Sorted list of numbers
+    :param fraction: The percentile as a fraction, such as 0.99
+    :return: the sample at that rank
+    """
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+async def load(host: str = "127.0.0.1", port: int = DEFAULT_PORT, connections: int = 100, commands: int = 1000,
+               depth: int = 8, devices: int = 10_000, seed: int = 0) -> dict:
+    """
+    Opens many connections and has each send commands with up to depth requests in flight, timing every request
+    :param host: The server address
+    :param port: The server port
+    :param connections: The number of concurrent connections. 10k+ needs a raised open-file limit (ulimit -n).
+    :param commands: The number of requests per connection
+    :param depth: The number of pipelined requests in flight per connection
+    :param devices: The number of device ids requests are spread over
+    :param seed: The random seed
+    :return: dictionary with commands, seconds, rate, p50 and p99 (seconds)
+    """
+    rng = random.Random(seed)
+    latencies = []
+
+    async def worker(client: TVClient) -> None:
+        async def one() -> None:
+            device = f"tv-{rng.randrange(devices)}"
+            action = rng.choice(BUTTONS) if rng.random() > 0.15 else "set_channel"
+            value = rng.randint(CompactTelevision.MIN_CHANNEL, CompactTelevision.MAX_CHANNEL) if action == "set_channel" else None
+            start = time.perf_counter()
+            await client.send(device, action, value)
+            latencies.append(time.perf_counter() - start)
+
+        for sent in range(0, commands, depth):
+            await asyncio.gather(*(one() for _ in range(min(depth, commands - sent))))
+
+    # open connections in waves so the listen backlog never overflows into SYN retries
+    opening = asyncio.Semaphore(256)
+    async def connect() -> TVClient:
+        async with opening:
+            return await TVClient().connect(host, port)
+
+    clients = await asyncio.gather(*(connect() for _ in range(connections)))
+    # thousands of live connections make every full collection crawl; they outlive the run, so park them outside the GC
+    gc.collect()
+    gc.freeze()
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for client in clients))
+        seconds = time.perf_counter() - start
+    finally:
+        gc.unfreeze()
+    await asyncio.gather(*(client.close() for client in clients))
+
+    latencies.sort()
+    return {
+        "commands": len(latencies),
+        "seconds": seconds,
+        "rate": len(latencies) / seconds,
+        "p50": percentile(latencies, 0.50),
+        "p99": percentile(latencies, 0.99),
+        "mean": statistics.fmean(latencies),
+    }
+
+def report(results: dict, connections: int) -> None:
+    """
+    Prints a load generator result
+    :param results: The dictionary returned by load()
+    :param connections: The number of connections used
+    """
+    print(f"{results['commands']:,} commands over {connections:,} connections in {results['seconds']:.2f}s "
+          f"- {results['rate']:,.0f} commands/s, p50 {results['p50'] * 1e3:.2f} ms, p99 {results['p99'] * 1e3:.2f} ms")
+
+async def bench(connections: int, commands: int, depth: int) -> dict:
+    """
+    Starts a local server on a free port and runs the load generator against it
+    :param connections: The number of concurrent connections
+    :param commands: The number of requests per connection
+    :param depth: The number of pipelined requests in flight per connection
+    :return: the dictionary returned by load()
+    """
+    server = TVServer()
+    port = await server.start(port=0, udp=False)
+    try:
+        return await load(port=port, connections=connections, commands=commands, depth=depth)
+    finally:
+        await server.close()
+
+async def serve(host: str, port: int) -> None:
+    """
+    Runs the server until interrupted
+    :param host: The address to bind
+    :param port: The port to bind
+    """
+    server = TVServer()
+    port = await server.start(host, port)
+    print(f"Serving tvs on {host}:{port} (tcp and udp)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+## Main Function ##
+def main() -> None:
+    """
+    Parses the command line and runs the server, the load generator or both
+    """
+    parser = argparse.ArgumentParser(description="Network control server for virtual tvs")
+    parser.add_argument("mode", choices=["serve", "load", "bench"])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--commands", type=int, default=1000, help="requests per connection")
+    parser.add_argument("--depth", type=int, default=8, help="pipelined requests in flight per connection")
+    args = parser.parse_args()
+    raise_file_limit()
+
+    if args.mode == "serve":
+        try:
+            asyncio.run(serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+    elif args.mode == "load":
+        report(asyncio.run(load(args.host, args.port, args.connections, args.commands, args.depth)), args.connections)
+    else:
+        report(asyncio.run(bench(args.connections, args.commands, args.depth)), args.connections)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses the opt-in profiling hooks used by main.py for finding out why the remote feels laggy.
+
+Profiler runs cProfile around the event loop (or the headless script), and tracemalloc from startup. Both are dumped
+every DUMP_INTERVAL ms while the GUI runs and once more on exit: cProfile stats to a file pstats can load, and the top
+allocation sites, appended with a timestamp, to a text file.
+
+StallWatchdog measures event-loop latency with a heartbeat QTimer. A background thread watches the heartbeat, and when
+the main thread has not come back to the event loop for longer than a threshold, such as a button handler wired up in
+TVRemote.__init__ blocking, it records the main thread's stack at that moment, naming the innermost TVRemote frame.
+
+Everything is off unless asked for:
+    TVREMOTE_PROFILE=PATH       or --profile PATH       cProfile stats
+    TVREMOTE_TRACEMALLOC=PATH   or --tracemalloc PATH   allocation dumps
+    TVREMOTE_STALL_MS=MS        or --stall-ms MS        stall watchdog, stacks written to stderr
+"""
+
+### Import packages ###
+import cProfile
+import os
+import sys
+import threading
+import time
+import traceback
+import tracemalloc
+from instrumentation import LatencyHistogram
+
+### Variable Declaration ###
+ENV_PROFILE: str = "TVREMOTE_PROFILE"
+ENV_TRACEMALLOC: str = "TVREMOTE_TRACEMALLOC"
+ENV_STALL: str = "TVREMOTE_STALL_MS"
+DUMP_INTERVAL: int = 30_000 # ms between profile dumps while the GUI runs
+TRACE_FRAMES: int = 10 # frames kept per allocation traceback
+TOP_ALLOCATIONS: int = 25 # allocation sites per dump
+HEARTBEAT: int = 20 # ms between event-loop heartbeats
+HANDLER_FILE: str = "logic.py" # frames from this file name the handler that stalled
+
+### Class definition ###
+class Profiler:
+    """
+    A class capturing cProfile and tracemalloc data for one run
+
+    Attributes
+    ----------
+    profile : str
+        The cProfile stats file, or None
+    allocations : str
+        The tracemalloc dump file, or None
+
+    Methods
+    -------
+    from_environment(profile, allocations):
+        Returns a Profiler for the requested paths, falling back to the environment variables
+    trace():
+        Starts tracemalloc, as early as possible
+    start() / stop():
+        Start and stop cProfile, stop() also dumping everything a last time
+    dump():
+        Writes the data gathered so far
+    """
+
+    ### Constructors ###
+    def __init__(self, profile: str = None, allocations: str = None) -> None:
+        """
+        :param profile: The cProfile stats file, or None
+        :param allocations: The tracemalloc dump file, or None
+        """
+        self.profile: str = profile
+        self.allocations: str = allocations
+        self.__profiler: cProfile.Profile = None
+
+    @classmethod
+    def from_environment(cls, profile: str = None, allocations: str = None) -> "Profiler":
+        """
+        Builds a Profiler from command-line paths, using TVREMOTE_PROFILE and TVREMOTE_TRACEMALLOC for any not given
+        :param profile: The --profile path, or None
+        :param allocations: The --tracemalloc path, or None
+        :return: a Profiler, or None if nothing was requested
+        """
+        profile = profile or os.environ.get(ENV_PROFILE) or None
+        allocations = allocations or os.environ.get(ENV_TRACEMALLOC) or None
+        return cls(profile, allocations) if profile or allocations else None
+
+    ### Mutators ###
+    def trace(self) -> None:
+        """
+        Starts tracemalloc if allocations were requested
+        """
+        if self.allocations and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+
+    def start(self) -> None:
+        """
+        Starts cProfile if a profile was requested
+        """
+        self.trace()
+        if self.profile:
+            self.__profiler = cProfile.Profile()
+            self.__profiler.enable()
+
+    def dump(self) -> None:
+        """
+        Writes the cProfile stats gathered so far, and appends the current top allocation sites
+        """
+        if self.__profiler is not None:
+            self.__profiler.disable()
+            self.__profiler.dump_stats(self.profile)
+            self.__profiler.enable()
+        if self.allocations and tracemalloc.is_tracing():
+            statistics = tracemalloc.take_snapshot().statistics("lineno")
+            current, peak = tracemalloc.get_traced_memory()
+            with open(self.allocations, "a", encoding="utf-8") as file:
+                file.write(f"# {time.strftime('%Y-%m-%d %H:%M:%S')} traced {current / 1024:.1f} KiB, "
+                           f"peak {peak / 1024:.1f} KiB\n")
+                for statistic in statistics[:TOP_ALLOCATIONS]:
+                    file.write(f"{statistic}\n")
+                file.write("\n")
+
+    def stop(self) -> None:
+        """
+        Dumps everything a last time and stops both profilers
+        """
+        self.dump()
+        if self.__profiler is not None:
+            self.__profiler.disable()
+            self.__profiler = None
+        if self.allocations:
+            tracemalloc.stop()
+
+class StallWatchdog:
+    """
+    A class detecting event-loop stalls on the main thread
+
+    Attributes
+    ----------
+    threshold : float
+        Seconds without a heartbeat before a stall is recorded
+    latency : LatencyHistogram
+        Nanoseconds each heartbeat arrived late, a measure of event-loop latency
+    stalls : list
+        One dictionary per stall, holding the handler, its stack and how long the loop was blocked in ms
+
+    Methods
+    -------
+    start() / stop():
+        Start and stop the heartbeat and the watching thread
+    report():
+        Summarises event-loop latency and the stalls seen
+    """
+
+    ### Constructors ###
+    def __init__(self, threshold_ms: float, heartbeat_ms: int = HEARTBEAT, out=sys.stderr, parent=None) -> None:
+        """
+        :param threshold_ms: Milliseconds the main thread may stay away from the event loop
+        :param heartbeat_ms: Milliseconds between heartbeats
+        :param out: Where stall stacks are written as they are caught, or None
+        :param parent: The QObject owning the heartbeat timer
+        """
+        from PyQt6.QtCore import QTimer, Qt # only the GUI path runs the watchdog
+
+        self.threshold: float = threshold_ms / 1000
+        self.latency: LatencyHistogram = LatencyHistogram()
+        self.stalls: list = []
+        self.out = out
+        self.__interval: int = heartbeat_ms
+        self.__main: int = threading.main_thread().ident
+        self.__beat: float = time.perf_counter()
+        self.__reported: float = None # the heartbeat whose stall was recorded
+        self.__stop = threading.Event()
+        self.__thread: threading.Thread = None
+        self.__timer = QTimer(parent)
+        self.__timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.__timer.setInterval(heartbeat_ms)
+        self.__timer.timeout.connect(self.__heartbeat)
+
+    def start(self) -> None:
+        """
+        Starts the heartbeat and the thread watching it
+        """
+        self.__beat = time.perf_counter()
+        self.__stop.clear()
+        self.__timer.start()
+        self.__thread = threading.Thread(target=self.__watch, name="stall-watchdog", daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the heartbeat and waits for the watching thread to exit
+        """
+        self.__timer.stop()
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    ### Heartbeat ###
+    def __heartbeat(self) -> None:
+        """
+        Runs on the main thread: records how late this beat was, and how long a recorded stall lasted
+        """
+        now = time.perf_counter()
+        late = now - self.__beat - self.__interval / 1000
+        self.latency.record(max(0, int(late * 1e9)))
+        if self.__reported == self.__beat:
+            self.stalls[-1]["blocked_ms"] = (now - self.__beat) * 1000
+        self.__beat = now
+
+    def __watch(self) -> None:
+        """
+        Runs on the watching thread: records the main thread's stack once per heartbeat that is overdue
+        """
+        while not self.__stop.wait(min(self.threshold / 4, self.__interval / 1000)):
+            beat = self.__beat
+            if beat == self.__reported or time.perf_counter() - beat < self.threshold:
+                continue
+            frame = sys._current_frames().get(self.__main)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            handler = next((f"{entry.name} ({os.path.basename(entry.filename)}:{entry.lineno})" for entry in reversed(stack)
+                            if os.path.basename(entry.filename) == HANDLER_FILE), "unknown")
+            self.stalls.append({"handler": handler, "stack": "".join(stack.format()),
+                                "blocked_ms": (time.perf_counter() - beat) * 1000})
+            self.__reported = beat
+            if self.out is not None:
+                print(f"stall: event loop blocked over {self.threshold * 1000:.0f} ms in {handler}\n"
+                      f"{self.stalls[-1]['stack']}", file=self.out, flush=True)
+
+    ### Accessors ###
+    def report(self) -> str:
+        """
+        Summarises event-loop latency and the stalls seen
+        :return: string of heartbeat lateness percentiles and each stall's handler and duration
+        """
+        latency = self.latency
+        lines = [f"event loop: {latency.count} heartbeats, late by p50 {latency.percentile(0.5) / 1e6:.1f} ms, "
+                 f"p99 {latency.percentile(0.99) / 1e6:.1f} ms, max {latency.maximum / 1e6:.1f} ms; {len(self.stalls)} stall(s)"]
+        for stall in self.stalls:
+            lines.append(f"  {stall['blocked_ms']:.0f} ms in {stall['handler']}")
+        return "\n".join(lines)
@@ -5,6 +5,9 @@
 This script houses the methods used in TVRemote in logic.py. This is called in test_television.py to test their behavior
 """
 
+### Import packages ###
+from commands import fold, parse
+
 ### Class definition ###
 class Television:
     
@@ -39,10 +42,8 @@ class Television:
         if self.powered():
             if self.muted():
                 self.__muted = False
-                self.volumeBar.setProperty("value", self.getVolume())
             else:
                 self.__muted = True
-                self.volumeBar.setProperty("value", 0)
 
     def channel_up(self) -> None:
         """
@@ -99,6 +100,15 @@ class Television:
         """
         if self.powered():
             self.__channel = value
+
+    def apply(self, script: str) -> None:
+        """
+        Applies a batch of presses such as "POWER, VOL+ x50, CH- x13, 7" in closed form (see commands.py)
+        :param script: The comma-separated batch
+        """
+        self.__status, self.__muted, self.__volume, self.__channel = fold(
+            (self.__status, self.__muted, self.__volume, self.__channel), parse(script),
+            (self.MIN_VOLUME, self.MAX_VOLUME, self.MIN_CHANNEL, self.MAX_CHANNEL))
             
     ### Accessors ###
     def powered(self) -> bool:
@@ -121,6 +131,13 @@ class Television:
         :return: 0 if the tv is muted or self.__volume otherwise
         """
         return 0 if self.muted() else self.__volume
+
+    def storedVolume(self) -> int:
+        """
+        Returns the integer value of volume, including while muted, which getVolume() hides
+        :return: self.__volume
+        """
+        return self.__volume
         
     def getChannel(self) -> int:
         """
@@ -0,0 +1,259 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script rebuilds tv state from captured button-event logs. Events are streamed from JSONL or CSV files through
+generators, dispatched to the matching method of one tv object per device id, and periodic state checkpoints are
+yielded while the log is consumed. A throughput report is available once the log has been replayed.
+
+Log formats (one event per line):
+    JSONL: {"device": "lobby-3", "action": "set_channel", "value": 7}
+    CSV:   device,action,value    (an optional header row is skipped, value is empty for buttons)
+
+Usage:
+    python replay.py LOG [--checkpoint-every N]
+    python replay.py --synthesize LOG COUNT [--devices N]
+"""
+
+### Import packages ###
+import argparse
+import csv
+import json
+import random
+import time
+from compact import CompactTelevision
+
+### Variable Declaration ###
+# Television methods an event may name. set_channel is the only one that takes a value.
+ACTIONS: frozenset = frozenset({"power", "mute", "channel_up", "channel_down", "volume_up", "volume_down", "set_channel"})
+
+### UDF Declaration ###
+def read_jsonl(path: str):
+    """
+    Streams events from a JSONL log, one line at a time
+    :param path: The path of the log file
+    :return: generator of (device, action, value) tuples, where value is None for buttons
+    """
+    loads = json.loads
+    with open(path, encoding="utf-8") as log:
+        for line in log:
+            if line.strip():
+                event = loads(line)
+                yield event["device"], event["action"], event.get("value")
+
+def read_csv(path: str):
+    """
+    Streams events from a CSV log, one row at a time
+    :param path: The path of the log file
+    :return: generator of (device, action, value) tuples, where value is None for buttons
+    """
+    with open(path, newline="", encoding="utf-8") as log:
+        rows = csv.reader(log)
+        for number, row in enumerate(rows):
+            if not row or number == 0 and row[0] == "device": # only the first row can be the header
+                continue
+            yield row[0], row[1], int(row[2]) if len(row) > 2 and row[2] else None
+
+def read_events(path: str):
+    """
+    Streams events from a log, choosing the reader by file extension
+    :param path: The path of a .jsonl or .csv log file
+    :return: generator of (device, action, value) tuples
+    """
+    if path.endswith(".csv"):
+        return read_csv(path)
+    return read_jsonl(path)
+
+def synthesize(path: str, count: int, devices: int = 1000, seed: int = 0) -> None:
+    """
+    Writes a random CSV event log, for benchmarking replay throughput
+    :param path: The path of the CSV file to write
+    :param count: The number of events
+    :param devices: The number of distinct device ids
+    :param seed: The random seed
+    """
+    rng = random.Random(seed)
+    buttons = sorted(ACTIONS - {"set_channel"})
+    with open(path, "w", newline="", encoding="utf-8") as log:
+        log.write("device,action,value\n")
+        for _ in range(count):
+            device = f"tv-{rng.randrange(devices)}"
+            if rng.random() < 0.15:
+                log.write(f"{device},set_channel,{rng.randint(CompactTelevision.MIN_CHANNEL, CompactTelevision.MAX_CHANNEL)}\n")
+            else:
+                log.write(f"{device},{rng.choice(buttons)},\n")
+
+### Class definition ###
+class ReplayReport:
+    """
+    A class holding the outcome of a replay
+
+    Attributes
+    ----------
+    events : int
+        The number of events applied
+    skipped : int
+        The number of events naming an unknown action, or with a value that does not match their action
+    devices : int
+        The number of distinct devices seen
+    checkpoints : int
+        The number of checkpoints emitted
+    seconds : float
+        Wall-clock time spent replaying
+    """
+
+    def __init__(self, events: int, skipped: int, devices: int, checkpoints: int, seconds: float) -> None:
+        """
+        Constructs the report
+        """
+        self.events: int = events
+        self.skipped: int = skipped
+        self.devices: int = devices
+        self.checkpoints: int = checkpoints
+        self.seconds: float = seconds
+
+    def rate(self) -> float:
+        """
+        Returns the replay throughput
+        :return: events per second
+        """
+        return self.events / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        """
+        Returns a one-line summary of the replay
+        :return: string of the event, device and checkpoint counts and the throughput
+        """
+        return (f"Replayed {self.events:,} events ({self.skipped:,} skipped) across {self.devices:,} devices "
+                f"in {self.seconds:.3f}s - {self.rate():,.0f} events/s, {self.checkpoints} checkpoints")
+
+class Replayer:
+    """
+    A class that applies streamed button events to one tv object per device id
+
+    Attributes
+    ----------
+    devices : dict
+        Maps each device id to its tv object
+    report : ReplayReport
+        The outcome of the last completed replay, or None
+
+    Methods
+    -------
+    replay(events):
+        Generator that applies events and yields (events applied, checkpoint) pairs every checkpoint_every events
+    run(events):
+        Applies every event, discarding checkpoints, and returns the report
+    checkpoint():
+        Returns the current state of every device
+    """
+
+    ### Constructors ###
+    def __init__(self, factory: type = CompactTelevision, checkpoint_every: int = 1_000_000) -> None:
+        """
+        Constructs an empty replayer
+        :param factory: The class built for each new device id. Any class with the Television interface works.
+        :param checkpoint_every: The number of events between checkpoints, or 0 to only checkpoint at the end
+        """
+        self.factory: type = factory
+        self.checkpoint_every: int = checkpoint_every
+        self.devices: dict = {}
+        self.report: ReplayReport = None
+        self.__methods: dict = {} # (device, action) -> bound method, so each event costs one dict lookup
+
+    ### Mutators ###
+    def __method(self, device: str, action: str):
+        """
+        Looks up and caches the bound method for an event, creating the device on first sight
+        :param device: The device id
+        :param action: The action name
+        :return: bound method, or None if action is unknown
+        """
+        if action not in ACTIONS:
+            return None
+        tv = self.devices.get(device)
+        if tv is None:
+            tv = self.devices[device] = self.factory()
+        method = self.__methods[device, action] = getattr(tv, action)
+        return method
+
+    def replay(self, events):
+        """
+        Applies events in order, yielding a checkpoint every checkpoint_every events and once more at the end
+        unless the last event already landed on a checkpoint
+        :param events: An iterable of (device, action, value) tuples, such as read_events(path)
+        :return: generator of (events applied, checkpoint) tuples
+        """
+        methods = self.__methods
+        lookup = self.__method
+        every = self.checkpoint_every
+        applied = skipped = checkpoints = 0
+        next_checkpoint = every or -1
+        start = time.perf_counter()
+        for device, action, value in events:
+            method = methods.get((device, action))
+            if method is None:
+                method = lookup(device, action)
+                if method is None:
+                    skipped += 1
+                    continue
+            try:
+                if value is None:
+                    method()
+                else:
+                    method(value)
+            except TypeError: # a value on a button, or set_channel without one
+                skipped += 1
+                continue
+            applied += 1
+            if applied == next_checkpoint:
+                next_checkpoint += every
+                checkpoints += 1
+                yield applied, self.checkpoint()
+        final = checkpoints == 0 or applied != next_checkpoint - every
+        checkpoints += final
+        self.report = ReplayReport(applied, skipped, len(self.devices), checkpoints, time.perf_counter() - start)
+        if final:
+            yield applied, self.checkpoint()
+
+    def run(self, events) -> ReplayReport:
+        """
+        Applies every event without keeping checkpoints
+        :param events: An iterable of (device, action, value) tuples
+        :return: the replay report
+        """
+        for _ in self.replay(events):
+            pass
+        return self.report
+
+    ### Accessors ###
+    def checkpoint(self) -> dict:
+        """
+        Returns the current state of every device
+        :return: dictionary of device id to (powered, muted, volume, channel), where volume reads 0 while muted
+        """
+        return {device: (tv.powered(), tv.muted(), tv.getVolume(), tv.getChannel()) for device, tv in self.devices.items()}
+
+## Main Function ##
+def main() -> None:
+    """
+    Replays a log file and prints a line per checkpoint followed by the throughput report
+    """
+    parser = argparse.ArgumentParser(description="Rebuild tv state from a button-event log")
+    parser.add_argument("log", help="JSONL or CSV event log")
+    parser.add_argument("count", nargs="?", type=int, help="number of events to write with --synthesize")
+    parser.add_argument("--checkpoint-every", type=int, default=1_000_000, help="events between checkpoints")
+    parser.add_argument("--synthesize", action="store_true", help="write a random CSV log instead of replaying")
+    parser.add_argument("--devices", type=int, default=1000, help="device ids used by --synthesize")
+    args = parser.parse_args()
+
+    if args.synthesize:
+        synthesize(args.log, args.count or 1_000_000, args.devices)
+        return
+    replayer = Replayer(checkpoint_every=args.checkpoint_every)
+    for applied, states in replayer.replay(read_events(args.log)):
+        print(f"checkpoint @ {applied:,} events: {len(states):,} devices")
+    print(replayer.report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses the Scheduler, which presses tv buttons at given times: sleep timers ("power off in 30 min") and
+scheduled tune-ins ("set_channel(7) at 20:00"), for single tvs or for devices of a fleet.TelevisionFleet.
+
+Pending events sit in one binary heap ordered by time, then by scheduling order, so an insert or a fire costs
+O(log n) whatever the number pending, and bulk scheduling heapifies in O(n). Cancelling marks the event and leaves it
+in the heap, and the heap is compacted once more than half of it is cancelled. Due fleet events with the same action
+and value are fired together as one vectorized fleet call, keeping each device's events in order.
+
+The scheduler does not wait on its own. run_asyncio() and attach_qt() sleep until the earliest pending event,
+waking early only when an earlier event is scheduled, so neither busy-waits.
+
+Running it directly benchmarks scheduling, cancelling and firing a million events over a fleet.
+"""
+
+### Import packages ###
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from operator import itemgetter
+import numpy as np
+
+### Variable Declaration ###
+# Actions beyond the tv methods. power toggles, which is wrong for a sleep timer on a tv that is already off.
+POWER_OFF: str = "power_off"
+POWER_ON: str = "power_on"
+MAX_QT_INTERVAL: int = 2**31 - 1 # ms, the longest single-shot QTimer
+BULK_THRESHOLD: int = 1024 # due events popped one by one before the rest are split off the heap in one pass
+
+### UDF Declaration ###
+def perform(target, action: str, value=None, devices=None) -> None:
+    """
+    Presses a button on a tv, or on some devices of a fleet
+    :param target: A Television, TVRemote or similar, or a TelevisionFleet
+    :param action: A method name, or POWER_OFF / POWER_ON
+    :param value: The channel for set_channel, None otherwise
+    :param devices: Fleet device indices, or None when target is a single tv
+    """
+    if devices is None:
+        if action == POWER_OFF or action == POWER_ON:
+            if target.powered() == (action == POWER_OFF):
+                target.power()
+        elif value is None:
+            getattr(target, action)()
+        else:
+            getattr(target, action)(value)
+        return
+    where = np.asarray(devices)
+    if action == POWER_OFF or action == POWER_ON:
+        target.power(where[target.powered()[where] == (action == POWER_OFF)])
+    elif value is None:
+        getattr(target, action)(where)
+    else:
+        getattr(target, action)(value, where)
+
+def at(hour: int, minute: int = 0, now: float = None) -> float:
+    """
+    Returns the next local time of day at hour:minute, for scheduling such as "at 20:00"
+    :param hour: The hour, 0 to 23
+    :param minute: The minute
+    :param now: Unix seconds to count from, defaulting to now
+    :return: unix seconds, today if that time is still ahead and tomorrow otherwise
+    """
+    now = time.time() if now is None else now
+    today = time.localtime(now)
+    when = time.mktime((today.tm_year, today.tm_mon, today.tm_mday, hour, minute, 0, 0, 0, -1))
+    if when <= now:
+        when = time.mktime((today.tm_year, today.tm_mon, today.tm_mday + 1, hour, minute, 0, 0, 0, -1))
+    return when
+
+### Class definition ###
+class Scheduler:
+    """
+    A class holding timed tv actions in a binary heap
+
+    Attributes
+    ----------
+    clock
+        Returns the current time in seconds, time.time by default so events can be set for a time of day
+    fired : int
+        The number of events fired
+    listener
+        Called with the new earliest time whenever an insert makes it earlier, so a driver can wake up; None if unused
+
+    Methods
+    -------
+    schedule(when, target, action, value, device) / schedule_in(delay, ...):
+        Adds one event, returning a handle for cancel()
+    schedule_many(events):
+        Adds many events at once
+    cancel(handle):
+        Drops a pending event
+    next_time():
+        Returns the time of the earliest pending event
+    run_due(now):
+        Fires every event that is due
+    """
+
+    ### Constructors ###
+    def __init__(self, clock=time.time) -> None:
+        """
+        :param clock: Returns the current time in seconds
+        """
+        self.clock = clock
+        self.fired: int = 0
+        self.listener = None
+        # entries are [when, sequence, target, action, value, device]; target is None once cancelled or fired
+        self.__heap: list = []
+        self.__sequence = itertools.count()
+        self.__cancelled: int = 0
+
+    def __wake(self) -> None:
+        if self.listener is not None:
+            self.listener(self.__heap[0][0])
+
+    ### Mutators ###
+    def schedule(self, when: float, target, action: str, value=None, device: int = None) -> list:
+        """
+        Adds an event, in O(log n)
+        :param when: The time to fire at, on the scheduler's clock
+        :param target: A tv, or a TelevisionFleet when device is given
+        :param action: A method name, or POWER_OFF / POWER_ON
+        :param value: The channel for set_channel, None otherwise
+        :param device: The device index within a fleet target
+        :return: a handle for cancel()
+        """
+        entry = [when, next(self.__sequence), target, action, value, device]
+        heapq.heappush(self.__heap, entry)
+        if self.__heap[0] is entry:
+            self.__wake()
+        return entry
+
+    def schedule_in(self, delay: float, target, action: str, value=None, device: int = None) -> list:
+        """
+        Adds an event delay seconds from now, such as a sleep timer
+        :return: a handle for cancel()
+        """
+        return self.schedule(self.clock() + delay, target, action, value, device)
+
+    def schedule_many(self, events) -> list:
+        """
+        Adds many events. When they are many compared to those pending, the heap is rebuilt in O(n) instead of
+        inserting each in O(log n).
+        :param events: Iterable of (when, target, action), (when, target, action, value) or
+                       (when, target, action, value, device) tuples
+        :return: list of handles for cancel(), in the order given
+        """
+        heap, sequence = self.__heap, self.__sequence
+        earliest = heap[0][0] if heap else math.inf
+        entries = [[event[0], next(sequence), *event[1:], None, None][:6] for event in events]
+        if not entries:
+            return entries
+        total = len(heap) + len(entries)
+        if len(entries) * math.log2(total) > total:
+            heap += entries
+            heapq.heapify(heap)
+        else:
+            for entry in entries:
+                heapq.heappush(heap, entry)
+        if heap[0][0] < earliest:
+            self.__wake()
+        return entries
+
+    def cancel(self, handle: list) -> bool:
+        """
+        Drops a pending event in O(1), compacting the heap once more than half of it is cancelled
+        :param handle: A handle from schedule()
+        :return: False if the event had already fired or been cancelled
+        """
+        if handle[2] is None:
+            return False
+        handle[2] = handle[4] = None
+        self.__cancelled += 1
+        if self.__cancelled * 2 > len(self.__heap):
+            self.__heap[:] = [entry for entry in self.__heap if entry[2] is not None]
+            heapq.heapify(self.__heap)
+            self.__cancelled = 0
+        return True
+
+    def __due(self, now: float) -> list:
+        """
+        Removes the events due at now from the heap, cancelled ones included
+        :param now: The time to fire up to
+        :return: the due entries in time order
+        """
+        heap, pop = self.__heap, heapq.heappop
+        due, limit = [], max(BULK_THRESHOLD, len(heap) >> 6)
+        while heap and heap[0][0] <= now:
+            if len(due) == limit:
+                # a large share of the heap is due, so one pass to split it off and a sort beats popping each event
+                rest = [entry for entry in heap if entry[0] > now]
+                due += sorted((entry for entry in heap if entry[0] <= now), key=itemgetter(0, 1))
+                heap[:] = rest
+                heapq.heapify(heap)
+                break
+            due.append(pop(heap))
+        return due
+
+    def run_due(self, now: float = None) -> int:
+        """
+        Fires every event due at now. Each tv sees its events in time order. Due fleet events are split into rounds,
+        a device's k-th due event going in round k, and each round fires one fleet call per action and value.
+        :param now: The time to fire up to, defaulting to the clock
+        :return: the number of events fired
+        """
+        now = self.clock() if now is None else now
+        fleets = {} # id of fleet to the fleet, its (round, action, value) buckets of devices, and each device's round
+        fired = 0
+        for entry in self.__due(now):
+            target = entry[2]
+            if target is None:
+                self.__cancelled -= 1
+                continue
+            fired += 1
+            _, _, _, action, value, device = entry
+            entry[2] = entry[4] = None # fired events can no longer be cancelled, nor keep their tv alive
+            if device is None:
+                perform(target, action, value)
+                continue
+            group = fleets.get(id(target))
+            if group is None:
+                group = fleets[id(target)] = (target, {}, {})
+            _, buckets, rounds = group
+            turn = rounds.get(device, 0)
+            rounds[device] = turn + 1
+            bucket = buckets.get((turn, action, value))
+            if bucket is None:
+                buckets[turn, action, value] = [device]
+            else:
+                bucket.append(device)
+
+        for target, buckets, _ in fleets.values():
+            for key in sorted(buckets, key=lambda key : key[0]):
+                perform(target, key[1], key[2], buckets[key])
+        self.fired += fired
+        return fired
+
+    ### Accessors ###
+    def next_time(self) -> float:
+        """
+        Returns the time of the earliest pending event, dropping cancelled events from the top of the heap
+        :return: the time, or None if nothing is pending
+        """
+        heap = self.__heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+            self.__cancelled -= 1
+        return heap[0][0] if heap else None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of pending events
+        :return: the number of events neither fired nor cancelled
+        """
+        return len(self.__heap) - self.__cancelled
+
+### Drivers ###
+async def run_asyncio(scheduler: Scheduler) -> None:
+    """
+    Fires events on the running asyncio loop until the task is cancelled, sleeping until the earliest pending event
+    :param scheduler: The scheduler to drive, used only from the loop's thread
+    """
+    loop = asyncio.get_running_loop()
+    wake = asyncio.Event()
+    scheduler.listener = lambda when : loop.call_soon_threadsafe(wake.set)
+    try:
+        while True:
+            wake.clear()
+            scheduler.run_due()
+            when = scheduler.next_time()
+            timeout = None if when is None else max(0.0, when - scheduler.clock())
+            try:
+                await asyncio.wait_for(wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        scheduler.listener = None
+
+def attach_qt(scheduler: Scheduler, parent=None):
+    """
+    Fires events from the Qt event loop, with a single-shot timer re-armed for the earliest pending event
+    :param scheduler: The scheduler to drive, used only from the GUI thread
+    :param parent: The QObject owning the timer
+    :return: the QTimer
+    """
+    from PyQt6.QtCore import QTimer, Qt # Qt is only needed by GUI users of the scheduler
+
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setTimerType(Qt.TimerType.PreciseTimer)
+
+    def arm(_=None) -> None:
+        when = scheduler.next_time()
+        if when is None:
+            timer.stop()
+        else:
+            # rounded up, so the timer never fires before the event is due
+            timer.start(min(MAX_QT_INTERVAL, max(0, math.ceil((when - scheduler.clock()) * 1000))))
+
+    def fire() -> None:
+        scheduler.run_due()
+        arm()
+
+    timer.timeout.connect(fire)
+    scheduler.listener = arm
+    arm()
+    return timer
+
+### Benchmark ###
+def benchmark(events: int = 1_000_000, devices: int = 100_000) -> None:
+    """
+    Prints the cost of scheduling, cancelling and firing events over a fleet, one at a time and in bulk
+    :param events: The number of events
+    :param devices: The fleet size
+    """
+    from fleet import TelevisionFleet
+
+    rng = np.random.default_rng(0)
+    fleet = TelevisionFleet(devices)
+    fleet.power()
+    times = rng.uniform(0, 3600, events).tolist()
+    targets = rng.integers(0, devices, events).tolist()
+    actions = rng.choice(["channel_up", "volume_up", POWER_OFF], events).tolist()
+
+    scheduler = Scheduler(clock=lambda : 0.0)
+    start = time.perf_counter()
+    handles = [scheduler.schedule(when, fleet, action, None, device) for when, action, device in zip(times, actions, targets)]
+    seconds = time.perf_counter() - start
+    print(f"schedule      : {events / seconds:12,.0f} events/s")
+
+    start = time.perf_counter()
+    for handle in handles[::10]:
+        scheduler.cancel(handle)
+    seconds = time.perf_counter() - start
+    print(f"cancel        : {len(handles[::10]) / seconds:12,.0f} events/s")
+
+    start = time.perf_counter()
+    fired = scheduler.run_due(3600)
+    seconds = time.perf_counter() - start
+    print(f"fire          : {fired / seconds:12,.0f} events/s ({fired:,} fired)")
+
+    scheduler = Scheduler(clock=lambda : 0.0)
+    # a fleet-wide sleep timer: every device powers off at one time, so firing is a single fleet call
+    start = time.perf_counter()
+    scheduler.schedule_many((1800.0, fleet, POWER_OFF, None, device) for device in range(devices))
+    scheduler.schedule_many(zip(times, itertools.repeat(fleet), actions, itertools.repeat(None), targets))
+    seconds = time.perf_counter() - start
+    print(f"schedule_many : {(events + devices) / seconds:12,.0f} events/s")
+    start = time.perf_counter()
+    fired = scheduler.run_due(3600)
+    seconds = time.perf_counter() - start
+    print(f"fire          : {fired / seconds:12,.0f} events/s ({fired:,} fired)")
+
+if __name__ == "__main__":
+    benchmark()
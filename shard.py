@@ -0,0 +1,257 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses ShardedFleet, a fleet of tvs split into shards that a multiprocessing pool updates in parallel.
+Each shard keeps the four Television fields as columns (the same dtypes as fleet.TelevisionFleet) in its own
+multiprocessing.shared_memory block. Workers attach to the blocks once when the pool starts, so state is never pickled;
+only the command batches travel to the workers, routed to shards by device id.
+
+Inside a shard, a batch is applied with the transition tables of statemachine.StateMachine. Events for the same
+device keep their order: the k-th event of every device is applied in round k, each round being one vectorized lookup.
+
+Running it directly prints throughput for 1 to os.cpu_count() worker processes.
+"""
+
+### Import packages ###
+import os
+import sys
+import time
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+from remote import Television
+from statemachine import StateMachine
+
+### Variable Declaration ###
+# Column layout of a shard block, in order
+COLUMNS: tuple = (("status", np.bool_), ("muted", np.bool_), ("volume", np.int16), ("channel", np.int32))
+
+# Shard blocks and state machine attached in each pool worker by _init_worker()
+_worker_blocks: list = []
+_worker_columns: list = []
+_worker_machine = None
+
+### UDF Declaration ###
+def _columns(buffer, count: int) -> tuple:
+    """
+    Views a shard block as its four column arrays
+    :param buffer: The block's buffer
+    :param count: The number of tvs in the shard
+    :return: tuple of status, muted, volume and channel arrays
+    """
+    views, offset = [], 0
+    for _, dtype in COLUMNS:
+        views.append(np.ndarray(count, dtype=dtype, buffer=buffer, offset=offset))
+        offset += count * np.dtype(dtype).itemsize
+    return tuple(views)
+
+def _init_worker(names: list, counts: list, model: type) -> None:
+    """
+    Attaches a pool worker to every shard block and builds its state machine
+    :param names: The shared memory block names, one per shard
+    :param counts: The number of tvs in each shard
+    :param model: The class whose limits the fleet follows
+    """
+    global _worker_machine
+    for name, count in zip(names, counts):
+        block = SharedMemory(name)
+        _worker_blocks.append(block)
+        _worker_columns.append(_columns(block.buf, count))
+    _worker_machine = StateMachine(model)
+
+def _apply_shard(job: tuple) -> int:
+    """
+    Pool task: applies a batch to one shard's columns in place
+    :param job: tuple of the shard number, device numbers within the shard and action ids
+    :return: the number of events applied
+    """
+    shard, devices, actions = job
+    apply_batch(_worker_machine, _worker_columns[shard], devices, actions)
+    return len(devices)
+
+def apply_batch(machine: StateMachine, columns: tuple, devices: np.ndarray, actions: np.ndarray) -> None:
+    """
+    Applies events to column arrays, keeping the order of events for the same device
+    :param machine: The StateMachine whose tables define the actions
+    :param columns: tuple of status, muted, volume and channel arrays
+    :param devices: Device numbers, indexing the columns
+    :param actions: Action ids from machine.action_id(), one per device number
+    """
+    if len(devices) == 0:
+        return
+    status, muted, volume, channel = columns
+    unique, slot = np.unique(devices, return_inverse=True)
+    states = machine.encode(status[unique], muted[unique], volume[unique].astype(np.int32), channel[unique])
+
+    # rank each event among the events of its device: round k applies every device's k-th event at once
+    order = np.argsort(slot, kind="stable")
+    starts = np.flatnonzero(np.diff(slot[order], prepend=-1))
+    rank = np.empty(len(order), dtype=np.intp)
+    rank[order] = np.arange(len(order)) - np.repeat(starts, np.diff(starts, append=len(order)))
+
+    tables = machine.tables
+    by_round = np.argsort(rank, kind="stable")
+    bounds = np.searchsorted(rank[by_round], np.arange(rank.max() + 2))
+    for begin, end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        events = by_round[begin:end]
+        targets = slot[events]
+        states[targets] = tables[actions[events], states[targets]]
+
+    status[unique], muted[unique], volume[unique], channel[unique] = machine.decode(states)
+
+### Class definition ###
+class ShardedFleet:
+    """
+    A class holding a fleet of tvs in shared memory shards, updated by a pool of worker processes
+
+    Attributes
+    ----------
+    machine : StateMachine
+        The state machine whose action ids apply() takes
+    shards : int
+        The number of shards
+    per_shard : int
+        The number of devices in each shard but the last; device d lives in shard d // per_shard
+
+    Methods
+    -------
+    apply(devices, actions):
+        Routes a batch of events to the shards and applies them in parallel
+    ids(actions):
+        Converts actions such as "volume_up" or ("set_channel", 3) to action ids
+    state(device) / describe(device):
+        Return a single tv's state
+    close():
+        Stops the pool and frees the shared memory
+    """
+
+    ### Constructors ###
+    def __init__(self, size: int, shards: int = None, model: type = Television) -> None:
+        """
+        Creates the shard blocks, every tv in its default (off) state, and starts one worker per shard
+        :param size: The number of tvs
+        :param shards: The number of shards and worker processes, defaulting to os.cpu_count()
+        :param model: The class whose MIN/MAX_VOLUME and MIN/MAX_CHANNEL limits the fleet follows
+        """
+        if size < 0:
+            raise ValueError(f"Fleet size must be non-negative, got {size}")
+        self.machine: StateMachine = StateMachine(model)
+        self.shards: int = max(1, min(shards or os.cpu_count() or 1, size or 1))
+        self.per_shard: int = -(-size // self.shards) or 1
+        self.__size: int = size
+        counts = [max(0, min(self.per_shard, size - shard * self.per_shard)) for shard in range(self.shards)]
+        width = sum(np.dtype(dtype).itemsize for _, dtype in COLUMNS)
+
+        self.__blocks: list = [SharedMemory(create=True, size=max(1, count * width)) for count in counts]
+        self.__columns: list = [_columns(block.buf, count) for block, count in zip(self.__blocks, counts)]
+        for _, _, volume, channel in self.__columns:
+            volume[:] = model.MIN_VOLUME
+            channel[:] = model.MIN_CHANNEL
+        self.__pool = Pool(self.shards, initializer=_init_worker,
+                           initargs=([block.name for block in self.__blocks], counts, model))
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __enter__(self) -> "ShardedFleet":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops the workers, then releases and unlinks every shard block
+        """
+        self.__pool.close()
+        self.__pool.join()
+        self.__columns = []
+        for block in self.__blocks:
+            block.close()
+            block.unlink()
+        self.__blocks = []
+
+    ### Mutators ###
+    def ids(self, actions) -> np.ndarray:
+        """
+        Converts actions to action ids
+        :param actions: An iterable of button names and ("set_channel", n) tuples, or an array of action ids
+        :return: int32 array
+        """
+        return self.machine.ids(actions)
+
+    def apply(self, devices, actions) -> int:
+        """
+        Applies a batch of events, where event i applies actions[i] to devices[i]. Events for the same device are
+        applied in batch order; events for different devices run in parallel across the shards.
+        :param devices: Device numbers
+        :param actions: Action ids, or actions accepted by ids()
+        :return: the number of events applied
+        """
+        devices = np.asarray(devices, dtype=np.int64)
+        actions = self.ids(actions)
+        if len(devices) != len(actions):
+            raise ValueError(f"Got {len(devices)} devices for {len(actions)} actions")
+        if len(devices) and (devices.min() < 0 or devices.max() >= self.__size):
+            raise IndexError(f"Device numbers must be in range({self.__size})")
+
+        shard = devices // self.per_shard
+        order = np.argsort(shard, kind="stable")
+        bounds = np.searchsorted(shard[order], np.arange(self.shards + 1))
+        jobs = []
+        for index in range(self.shards):
+            events = order[bounds[index]:bounds[index + 1]]
+            if len(events):
+                jobs.append((index, (devices[events] - index * self.per_shard).astype(np.int32), actions[events]))
+        return sum(self.__pool.map(_apply_shard, jobs))
+
+    ### Accessors ###
+    def state(self, device: int) -> tuple:
+        """
+        Returns the state of a single tv as plain Python values, read straight from shared memory
+        :param device: The device number
+        :return: tuple of powered, muted, volume (0 while muted) and channel
+        """
+        if not 0 <= device < self.__size:
+            raise IndexError(f"Device numbers must be in range({self.__size})")
+        status, muted, volume, channel = self.__columns[device // self.per_shard]
+        index = device % self.per_shard
+        silenced = bool(muted[index])
+        return bool(status[index]), silenced, 0 if silenced else int(volume[index]), int(channel[index])
+
+    def describe(self, device: int) -> str:
+        """
+        Returns the formatted state of a single tv, matching Television.__str__()
+        :param device: The device number
+        :return: string of the power status, mute status, channel value, and volume value
+        """
+        status, muted, volume, channel = self.state(device)
+        return f"Power - {status}, Mute - {muted}, Channel - {channel}, Volume - {volume}"
+
+### Benchmark ###
+def benchmark(size: int = 1_000_000, events: int = 4_000_000, batches: int = 4) -> dict:
+    """
+    Measures apply() throughput for 1 to os.cpu_count() worker processes on the same random events
+    :param size: The number of tvs
+    :param events: The number of events per batch
+    :param batches: The number of batches timed
+    :return: dictionary of process count to events per second
+    """
+    rng = np.random.default_rng(0)
+    devices = rng.integers(0, size, events)
+    results = {}
+    for processes in range(1, (os.cpu_count() or 1) + 1):
+        with ShardedFleet(size, processes) as fleet:
+            actions = rng.integers(0, len(fleet.machine.actions), events).astype(np.int32)
+            fleet.apply(devices[:1000], actions[:1000]) # warm the workers up
+            start = time.perf_counter()
+            for _ in range(batches):
+                fleet.apply(devices, actions)
+            results[processes] = batches * events / (time.perf_counter() - start)
+    return results
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for processes, rate in benchmark(size).items():
+        print(f"{processes:>3} processes: {rate:14,.0f} events/s")
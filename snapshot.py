@@ -0,0 +1,323 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses the binary fleet snapshot format, a versioned file of fixed-width tv records. A Snapshot
+memory-maps the file and decodes nothing up front, so opening a 50M-device snapshot costs the same as opening one of a
+single device, and each record is unpacked only when it is read. The records can also be viewed as NumPy columns
+without copying, and converted to and from tv objects, a fleet.TelevisionFleet and JSON.
+
+File layout (little-endian):
+    HEADER   magic b"TVFS", version, record size, MIN_VOLUME, MAX_VOLUME, MIN_CHANNEL, MAX_CHANNEL, record count
+    RECORD   status uint8, muted uint8, stored volume int16, channel int32, once per device
+
+The stored volume is the volume a muted tv returns to when unmuted. Tvs with a packed state() (CompactTelevision,
+AtomicTelevision, TVRemote) and fleets export it exactly; a plain Television only shows its volume, so a muted one is
+exported with volume 0.
+
+Usage:
+    python snapshot.py [--devices N] [--directory DIR]     benchmarks the format against JSON
+"""
+
+### Import packages ###
+import argparse
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+from compact import unpack
+
+### Variable Declaration ###
+MAGIC: bytes = b"TVFS"
+VERSION: int = 1
+HEADER: struct.Struct = struct.Struct("<4sHH4iQ")
+RECORD: struct.Struct = struct.Struct("<BBhi")
+RECORD_FIELDS: tuple = (("status", "u1"), ("muted", "u1"), ("volume", "<i2"), ("channel", "<i4"))
+CHUNK: int = 1 << 16 # records encoded per write
+
+### UDF Declaration ###
+def record(tv) -> tuple:
+    """
+    Reads the state of one tv object as a record
+    :param tv: A Television, or any tv with a packed state() such as CompactTelevision
+    :return: tuple of status, muted, stored volume and channel
+    """
+    state = getattr(tv, "state", None)
+    if state is not None:
+        return unpack(state())
+    return tv.powered(), tv.muted(), tv.getVolume(), tv.getChannel()
+
+def write(path: str, records, limits: tuple) -> int:
+    """
+    Writes a snapshot, streaming the records in chunks, and replaces path atomically
+    :param path: The snapshot file
+    :param records: Iterable of (status, muted, stored volume, channel) tuples
+    :param limits: tuple of MIN_VOLUME, MAX_VOLUME, MIN_CHANNEL and MAX_CHANNEL
+    :return: the number of records written
+    """
+    pack_into, size = RECORD.pack_into, RECORD.size
+    buffer = bytearray(CHUNK * size)
+    count = used = 0
+    with open(f"{path}.tmp", "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, size, *limits, 0))
+        for status, muted, volume, channel in records:
+            pack_into(buffer, used, status, muted, volume, channel)
+            used += size
+            if used == len(buffer):
+                file.write(buffer)
+                count, used = count + CHUNK, 0
+        file.write(memoryview(buffer)[:used])
+        count += used // size
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, size, *limits, count))
+    os.replace(f"{path}.tmp", path)
+    return count
+
+def from_televisions(path: str, tvs) -> int:
+    """
+    Writes a snapshot of tv objects, taking the limits from the first one
+    :param path: The snapshot file
+    :param tvs: A sequence of tvs of one class
+    :return: the number of records written
+    """
+    model = tvs[0] if len(tvs) else None
+    limits = tuple(getattr(model, name, 0) for name in ("MIN_VOLUME", "MAX_VOLUME", "MIN_CHANNEL", "MAX_CHANNEL"))
+    return write(path, map(record, tvs), limits)
+
+def from_fleet(path: str, fleet) -> int:
+    """
+    Writes a snapshot of a TelevisionFleet, encoding the columns in vectorized chunks
+    :param path: The snapshot file
+    :param fleet: The fleet
+    :return: the number of records written
+    """
+    import numpy as np # only the fleet converters need NumPy
+
+    columns = (fleet.powered(), fleet.muted(), fleet.storedVolume(), fleet.getChannel())
+    chunk = np.empty(CHUNK, dtype=np.dtype(list(RECORD_FIELDS)))
+    with open(f"{path}.tmp", "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, fleet.MIN_VOLUME, fleet.MAX_VOLUME,
+                               fleet.MIN_CHANNEL, fleet.MAX_CHANNEL, len(fleet)))
+        for start in range(0, len(fleet), CHUNK):
+            rows = chunk[:min(CHUNK, len(fleet) - start)]
+            for (name, _), column in zip(RECORD_FIELDS, columns):
+                rows[name] = column[start:start + len(rows)]
+            file.write(rows.tobytes())
+    os.replace(f"{path}.tmp", path)
+    return len(fleet)
+
+def from_json(path: str, source: str) -> int:
+    """
+    Converts a JSON export back into a snapshot
+    :param path: The snapshot file to write
+    :param source: A file written by Snapshot.to_json()
+    :return: the number of records written
+    """
+    with open(source, encoding="utf-8") as file:
+        document = json.load(file)
+    return write(path, document["devices"], tuple(document["limits"]))
+
+### Class definition ###
+class Snapshot:
+    """
+    A class giving lazy, read-only access to a memory-mapped snapshot file
+
+    Attributes
+    ----------
+    path : str
+        The snapshot file
+    limits : tuple
+        MIN_VOLUME, MAX_VOLUME, MIN_CHANNEL and MAX_CHANNEL of the tvs snapshotted
+
+    Methods
+    -------
+    snapshot[i]:
+        Decodes one record into (status, muted, stored volume, channel)
+    describe(i):
+        Returns the same string Television.__str__() would for that tv
+    columns():
+        Returns the records as a NumPy structured array that views the file
+    to_fleet() / to_televisions(factory) / to_json(path):
+        Convert the snapshot
+    close():
+        Unmaps the file
+    """
+
+    ### Constructors ###
+    def __init__(self, path: str) -> None:
+        """
+        Maps a snapshot file and checks its header, without reading any records
+        :param path: The snapshot file
+        """
+        self.path: str = path
+        with open(path, "rb") as file:
+            self.__mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.__mapped) < HEADER.size:
+            self.__mapped.close()
+            raise ValueError(f"{path} is too short to be a snapshot")
+        magic, version, size, *limits, count = HEADER.unpack_from(self.__mapped)
+        if magic != MAGIC or version != VERSION or size != RECORD.size:
+            self.__mapped.close()
+            raise ValueError(f"{path} is not a version {VERSION} snapshot")
+        if len(self.__mapped) < HEADER.size + count * size:
+            self.__mapped.close()
+            raise ValueError(f"{path} is truncated: {count} records expected")
+        self.limits: tuple = tuple(limits)
+        self.__count: int = count
+        self.__records = memoryview(self.__mapped)[HEADER.size:HEADER.size + count * size]
+
+    def close(self) -> None:
+        """
+        Unmaps the file. Column views from columns() must be dropped first.
+        """
+        self.__records.release()
+        self.__mapped.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    ### Accessors ###
+    def __len__(self) -> int:
+        return self.__count
+
+    def __getitem__(self, index: int) -> tuple:
+        """
+        Decodes one record
+        :param index: The device, negative counting from the end
+        :return: tuple of status, muted, stored volume and channel
+        """
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError(f"device {index} is not in a snapshot of {self.__count}")
+        status, muted, volume, channel = RECORD.unpack_from(self.__records, index * RECORD.size)
+        return bool(status), bool(muted), volume, channel
+
+    def __iter__(self):
+        """
+        Decodes the records one at a time, in device order
+        :return: generator of (status, muted, stored volume, channel) tuples
+        """
+        for status, muted, volume, channel in RECORD.iter_unpack(self.__records):
+            yield bool(status), bool(muted), volume, channel
+
+    def describe(self, index: int) -> str:
+        """
+        Returns the formatted state of one tv, matching Television.__str__()
+        :param index: The device
+        :return: string of the power status, mute status, channel value, and volume value
+        """
+        status, muted, volume, channel = self[index]
+        return f"Power - {status}, Mute - {muted}, Channel - {channel}, Volume - {0 if muted else volume}"
+
+    def columns(self):
+        """
+        Returns every record as a read-only NumPy structured array backed by the mapped file, without copying
+        :return: array with status, muted, volume and channel fields
+        """
+        import numpy as np # only the fleet converters need NumPy
+
+        return np.frombuffer(self.__records, dtype=np.dtype(list(RECORD_FIELDS)), count=self.__count)
+
+    ### Converters ###
+    def to_fleet(self, model: type = None):
+        """
+        Loads the snapshot into a TelevisionFleet
+        :param model: The class whose limits the fleet follows, defaulting to the limits in the snapshot
+        :return: the fleet
+        """
+        from fleet import TelevisionFleet
+
+        if model is None:
+            model = type("SnapshotModel", (), dict(zip(("MIN_VOLUME", "MAX_VOLUME", "MIN_CHANNEL", "MAX_CHANNEL"), self.limits)))
+        columns = self.columns()
+        return TelevisionFleet.from_columns(columns["status"], columns["muted"], columns["volume"], columns["channel"], model)
+
+    def to_televisions(self, factory: type = None) -> list:
+        """
+        Loads the snapshot into tv objects
+        :param factory: A class built from a packed state, defaulting to CompactTelevision
+        :return: list of tvs
+        """
+        from compact import CompactTelevision, pack
+
+        factory = factory or CompactTelevision
+        return [factory(pack(*fields)) for fields in self]
+
+    def to_json(self, path: str) -> None:
+        """
+        Exports the snapshot as JSON, streaming the records
+        :param path: The JSON file to write
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(f'{{"limits": {json.dumps(list(self.limits))}, "devices": [')
+            for index, (status, muted, volume, channel) in enumerate(self):
+                file.write(f'{"," if index else ""}[{"true" if status else "false"},{"true" if muted else "false"},{volume},{channel}]')
+            file.write("]}")
+
+### Benchmark ###
+def benchmark(devices: int, directory: str) -> None:
+    """
+    Prints the time to write and open a snapshot of a fleet and of its JSON export, and the cost of reading records
+    :param devices: The fleet size
+    :param directory: Where to write the files
+    """
+    import numpy as np
+    from fleet import TelevisionFleet
+
+    rng = np.random.default_rng(0)
+    fleet = TelevisionFleet.from_columns(rng.random(devices) < 0.6, rng.random(devices) < 0.1,
+                                         rng.integers(0, 3, devices), rng.integers(0, 4, devices))
+    binary, text = os.path.join(directory, "fleet.tvfs"), os.path.join(directory, "fleet.json")
+    probes = rng.integers(0, devices, 100_000).tolist()
+
+    start = time.perf_counter()
+    from_fleet(binary, fleet)
+    print(f"snapshot write : {time.perf_counter() - start:8.3f} s, {os.path.getsize(binary) / 1e6:8.1f} MB")
+    start = time.perf_counter()
+    snapshot = Snapshot(binary)
+    print(f"snapshot open  : {(time.perf_counter() - start) * 1e3:8.3f} ms")
+    start = time.perf_counter()
+    for probe in probes:
+        snapshot[probe]
+    print(f"snapshot read  : {(time.perf_counter() - start) / len(probes) * 1e9:8.0f} ns per random device")
+    start = time.perf_counter()
+    watching = int(np.count_nonzero(snapshot.columns()["channel"] == 2))
+    print(f"snapshot scan  : {time.perf_counter() - start:8.3f} s for a column query ({watching:,} on channel 2)")
+
+    start = time.perf_counter()
+    snapshot.to_json(text)
+    print(f"json write     : {time.perf_counter() - start:8.3f} s, {os.path.getsize(text) / 1e6:8.1f} MB")
+    start = time.perf_counter()
+    with open(text, encoding="utf-8") as file:
+        document = json.load(file)
+    print(f"json open      : {(time.perf_counter() - start) * 1e3:8.1f} ms (parses every device)")
+    start = time.perf_counter()
+    for probe in probes:
+        document["devices"][probe]
+    print(f"json read      : {(time.perf_counter() - start) / len(probes) * 1e9:8.0f} ns per random device")
+    del document
+    snapshot.close()
+
+## Main Function ##
+def main() -> None:
+    """
+    Benchmarks the snapshot format against JSON
+    """
+    parser = argparse.ArgumentParser(description="Binary fleet snapshot benchmark")
+    parser.add_argument("--devices", type=int, default=5_000_000, help="fleet size")
+    parser.add_argument("--directory", help="where to write the files, defaulting to a temporary directory")
+    args = parser.parse_args()
+    if args.directory:
+        benchmark(args.devices, args.directory)
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        benchmark(args.devices, directory)
+
+if __name__ == "__main__":
+    main()
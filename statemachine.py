@@ -0,0 +1,324 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses the StateMachine object, a compiled form of the Television/TVRemote behavior.
+Every (power, mute, volume, channel) combination is enumerated once and numbered, and each button action is stored
+as an integer transition table over those numbers. Tables compose associatively, so whole action sequences can be
+folded into a single table, and long button logs can be reduced or scanned in parallel across processes.
+"""
+
+### Import packages ###
+from multiprocessing import Pool
+from os import cpu_count
+import numpy as np
+from remote import Television
+
+### Variable Declaration ###
+# Actions that take no argument, in the order their tables are stacked. set_channel(n) tables follow these.
+BUTTONS: tuple = ("power", "mute", "channel_up", "channel_down", "volume_up", "volume_down")
+
+# Machine shared with pool workers, assigned by _init_worker()
+_worker_machine = None
+
+### Class definition ###
+class StateMachine:
+    """
+    A class representing the finite state machine behind a tv. States are integers in range(size), and actions are
+    either a button name from BUTTONS or a ("set_channel", n) tuple.
+
+    Attributes
+    ----------
+    size : int
+        The number of states: power x mute x volume x channel
+    actions : list
+        Every action the machine has a table for, indexed by action id
+    tables : numpy.ndarray
+        A (len(actions), size) array where tables[a][s] is the state reached by applying action a to state s
+
+    Methods
+    -------
+    encode(status, muted, volume, channel) / decode(state):
+        Convert between a state number and its four fields
+    from_tv(tv):
+        Returns the state number of a Television or TVRemote
+    action_id(action) / table(action):
+        Look up an action's id or transition table
+    compose(*tables):
+        Folds tables left to right into a single table
+    repeat(action, count):
+        Returns the table for pressing action count times, by repeated squaring
+    compile(actions):
+        Folds an action sequence into a single table
+    run(actions, state):
+        Walks a state through an action sequence one lookup at a time
+    reduce(actions, processes) / scan(actions, state, processes):
+        Parallel forms of compile() and of run() that also keeps every intermediate state
+    """
+
+    ### Constructors ###
+    def __init__(self, model: type = Television) -> None:
+        """
+        Enumerates the state space of model and builds a transition table for every action
+        :param model: The class whose MIN/MAX_VOLUME and MIN/MAX_CHANNEL limits bound the state space
+        """
+        self.MIN_VOLUME: int = model.MIN_VOLUME
+        self.MAX_VOLUME: int = model.MAX_VOLUME
+        self.MIN_CHANNEL: int = model.MIN_CHANNEL
+        self.MAX_CHANNEL: int = model.MAX_CHANNEL
+
+        self.__volumes: int = self.MAX_VOLUME - self.MIN_VOLUME + 1
+        self.__channels: int = self.MAX_CHANNEL - self.MIN_CHANNEL + 1
+        self.size: int = 4 * self.__volumes * self.__channels
+
+        self.actions: list = list(BUTTONS) + [("set_channel", n) for n in range(self.MIN_CHANNEL, self.MAX_CHANNEL + 1)]
+        self.__ids: dict = {action: index for index, action in enumerate(self.actions)}
+
+        self.tables: np.ndarray = self.__build()
+        self.__rows: list = [row.tolist() for row in self.tables] # plain lists index faster than numpy scalars in run()
+
+    def __build(self) -> np.ndarray:
+        """
+        Builds every transition table at once by decoding all states into field arrays
+        :return: (len(actions), size) int32 array
+        """
+        status, muted, volume, channel = self.decode(np.arange(self.size))
+        tables = np.empty((len(self.actions), self.size), dtype=np.int32)
+
+        tables[0] = self.encode(~status, muted, volume, channel)
+        tables[1] = self.encode(status, muted ^ status, volume, channel)
+
+        up = np.where(channel < self.MAX_CHANNEL, channel + 1, self.MIN_CHANNEL)
+        down = np.where(channel > self.MIN_CHANNEL, channel - 1, self.MAX_CHANNEL)
+        tables[2] = self.encode(status, muted, volume, np.where(status, up, channel))
+        tables[3] = self.encode(status, muted, volume, np.where(status, down, channel))
+
+        louder = np.where(status & (volume < self.MAX_VOLUME), volume + 1, volume)
+        quieter = np.where(status & (volume > self.MIN_VOLUME), volume - 1, volume)
+        tables[4] = self.encode(status, muted & ~status, louder, channel)
+        tables[5] = self.encode(status, muted & ~status, quieter, channel)
+
+        for offset, value in enumerate(range(self.MIN_CHANNEL, self.MAX_CHANNEL + 1)):
+            tables[len(BUTTONS) + offset] = self.encode(status, muted, volume, np.where(status, value, channel))
+        return tables
+
+    ### Encoding ###
+    def encode(self, status, muted, volume, channel):
+        """
+        Returns the state number for the given fields. Works on scalars or equal-length numpy arrays.
+        :param status: Whether the tv is powered on
+        :param muted: Whether the tv is muted
+        :param volume: The stored volume, between MIN_VOLUME and MAX_VOLUME
+        :param channel: The channel, between MIN_CHANNEL and MAX_CHANNEL
+        :return: state number(s)
+        """
+        flags = status * 2 + muted
+        return (flags * self.__volumes + (volume - self.MIN_VOLUME)) * self.__channels + (channel - self.MIN_CHANNEL)
+
+    def decode(self, state):
+        """
+        Returns the fields of the given state number. Works on scalars or numpy arrays.
+        :param state: state number(s)
+        :return: tuple of status, muted, volume, channel
+        """
+        rest, channel = divmod(state, self.__channels)
+        flags, volume = divmod(rest, self.__volumes)
+        return flags >= 2, flags % 2 == 1, volume + self.MIN_VOLUME, channel + self.MIN_CHANNEL
+
+    def from_tv(self, tv) -> int:
+        """
+        Returns the state number of a Television or TVRemote
+        :param tv: An object with the powered(), muted(), getVolume(), storedVolume() and getChannel() accessors
+        :return: state number
+        """
+        muted, channel = tv.muted(), tv.getChannel()
+        # getVolume() reads 0 while muted, but unmuting restores the stored volume, so the state must keep it
+        volume = tv.storedVolume() if muted else tv.getVolume()
+        if not self.MIN_CHANNEL <= channel <= self.MAX_CHANNEL:
+            raise ValueError(f"Channel {channel} is outside the state space")
+        return int(self.encode(tv.powered(), muted, volume, channel))
+
+    def describe(self, state: int) -> str:
+        """
+        Returns the formatted state, matching Television.__str__()
+        :param state: state number
+        :return: string of the power status, mute status, channel value, and volume value
+        """
+        status, muted, volume, channel = self.decode(state)
+        return f"Power - {status}, Mute - {muted}, Channel - {channel}, Volume - {0 if muted else volume}"
+
+    ### Tables ###
+    def action_id(self, action) -> int:
+        """
+        Returns the id of an action
+        :param action: A button name from BUTTONS or a ("set_channel", n) tuple
+        :return: row of self.tables holding the action's table
+        """
+        try:
+            return self.__ids[tuple(action) if isinstance(action, list) else action]
+        except KeyError:
+            raise ValueError(f"No transition table for action {action!r}") from None
+
+    def table(self, action) -> np.ndarray:
+        """
+        Returns the transition table of an action
+        :param action: A button name from BUTTONS or a ("set_channel", n) tuple
+        :return: int32 array of length size
+        """
+        return self.tables[self.action_id(action)]
+
+    def identity(self) -> np.ndarray:
+        """
+        Returns the table that leaves every state unchanged
+        :return: int32 array of length size
+        """
+        return np.arange(self.size, dtype=np.int32)
+
+    @staticmethod
+    def compose(*tables) -> np.ndarray:
+        """
+        Folds tables left to right, so the result applies the first table, then the second, and so on
+        :param tables: int32 arrays of equal length
+        :return: int32 array
+        """
+        result = tables[0]
+        for table in tables[1:]:
+            result = table[result]
+        return result
+
+    def repeat(self, action, count: int) -> np.ndarray:
+        """
+        Returns the table for pressing action count times, in O(size * log(count))
+        :param action: A button name from BUTTONS or a ("set_channel", n) tuple
+        :param count: The number of presses
+        :return: int32 array of length size
+        """
+        result, square = self.identity(), self.table(action)
+        while count:
+            if count & 1:
+                result = square[result]
+            square = square[square]
+            count >>= 1
+        return result
+
+    def ids(self, actions) -> np.ndarray:
+        """
+        Converts an action sequence into an array of action ids
+        :param actions: An iterable of actions, or an array of action ids
+        :return: int32 array
+        """
+        if isinstance(actions, np.ndarray):
+            return actions.astype(np.int32, copy=False)
+        return np.fromiter((self.action_id(action) for action in actions), dtype=np.int32)
+
+    def compile(self, actions) -> np.ndarray:
+        """
+        Folds an action sequence into a single table. Runs of the same action are folded by repeated squaring.
+        :param actions: An iterable of actions, or an array of action ids
+        :return: int32 array of length size
+        """
+        ids = self.ids(actions)
+        result = self.identity()
+        if len(ids) == 0:
+            return result
+        # split into runs of equal ids so "VOL+ x50" costs log(50) compositions instead of 50
+        starts = np.flatnonzero(np.diff(ids, prepend=ids[0] - 1))
+        lengths = np.diff(starts, append=len(ids))
+        for start, length in zip(starts.tolist(), lengths.tolist()):
+            result = self.repeat(self.actions[ids[start]], length)[result]
+        return result
+
+    def run(self, actions, state: int) -> int:
+        """
+        Walks state through an action sequence, one table lookup per action
+        :param actions: An iterable of actions, or an array of action ids
+        :param state: The starting state number
+        :return: the final state number
+        """
+        rows = self.__rows
+        for action in self.ids(actions).tolist():
+            state = rows[action][state]
+        return state
+
+    def trace(self, actions, state: int) -> np.ndarray:
+        """
+        Walks state through an action sequence like run(), keeping every intermediate state
+        :param actions: An iterable of actions, or an array of action ids
+        :param state: The starting state number
+        :return: int32 array where element i is the state after action i
+        """
+        rows = self.__rows
+        out = []
+        for action in self.ids(actions).tolist():
+            state = rows[action][state]
+            out.append(state)
+        return np.array(out, dtype=np.int32)
+
+    ### Parallel reduction ###
+    def reduce(self, actions, processes: int = None) -> np.ndarray:
+        """
+        Folds a long action sequence into a single table by compiling one chunk per process and composing the results
+        :param actions: An iterable of actions, or an array of action ids
+        :param processes: The number of worker processes, defaulting to os.cpu_count()
+        :return: int32 array of length size
+        """
+        chunks = self.__chunks(self.ids(actions), processes)
+        with Pool(len(chunks), initializer=_init_worker, initargs=(self,)) as pool:
+            tables = pool.map(_compile_chunk, chunks)
+        return self.compose(self.identity(), *tables)
+
+    def scan(self, actions, state: int, processes: int = None) -> np.ndarray:
+        """
+        Returns the state after every action of a long sequence, as a parallel prefix scan:
+        each process compiles its chunk, the chunk tables give each chunk's starting state, then each process walks its chunk
+        :param actions: An iterable of actions, or an array of action ids
+        :param state: The starting state number
+        :param processes: The number of worker processes, defaulting to os.cpu_count()
+        :return: int32 array where element i is the state after action i
+        """
+        chunks = self.__chunks(self.ids(actions), processes)
+        with Pool(len(chunks), initializer=_init_worker, initargs=(self,)) as pool:
+            tables = pool.map(_compile_chunk, chunks)
+            starts = []
+            for table in tables:
+                starts.append(state)
+                state = int(table[state])
+            walks = pool.map(_walk_chunk, zip(chunks, starts))
+        return np.concatenate(walks) if walks else np.empty(0, dtype=np.int32)
+
+    @staticmethod
+    def __chunks(ids: np.ndarray, processes: int) -> list:
+        """
+        Splits an id array into one contiguous chunk per process
+        :param ids: int32 array of action ids
+        :param processes: The number of chunks wanted, defaulting to os.cpu_count()
+        :return: list of int32 arrays
+        """
+        processes = max(1, min(processes or cpu_count() or 1, len(ids) or 1))
+        return np.array_split(ids, processes)
+
+### UDF Declaration ###
+def _init_worker(machine: StateMachine) -> None:
+    """
+    Stores the machine in each pool worker so chunks can be sent without their tables
+    :param machine: The StateMachine the pool works on
+    """
+    global _worker_machine
+    _worker_machine = machine
+
+def _compile_chunk(ids: np.ndarray) -> np.ndarray:
+    """
+    Pool task for StateMachine.reduce() and scan()
+    :param ids: A chunk of action ids
+    :return: the chunk's compiled table
+    """
+    return _worker_machine.compile(ids)
+
+def _walk_chunk(job: tuple) -> np.ndarray:
+    """
+    Pool task for StateMachine.scan()
+    :param job: tuple of a chunk of action ids and the state before it
+    :return: int32 array of the state after each action in the chunk
+    """
+    ids, state = job
+    return _worker_machine.trace(ids, state)
@@ -0,0 +1,107 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the thread-safe tvs in atomic.py
+"""
+### Import packages ###
+import random
+import sys
+import threading
+import pytest
+from atomic import AtomicTelevision, LockedTelevision
+from remote import Television
+
+### Variable Declaration ###
+BUTTONS: list = ["power", "mute", "channel_up", "channel_down", "volume_up", "volume_down"]
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    def setup_method(self):
+        """
+        Makes the interpreter switch threads as often as it can, so races show up within a short test.
+        """
+        self.interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def teardown_method(self):
+        """
+        Restores the thread switch interval after each test case so later tests run at normal speed.
+        """
+        sys.setswitchinterval(self.interval)
+
+    ### Test cases ###
+    @pytest.mark.parametrize("factory", [AtomicTelevision, LockedTelevision])
+    def test_single_thread_matches_television(self, factory):
+        """
+        This tests random presses on one thread against the Television reference.
+        """
+        rng = random.Random(0)
+        tv, reference = factory(), Television()
+        for _ in range(2000):
+            button = rng.choice(BUTTONS + ["set_channel"])
+            if button == "set_channel":
+                value = rng.randrange(4)
+                tv.set_channel(value)
+                reference.set_channel(value)
+            else:
+                getattr(tv, button)()
+                getattr(reference, button)()
+            assert str(tv) == str(reference)
+        tv.apply("POWER x3, VOL+ x5, CH- x6")
+        reference.apply("POWER x3, VOL+ x5, CH- x6")
+        assert str(tv) == str(reference)
+
+    @pytest.mark.parametrize("factory", [AtomicTelevision, LockedTelevision])
+    def test_stress_invariants(self, factory):
+        """
+        This tests that no press is lost across threads and that every state a reader sees is within the limits.
+        """
+        wide = type("Wide", (factory,), {"MAX_CHANNEL": 1_000_000, "MAX_VOLUME": 100})
+        tv = wide()
+        tv.power()
+        threads, presses = 8, 2000
+        violations = []
+        done = threading.Event()
+
+        def press(seed: int) -> None:
+            rng = random.Random(seed)
+            for _ in range(presses):
+                getattr(tv, rng.choice(("channel_up", "channel_up", "volume_up", "volume_down", "mute")))()
+
+        def read() -> None:
+            while not done.is_set():
+                volume, channel = tv.getVolume(), tv.getChannel()
+                if not (0 <= volume <= 100 and 0 <= channel <= 1_000_000):
+                    violations.append((volume, channel))
+
+        workers = [threading.Thread(target=press, args=(seed,)) for seed in range(threads)]
+        reader = threading.Thread(target=read)
+        reader.start()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        done.set()
+        reader.join()
+
+        expected = 0
+        for seed in range(threads):
+            rng = random.Random(seed)
+            expected += sum(rng.choice(("channel_up", "channel_up", "volume_up", "volume_down", "mute")) == "channel_up"
+                            for _ in range(presses))
+        assert tv.getChannel() == expected
+        assert tv.powered() and violations == []
+
+    def test_compare_and_set(self):
+        """
+        This tests that compare_and_set only swaps in a new state when the tv still holds the expected one.
+        """
+        tv = AtomicTelevision()
+        state = tv.state()
+        tv.power()
+        assert not tv.compare_and_set(state, state | 2)
+        assert tv.compare_and_set(tv.state(), state)
+        assert not tv.powered()
@@ -0,0 +1,86 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the incrementally maintained AudienceIndex in audience.py
+"""
+### Import packages ###
+import random
+from audience import AudienceIndex, IndexedTelevision
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    def setup_method(self):
+        """
+        Configures an index over a small fleet of indexed tvs for each test case.
+        """
+        self.index = AudienceIndex()
+        self.tvs = [IndexedTelevision(self.index) for _ in range(200)]
+
+    def teardown_method(self):
+        """
+        Removes the index and tvs after each test case has been completed to keep each interaction isolated.
+        """
+        del self.index
+        del self.tvs
+
+    def scan(self, channel, muted=None):
+        """
+        Counts the audience the slow way, for comparison.
+        """
+        return [tv for tv in self.tvs if tv.powered() and tv.getChannel() == channel and muted in (None, tv.muted())]
+
+    ### Test cases ###
+    def test_matches_scan(self):
+        """
+        This tests that every query agrees with a scan of the fleet after random presses.
+        """
+        rng = random.Random(0)
+        for _ in range(20_000):
+            tv = rng.choice(self.tvs)
+            action = rng.choice(("power", "mute", "channel_up", "channel_down", "volume_up", "volume_down", "set_channel", "apply"))
+            if action == "set_channel":
+                tv.set_channel(rng.randint(0, 3))
+            elif action == "apply":
+                tv.apply(rng.choice(("POWER", "CH+ x5", "MUTE x3, VOL-")))
+            else:
+                getattr(tv, action)()
+        for channel in range(4):
+            for muted in (None, True, False):
+                assert self.index.watching(channel, muted) == len(self.scan(channel, muted))
+                assert self.index.members(channel, muted) == set(self.scan(channel, muted))
+        assert self.index.powered_count() == sum(tv.powered() for tv in self.tvs)
+        assert self.index.muted_count() == sum(tv.powered() and tv.muted() for tv in self.tvs)
+        ranking = sorted(((channel, len(self.scan(channel))) for channel in range(4)), key=lambda pair : -pair[1])
+        assert [count for _, count in self.index.top(4)] == [count for _, count in ranking if count]
+
+    def test_unmute_and_power_off(self):
+        """
+        This tests that the unmute inside volume_up moves the tv, and that tvs that are off are no audience.
+        """
+        tv = self.tvs[0]
+        tv.power()
+        tv.set_channel(2)
+        tv.mute()
+        assert (self.index.watching(2, muted=True), self.index.watching(2, muted=False)) == (1, 0)
+        tv.volume_up()
+        assert (self.index.watching(2, muted=True), self.index.watching(2, muted=False)) == (0, 1)
+        tv.mute()
+        tv.power()
+        assert (self.index.watching(2), self.index.muted_count(), self.index.top(3)) == (0, 0, [])
+        assert self.index.watching(99) == 0
+
+    def test_add_and_remove(self):
+        """
+        This tests tracking plain tvs built elsewhere and dropping them.
+        """
+        index = AudienceIndex(self.tvs[:10])
+        for tv in self.tvs[:3]:
+            tv.power()
+        index.update(self.tvs[0])
+        assert (len(index), index.powered_count()) == (10, 1) # only updated tvs are re-filed
+        index.remove(self.tvs[0])
+        assert (len(index), index.powered_count(), self.tvs[0] in index) == (9, 0, False)
+        assert (self.index.powered_count(), self.index.top(1)) == (3, [(0, 3)])
@@ -0,0 +1,61 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify that batched commands match individual presses
+"""
+### Import packages ###
+import random
+import pytest
+from commands import parse
+from main import HeadlessRemote
+from remote import Television
+
+### Variable Declaration ###
+PRESSES: list = ["POWER", "MUTE", "VOL+", "VOL-", "CH+", "CH-", "1", "7", "12"]
+
+### Test class ###
+class Test:
+
+    ### Test cases ###
+    def test_parse(self):
+        """
+        This tests that batches parse into runs, with case-insensitive names, bare channel numbers and either repeat spelling, and that malformed presses are rejected.
+        """
+        assert parse("POWER, VOL+ x50, CH- x13, 7") == (
+            ("power", 1, None), ("volume_up", 50, None), ("channel_down", 13, None), ("set_channel", 1, 7))
+        assert parse("volume_down x 2,, mute") == (("volume_down", 2, None), ("mute", 1, None))
+        with pytest.raises(ValueError):
+            parse("VOL+ 50")
+        with pytest.raises(ValueError):
+            parse("louder")
+
+    @pytest.mark.parametrize("model", [Television, HeadlessRemote])
+    def test_matches_individual_presses(self, model):
+        """
+        This tests random batches, including channels set outside the range, against one method call per press.
+        """
+        methods = {"power": "power", "mute": "mute", "volume_up": "volume_up", "volume_down": "volume_down",
+                   "channel_up": "channel_up", "channel_down": "channel_down"}
+        rng = random.Random(0)
+        for _ in range(300):
+            batched, stepped = model(), model()
+            runs = []
+            for _ in range(rng.randint(1, 8)):
+                press, count = rng.choice(PRESSES), rng.randint(0, 25)
+                runs.append(f"{press} x{count}")
+                for _ in range(count):
+                    if press.isdigit():
+                        stepped.set_channel(int(press))
+                    else:
+                        getattr(stepped, methods[parse(press)[0][0]])()
+            batched.apply(", ".join(runs))
+            assert str(batched) == str(stepped), runs
+
+    def test_large_counts(self):
+        """
+        This tests that huge repeat counts apply in closed form, toggling by parity, clamping the volume and wrapping the channel.
+        """
+        tv = Television()
+        tv.apply("POWER x1000001, VOL+ x1000000000, CH- x1000000001")
+        assert str(tv) == "Power - True, Mute - False, Channel - 3, Volume - 2"
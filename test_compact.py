@@ -0,0 +1,80 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify that compact.CompactTelevision matches remote.Television
+"""
+### Import packages ###
+import random
+import pytest
+from compact import CompactTelevision, pack, unpack
+from remote import Television
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    def setup_method(self):
+        """
+        Configures a compact tv alongside a Television object.
+        """
+        self.compact = CompactTelevision()
+        self.tv = Television()
+
+    def teardown_method(self):
+        """
+        Removes the tv objects after each test case has been completed to keep each interaction isolated.
+        """
+        del self.compact
+        del self.tv
+
+    ### Test cases ###
+    def test_construction(self):
+        """
+        This tests the default state and that instances carry no __dict__.
+        """
+        assert self.compact.__str__() == "Power - False, Mute - False, Channel - 0, Volume - 0"
+        with pytest.raises(AttributeError):
+            self.compact.__dict__
+
+    def test_packing(self):
+        """
+        This tests that pack() and unpack() round-trip, including channels that overflow 16 bits.
+        """
+        for fields in [(False, False, 0, 0), (True, True, 100, 9), (True, False, 127, 127), (True, True, 5, 4000)]:
+            assert unpack(pack(*fields)) == fields
+        tv = CompactTelevision(pack(True, False, 1, 4000))
+        tv.power()
+        tv.power()
+        tv.channel_down()
+        assert tv.__str__() == "Power - True, Mute - False, Channel - 3999, Volume - 1"
+
+    def test_negative_channels(self):
+        """
+        This tests that negative channels pack to negative states, which must not be looked up in the shared states.
+        """
+        for tv in (self.compact, self.tv):
+            tv.power()
+            tv.set_channel(-2)
+            tv.channel_up()
+        assert self.compact.__str__() == self.tv.__str__() == "Power - True, Mute - False, Channel - -1, Volume - 0"
+        assert self.compact.state() < 0
+
+    def test_random_sequences(self):
+        """
+        This tests random press sequences against the Television reference, including out-of-range set_channel values.
+        """
+        rng = random.Random(7)
+        actions = ["power", "mute", "channel_up", "channel_down", "volume_up", "volume_down", "set_channel"]
+        for _ in range(2000):
+            action = rng.choice(actions)
+            if action == "set_channel":
+                value = rng.randint(-5, 14)
+                self.compact.set_channel(value)
+                self.tv.set_channel(value)
+            else:
+                getattr(self.compact, action)()
+                getattr(self.tv, action)()
+            assert self.compact.__str__() == self.tv.__str__()
+            assert (self.compact.powered(), self.compact.muted()) == (self.tv.powered(), self.tv.muted())
+            assert (self.compact.getVolume(), self.compact.getChannel()) == (self.tv.getVolume(), self.tv.getChannel())
@@ -0,0 +1,73 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the fleet model and dashboard in dashboard.py under the offscreen Qt platform
+"""
+### Import packages ###
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+import numpy as np
+from PyQt6.QtCore import QItemSelection, QItemSelectionModel
+from PyQt6.QtWidgets import QApplication
+from dashboard import Dashboard, FleetTableModel, MAX_RANGES
+from fleet import TelevisionFleet
+from logic import TVRemote
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    @classmethod
+    def setup_class(cls):
+        """
+        Creates the QApplication shared by every test case.
+        """
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setup_method(self):
+        """
+        Configures a dashboard over a small fleet with TVRemote limits.
+        """
+        self.dashboard = Dashboard(TelevisionFleet(1000, model=TVRemote))
+        self.model = self.dashboard.model
+        self.ranges = []
+        self.model.dataChanged.connect(lambda top, bottom : self.ranges.append((top.row(), bottom.row())))
+
+    def teardown_method(self):
+        """
+        Closes the dashboard after each test case has been completed to keep each interaction isolated.
+        """
+        self.dashboard.close()
+        del self.dashboard
+
+    ### Test cases ###
+    def test_batched_data_changed(self):
+        """
+        This tests that bulk updates emit one dataChanged per run of rows, or one spanning range when scattered.
+        """
+        self.model.apply("power", np.arange(10, 20))
+        assert self.ranges == [(10, 19)]
+        self.ranges.clear()
+        self.model.apply("set_channel", np.array([3, 4, 50]), 7)
+        assert self.ranges == [(3, 4), (50, 50)]
+        self.ranges.clear()
+        self.model.apply("power", np.arange(0, 1000, 2))
+        assert len(np.arange(0, 1000, 2)) > MAX_RANGES and self.ranges == [(0, 998)]
+        assert self.model.data(self.model.index(4, 4)) == 0 # powered off again, channel kept
+        assert self.model.data(self.model.index(14, 1)) == "Off"
+
+    def test_keypad_acts_on_selection(self):
+        """
+        This tests that keypad buttons act on every selected row and nothing else.
+        """
+        selection = QItemSelection(self.model.index(100, 0), self.model.index(299, 4))
+        self.dashboard.table.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.Select)
+        self.dashboard.keypad.buttonPOWER.click()
+        self.dashboard.keypad.buttonVOLUP.click()
+        self.dashboard.keypad.button7.click()
+        fleet = self.model.fleet
+        assert fleet.powered().sum() == 200 and fleet.powered()[100:300].all()
+        assert set(fleet.getChannel()[100:300]) == {7} and fleet.getChannel()[:100].sum() == 0
+        assert fleet.describe(150) == "Power - True, Mute - False, Channel - 7, Volume - 1"
+        assert self.ranges == [(100, 299)] * 3
@@ -0,0 +1,96 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify that fleet.TelevisionFleet matches remote.Television
+"""
+### Import packages ###
+import random
+import numpy as np
+import pytest
+from fleet import TelevisionFleet
+from remote import Television
+
+ACTIONS = ["power", "mute", "channel_up", "channel_down", "volume_up", "volume_down", "set_channel"]
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    def setup_method(self):
+        """
+        Configures a small fleet alongside one Television object per fleet slot.
+        """
+        self.fleet = TelevisionFleet(8)
+        self.tvs = [Television() for _ in range(8)]
+
+    def teardown_method(self):
+        """
+        Removes the fleet and tv objects after each test case has been completed to keep each interaction isolated.
+        """
+        del self.fleet
+        del self.tvs
+
+    def check(self):
+        """
+        Compares every slot of the fleet against its Television counterpart.
+        """
+        for index, tv in enumerate(self.tvs):
+            assert self.fleet.describe(index) == tv.__str__()
+
+    ### Test cases ###
+    def test_construction(self):
+        """
+        This tests that every tv in a new fleet starts in the Television default state.
+        """
+        assert len(self.fleet) == 8
+        self.check()
+
+    def test_masks(self):
+        """
+        This tests selecting tvs with a boolean mask and with integer indices, including repeated indices.
+        """
+        mask = np.array([True, False] * 4)
+        self.fleet.power(mask)
+        for index in range(0, 8, 2):
+            self.tvs[index].power()
+        self.check()
+
+        self.fleet.channel_up([1, 2, 2, 3]) # only 2 is on; 2 is selected once
+        self.tvs[2].channel_up()
+        self.check()
+
+        with pytest.raises(ValueError):
+            self.fleet.power(np.ones(3, dtype=bool))
+
+    def test_wraparound_and_clamping(self):
+        """
+        This tests the channel wrap-around and volume clamping at both limits.
+        """
+        self.fleet.power()
+        for tv in self.tvs:
+            tv.power()
+        for action in ["channel_down", "channel_up", "channel_up", "volume_down"] + ["volume_up"] * 5:
+            getattr(self.fleet, action)()
+            for tv in self.tvs:
+                getattr(tv, action)()
+            self.check()
+
+    def test_random_sequences(self):
+        """
+        This tests random action sequences over random selections against the Television reference.
+        """
+        rng = random.Random(1337)
+        for _ in range(500):
+            action = rng.choice(ACTIONS)
+            chosen = [index for index in range(8) if rng.random() < 0.5]
+            if action == "set_channel":
+                value = rng.randint(0, 9)
+                self.fleet.set_channel(value, chosen)
+                for index in chosen:
+                    self.tvs[index].set_channel(value)
+            else:
+                getattr(self.fleet, action)(chosen)
+                for index in chosen:
+                    getattr(self.tvs[index], action)()
+            self.check()
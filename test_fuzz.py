@@ -0,0 +1,52 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the differential fuzzer in fuzz.py
+"""
+### Import packages ###
+import random
+import fuzz
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    @classmethod
+    def setup_class(cls):
+        """
+        Creates the QApplication shared by every test case.
+        """
+        cls.app = fuzz.application()
+
+    ### Test cases ###
+    def test_implementations_agree(self):
+        """
+        This tests that Television and TVRemote agree on random presses over channels in the lineup.
+        """
+        diverged, found = fuzz.fuzz(100, 200, seed=1)
+        assert (diverged, found) == (0, [])
+
+    def test_minimized_reproducer(self):
+        """
+        This tests that a divergence is shrunk to the presses that cause it and printed as a reproducer.
+        """
+        presses = [("power", None), ("volume_up", None), ("mute", None), ("power", None), ("power", None),
+                   ("set_channel", 12), ("volume_down", None), ("apply", "VOL+ x3"), ("channel_down", None),
+                   ("channel_up", None)]
+        assert fuzz.divergence(presses)[0] == 8
+        smallest = fuzz.minimize(presses)
+        assert smallest == [("power", None), ("set_channel", 12), ("channel_down", None)]
+        assert fuzz.reproducer(smallest).splitlines() == [
+            "for tv in (MatchedTelevision(), TVRemote()):", "    tv.power()", "    tv.set_channel(12)",
+            "    tv.channel_down()", "# MatchedTelevision: (True, False, 0, 11)", "# TVRemote: (True, False, 0, 9)"]
+
+    def test_wild_channels_diverge(self):
+        """
+        This tests that the fuzzer finds the known drift on channels outside the lineup, and the load test runs.
+        """
+        diverged, found = fuzz.fuzz(20, 100, seed=2, wild=True, limit=1)
+        assert diverged > 0 and len(found) == 1 and len(found[0]) <= 4
+        presses = fuzz.generate(random.Random(0), 10_000)
+        for factory in (fuzz.MatchedTelevision, fuzz.TVRemote):
+            assert fuzz.throughput(factory, presses) > 0
@@ -0,0 +1,76 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the XMLTV index and lookups in guide.py
+"""
+### Import packages ###
+import os
+from guide import ProgramGuide, parse_time
+
+### Variable Declaration ###
+XMLTV: str = """<?xml version="1.0" encoding="UTF-8"?>
+<tv>
+  <channel id="kqed.example"><display-name>KQED</display-name><lcn>9</lcn></channel>
+  <channel id="4.kron.example"><display-name>KRON</display-name></channel>
+  <channel id="news.example"><display-name>News</display-name><display-name>702</display-name></channel>
+  <channel id="nameless.example"><display-name>Nameless</display-name></channel>
+  <programme start="20261018210000 +0000" stop="20261018220000 +0000" channel="kqed.example"><title>Nova</title></programme>
+  <programme start="20261018200000 +0000" stop="20261018210000 +0000" channel="kqed.example"><title>NewsHour</title></programme>
+  <programme start="20261018200000 +0200" stop="20261018203000 +0200" channel="4.kron.example"><title>Café Stories</title></programme>
+  <programme start="20261018200000 +0000" stop="20261019200000 +0000" channel="news.example"><title>Rolling News</title></programme>
+  <programme start="20261018200000 +0000" stop="20261018210000 +0000" channel="nameless.example"><title>Unlisted</title></programme>
+</tv>
+"""
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    def setup_method(self):
+        """
+        Configures the start of the 20:00 UTC slot the test guide is built around.
+        """
+        self.eight = parse_time("20261018200000")
+
+    ### Test cases ###
+    def test_parse_time(self):
+        """
+        This tests that XMLTV times with and without a UTC offset parse to the same epoch seconds.
+        """
+        assert parse_time("20261018200000 +0000") == self.eight
+        assert parse_time("20261018220000 +0200") == self.eight
+        assert parse_time("20261018150000 -0500") == self.eight
+
+    def test_lookup(self, tmp_path):
+        """
+        This tests looking up the programme on a channel at a given time, including gaps, programmes spanning the lookup and unknown channels.
+        """
+        source = tmp_path / "guide.xml"
+        source.write_text(XMLTV, encoding="utf-8")
+        with ProgramGuide(str(source)) as guide:
+            assert guide.rebuilt
+            assert len(guide) == 4 # the nameless channel's programme is skipped
+            assert guide.now(9, self.eight + 1800)[0] == "NewsHour"
+            assert guide.now(9, self.eight + 3600) == ("Nova", self.eight + 3600, self.eight + 7200)
+            assert guide.now(9, self.eight + 7200) is None
+            assert guide.now(9, self.eight - 1) is None
+            assert guide.now(4, self.eight - 7200)[0] == "Café Stories"
+            assert guide.now(702, self.eight + 40000)[0] == "Rolling News"
+            assert guide.now(5, self.eight) is None
+            assert [title for title, _, _ in guide.schedule(9)] == ["NewsHour", "Nova"]
+
+    def test_index_reuse(self, tmp_path):
+        """
+        This tests that the on-disk index is reused while the guide is unchanged and rebuilt once it is modified.
+        """
+        source = tmp_path / "guide.xml"
+        source.write_text(XMLTV, encoding="utf-8")
+        ProgramGuide(str(source)).close()
+        with ProgramGuide(str(source)) as guide:
+            assert not guide.rebuilt
+        source.write_text(XMLTV.replace("Nova", "Frontline"), encoding="utf-8")
+        os.utime(source, ns=(0, os.stat(source).st_mtime_ns + 1_000_000_000))
+        with ProgramGuide(str(source)) as guide:
+            assert guide.rebuilt
+            assert guide.now(9, self.eight + 3600)[0] == "Frontline"
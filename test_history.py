@@ -0,0 +1,76 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the bounded undo/redo ring buffer in history.py
+"""
+### Import packages ###
+import random
+import pytest
+from compact import pack
+from history import StateHistory
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    def setup_method(self):
+        """
+        Configures a small history for each test case.
+        """
+        self.history = StateHistory(4)
+
+    def teardown_method(self):
+        """
+        Removes the history after each test case has been completed to keep each interaction isolated.
+        """
+        del self.history
+
+    ### Test cases ###
+    def test_undo_redo(self):
+        """
+        This tests stepping back and forward over recorded changes, and that no-op changes are not recorded.
+        """
+        states = [pack(False, False, 0, 0), pack(True, False, 0, 0), pack(True, False, 1, 0), pack(True, True, 1, 7)]
+        for before, after in zip(states, states[1:]):
+            self.history.record(before, after)
+        self.history.record(states[-1], states[-1])
+        assert len(self.history) == 3
+        state = states[-1]
+        for expected in reversed(states[:-1]):
+            state = self.history.undo(state)
+            assert state == expected
+        assert self.history.undo(state) is None
+        for expected in states[1:]:
+            state = self.history.redo(state)
+            assert state == expected
+        assert self.history.redo(state) is None
+
+    def test_new_change_clears_redo(self):
+        """
+        This tests that recording after an undo forgets the undone changes.
+        """
+        self.history.record(1, 2)
+        self.history.record(2, 3)
+        assert self.history.undo(3) == 2
+        self.history.record(2, 9)
+        assert not self.history.canRedo()
+        assert self.history.undo(9) == 2
+        assert self.history.undo(2) == 1
+
+    def test_bounded(self):
+        """
+        This tests that a long session keeps only the newest capacity changes, and negative channels round-trip.
+        """
+        rng = random.Random(0)
+        states = [pack(True, False, 0, -1)] + [pack(True, rng.random() < 0.5, rng.randrange(101), rng.randrange(1 << 40))
+                                               for _ in range(100_000)]
+        for before, after in zip(states, states[1:]):
+            self.history.record(before, after)
+        assert len(self.history) == 4
+        state = states[-1]
+        while self.history.canUndo():
+            state = self.history.undo(state)
+        assert state == states[-5]
+        with pytest.raises(ValueError):
+            StateHistory(0)
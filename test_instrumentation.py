@@ -0,0 +1,79 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the histograms, exporters and wrappers in instrumentation.py
+"""
+### Import packages ###
+import random
+from instrumentation import LatencyHistogram, Metrics, PrometheusFileExporter, bucket_bounds, bucket_index, instrument, uninstrument
+from remote import Television
+
+### Test class ###
+class Test:
+
+    ### Test cases ###
+    def test_buckets(self):
+        """
+        This tests that every value falls inside the bounds of its bucket and that buckets stay within ~6% wide.
+        """
+        rng = random.Random(3)
+        for value in list(range(200)) + [rng.randrange(1 << 40) for _ in range(2000)]:
+            low, high = bucket_bounds(bucket_index(value))
+            assert low <= value <= high
+            assert high - low <= max(1, low // 16)
+
+    def test_percentiles(self):
+        """
+        This tests histogram percentiles against the exact percentiles of the recorded values.
+        """
+        histogram = LatencyHistogram()
+        values = sorted(random.Random(5).randrange(100, 10_000_000) for _ in range(10_000))
+        for value in values:
+            histogram.record(value)
+        for fraction in (0.5, 0.9, 0.99):
+            exact = values[round(fraction * len(values)) - 1]
+            assert exact <= histogram.percentile(fraction) <= exact * 1.07
+        assert histogram.percentile(1.0) == values[-1] == histogram.maximum
+        assert histogram.cumulative([1 << 30])[0] == len(values)
+
+    def test_instrument_and_export(self, tmp_path):
+        """
+        This tests that instrumented methods still act, are counted, and can be unwrapped and exported.
+        """
+        tv, metrics = Television(), Metrics()
+        instrument(tv, metrics)
+        instrument(tv, metrics) # instrumenting twice must not double count
+        tv.power()
+        tv.volume_up()
+        tv.set_channel(2)
+        assert tv.__str__() == "Power - True, Mute - False, Channel - 2, Volume - 1"
+        snapshot = metrics.snapshot()
+        assert snapshot["power"]["count"] == snapshot["volume_up"]["count"] == snapshot["set_channel"]["count"] == 1
+        assert snapshot["mute"]["count"] == 0
+
+        path = tmp_path / "remote.prom"
+        metrics.add_exporter(PrometheusFileExporter(str(path)))
+        metrics.export()
+        text = path.read_text()
+        assert 'tvremote_action_calls_total{action="power"} 1' in text
+        assert 'tvremote_action_latency_seconds_bucket{action="power",le="+Inf"} 1' in text
+
+        uninstrument(tv)
+        tv.power()
+        assert "power" not in tv.__dict__ and metrics.snapshot()["power"]["count"] == 1
+
+    def test_reset(self):
+        """
+        This tests that calls made after a reset are still counted by the methods instrumented before it.
+        """
+        tv, metrics = Television(), Metrics()
+        instrument(tv, metrics)
+        tv.power()
+        tv.power()
+        metrics.reset()
+        assert metrics.snapshot()["power"] == {"count": 0, "mean": 0.0, "p50": 0, "p90": 0, "p99": 0, "max": 0}
+        tv.power()
+        snapshot = metrics.snapshot()
+        assert snapshot["power"]["count"] == 1 and snapshot["power"]["max"] > 0
+        assert snapshot["mute"]["count"] == 0
@@ -0,0 +1,176 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the IR encoder and file sinks in ir.py
+"""
+### Import packages ###
+import os
+import wave
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+import numpy as np
+import pytest
+from PyQt6.QtWidgets import QApplication
+from ir import CODES, NEC, RC5, IRBlaster, IREncoder, TimingSink, WAVSink, buttons, pulses
+from gui import KEYPAD, Key
+from logic import TVRemote
+
+### UDF Declaration ###
+def decode_nec(timings: np.ndarray) -> tuple:
+    """
+    Decodes one NEC frame
+    :param timings: The frame's mark and space durations in us
+    :return: tuple of address and command
+    """
+    assert timings[0] == pytest.approx(9000) and timings[1] == pytest.approx(4500)
+    bits = sum(int(space > 1000) << bit for bit, space in enumerate(timings[3:67:2]))
+    address, command = bits & 0xFF, bits >> 16 & 0xFF
+    assert bits >> 8 & 0xFF == address ^ 0xFF and bits >> 24 == command ^ 0xFF
+    return address, command
+
+def decode_rc5(timings: np.ndarray) -> tuple:
+    """
+    Decodes one RC5 frame
+    :param timings: The frame's mark and space durations in us
+    :return: tuple of toggle, address and command
+    """
+    halves = [0] # the leading half-bit space
+    for index, duration in enumerate(timings[:-1]):
+        halves += [1 - index % 2] * round(duration / RC5.HALF_BIT)
+    halves += [0] * (28 - len(halves))
+    bits = [halves[index + 1] for index in range(0, 28, 2)]
+    assert all(halves[index] != halves[index + 1] for index in range(0, 28, 2)) # Manchester coded
+    value = int("".join(map(str, bits)), 2)
+    return bits[2], value >> 6 & 0x1F, value & 0x3F | (0 if bits[1] else 0x40)
+
+def frames(timings: np.ndarray, length: int) -> list:
+    """
+    Splits raw timings into frames of a fixed number of durations
+    """
+    return [timings[start:start + length] for start in range(0, len(timings), length)]
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    def setup_method(self):
+        """
+        Configures an encoder for each protocol for each test case.
+        """
+        self.nec = IREncoder(NEC(0x04))
+        self.rc5 = IREncoder(RC5())
+
+    def teardown_method(self):
+        """
+        Removes the encoders after each test case has been completed to keep each interaction isolated.
+        """
+        del self.nec
+        del self.rc5
+
+    ### Test Cases ###
+    def test_buttons(self):
+        """
+        This tests that channels, digits and batches expand into the buttons a remote would send.
+        """
+        presses = [("power", None), ("set_channel", 12), ("enter_digit", 0), ("apply", "VOL+ x3, CH-, 7")]
+        assert buttons(presses) == ["power", "1", "2", "0", "volume_up", "volume_up", "volume_up", "channel_down", "7"]
+        with pytest.raises(ValueError):
+            buttons([("set_channel", -1)])
+        with pytest.raises(ValueError):
+            self.nec.render([("input", None)])
+
+    def test_nec(self):
+        """
+        This tests that NEC frames decode to their address and command and are spaced 108 ms apart.
+        """
+        timings = self.nec.timings([("power", None), ("set_channel", 7), ("volume_down", None)])
+        decoded = [decode_nec(frame) for frame in frames(timings, 68)]
+        assert decoded == [(0x04, CODES["power"]), (0x04, 7), (0x04, CODES["volume_down"])]
+        assert timings.sum() == pytest.approx(3 * NEC.PERIOD)
+        with pytest.raises(ValueError):
+            NEC(0x100)
+
+    def test_rc5(self):
+        """
+        This tests that RC5 frames decode to their address and command, and that the toggle bit flips on every press,
+        also across calls.
+        """
+        presses = [("mute", None), ("channel_up", None), ("channel_up", None)]
+        rows = np.concatenate([self.rc5.rows(presses), self.rc5.rows(presses[:1])])
+        assert (rows % 2).tolist() == [0, 1, 0, 1]
+        timings = self.rc5.timings(presses)
+        ends = np.flatnonzero(timings > 50_000) # the gap closing each frame
+        decoded = [decode_rc5(timings[start:end + 1]) for start, end in zip(np.r_[0, ends[:-1] + 1], ends)]
+        assert decoded == [(0, 0, CODES["mute"]), (1, 0, CODES["channel_up"]), (0, 0, CODES["channel_up"])]
+        assert timings.sum() == pytest.approx(3 * RC5.PERIOD)
+        assert decode_rc5(RC5(3).encode(70, 1)) == (1, 3, 70)
+
+    def test_render(self):
+        """
+        This tests that a press sequence renders into one contiguous buffer of the cached frames, matching the frames
+        rendered one press at a time.
+        """
+        presses = [("volume_up", None), ("set_channel", 42), ("mute", None)]
+        samples = self.rc5.render(presses)
+        assert samples.flags.c_contiguous and samples.dtype == np.int16 and samples.shape[1] == 2
+        expected = [pulses(RC5().encode(CODES[button], toggle % 2), self.rc5.rate, RC5.CARRIER)
+                    for toggle, button in enumerate(buttons(presses))]
+        assert np.array_equal(samples, np.concatenate(expected))
+        assert np.array_equal(samples[:, 1], -samples[:, 0]) # antiphase
+        assert len(samples) == 4 * round(RC5.PERIOD * self.rc5.rate / 1e6)
+        assert self.rc5.render([]).shape == (0, 2) and len(self.rc5.timings([])) == 0
+
+    def test_sinks(self, tmp_path):
+        """
+        This tests that the WAV and mode2 sinks write what the encoder renders, in chunks.
+        """
+        macro = [("apply", "VOL+ x700, CH- x600")]
+        blaster = IRBlaster(self.nec, WAVSink(str(tmp_path / "macro.wav")))
+        blaster.send(macro)
+        blaster.press("power")
+        blaster.close()
+        with wave.open(str(tmp_path / "macro.wav")) as file:
+            assert (file.getnchannels(), file.getsampwidth(), file.getframerate()) == (2, 2, self.nec.rate)
+            assert file.getnframes() == 1_301 * round(NEC.PERIOD * self.nec.rate / 1e6)
+        with pytest.raises(ValueError), WAVSink(str(tmp_path / "other.wav"), 44_100) as sink:
+            sink.write(self.nec, macro)
+
+        with TimingSink(str(tmp_path / "macro.mode2")) as sink:
+            sink.write(self.rc5, [("power", None), ("mute", None)])
+        lines = (tmp_path / "macro.mode2").read_text().splitlines()
+        assert lines[:3] == ["pulse 889", "space 889", "pulse 1778"]
+        assert lines[0::2] == [line for line in lines if line.startswith("pulse")]
+        assert sum(int(line.split()[1]) for line in lines) == pytest.approx(2 * RC5.PERIOD, abs=len(lines))
+
+    def test_attach(self, tmp_path):
+        """
+        This tests that a blaster attached to a TVRemote sends every keypad click.
+        """
+        app = QApplication.instance() or QApplication([])
+        remote = TVRemote()
+        blaster = IRBlaster.to_file(str(tmp_path / "remote.mode2"))
+        blaster.attach(remote)
+        for button in (remote.buttonPOWER, remote.button7, remote.buttonVOLUP):
+            button.click()
+        blaster.close()
+        remote.close()
+        timings = np.array([int(line.split()[1]) for line in (tmp_path / "remote.mode2").read_text().splitlines()])
+        assert [decode_nec(frame)[1] for frame in frames(timings, 68)] == [CODES["power"], 7, CODES["volume_up"]]
+
+    def test_attach_unmapped(self, tmp_path, capsys):
+        """
+        This tests that keypad buttons with no IR code are skipped with a warning instead of raising in the Qt slot.
+        """
+        app = QApplication.instance() or QApplication([])
+        remote = TVRemote(layout=KEYPAD + (Key("buttonUNDO", "UNDO", (30, 400, 41, 25), "undo"),))
+        blaster = IRBlaster.to_file(str(tmp_path / "remote.mode2"))
+        blaster.attach(remote)
+        assert "buttonUNDO" in capsys.readouterr().err
+        remote.buttonPOWER.click()
+        remote.buttonUNDO.click() # still undoes, only nothing is sent
+        remote.buttonMUTE.click()
+        blaster.close()
+        remote.close()
+        assert not remote.powered()
+        timings = np.array([int(line.split()[1]) for line in (tmp_path / "remote.mode2").read_text().splitlines()])
+        assert [decode_nec(frame)[1] for frame in frames(timings, 68)] == [CODES["power"], CODES["mute"]]
@@ -0,0 +1,133 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify that journal.JournaledFleet recovers its state
+"""
+### Import packages ###
+import os
+import random
+import pytest
+from compact import CompactTelevision, unpack
+from journal import JOURNAL_RECORD, JournaledFleet
+
+### Variable Declaration ###
+ACTIONS: list = ["power", "mute", "channel_up", "channel_down", "volume_up", "volume_down"]
+
+### Test class ###
+class Test:
+
+    ### Setup ###
+    def apply_random(self, store: JournaledFleet, count: int, seed: int = 0) -> list:
+        """
+        Applies random actions to a store and to plain CompactTelevision objects
+        :return: the expected packed state of every device
+        """
+        rng = random.Random(seed)
+        tvs = [store.tv(device) for device in range(len(store))]
+        for _ in range(count):
+            device, action = rng.randrange(len(store)), rng.choice(ACTIONS)
+            store.apply(device, action)
+            getattr(tvs[device], action)()
+        return [tv.state() for tv in tvs]
+
+    ### Test cases ###
+    def test_new_store(self, tmp_path):
+        """
+        This tests that a new store starts with every device in the default state and no journaled actions.
+        """
+        with JournaledFleet(str(tmp_path), 5, durable=False) as store:
+            assert len(store) == 5
+            assert store.sequence == 0
+            assert str(store.tv(3)) == str(CompactTelevision())
+
+    def test_recover_from_journal(self, tmp_path):
+        """
+        This tests that reopening a store replays the journal to the exact state it was closed in.
+        """
+        store = JournaledFleet(str(tmp_path), 20, group_size=7, durable=False)
+        expected = self.apply_random(store, 500)
+        sequence = store.sequence
+        store.close()
+
+        with JournaledFleet(str(tmp_path)) as store:
+            assert store.sequence == sequence
+            assert [store.state(device) for device in range(20)] == expected
+
+    def test_recover_after_snapshots(self, tmp_path):
+        """
+        This tests recovery from the latest snapshot plus the journal after it, and that replaced files are removed.
+        """
+        store = JournaledFleet(str(tmp_path), 10, snapshot_every=50, durable=False)
+        expected = self.apply_random(store, 400, seed=1)
+        store.close()
+
+        # older snapshots and journal segments are removed once replaced
+        names = sorted(os.listdir(tmp_path))
+        assert len(names) == 2 and names[0].startswith("journal-") and names[1].startswith("snapshot-")
+        with JournaledFleet(str(tmp_path)) as store:
+            assert [store.state(device) for device in range(10)] == expected
+            expected = self.apply_random(store, 100, seed=2)
+        with JournaledFleet(str(tmp_path)) as store:
+            assert [store.state(device) for device in range(10)] == expected
+
+    def test_set_channel_and_unchanged_actions(self, tmp_path):
+        """
+        This tests that set_channel is journaled with its value and that actions which change nothing are not journaled.
+        """
+        with JournaledFleet(str(tmp_path), 2, durable=False) as store:
+            store.apply(0, "volume_up") # off, so nothing changes and nothing is journaled
+            assert store.sequence == 0
+            store.apply(0, "power")
+            store.apply(0, "set_channel", 2)
+        with JournaledFleet(str(tmp_path)) as store:
+            assert store.sequence == 2
+            assert store.tv(0).getChannel() == 2
+
+    def test_uncommitted_records_are_lost(self, tmp_path):
+        """
+        This tests that a crash loses only the group of actions that was never committed.
+        """
+        store = JournaledFleet(str(tmp_path), 3, group_size=1000, group_interval=3600, durable=False)
+        store.apply(0, "power")
+        store.commit()
+        store.apply(1, "power") # never committed: a crash here loses only the open group
+        with JournaledFleet(str(tmp_path)) as recovered:
+            assert recovered.sequence == 1
+            assert unpack(recovered.state(0))[0] and not unpack(recovered.state(1))[0]
+
+    def test_torn_record_is_ignored(self, tmp_path):
+        """
+        This tests that a partly written last record is ignored on recovery and truncated before new records are appended.
+        """
+        with JournaledFleet(str(tmp_path), 3, durable=False) as store:
+            store.apply(0, "power")
+            store.apply(1, "power")
+        journal = [name for name in os.listdir(tmp_path) if name.startswith("journal-")][0]
+        with open(tmp_path / journal, "ab") as file:
+            file.write(JOURNAL_RECORD.pack(3, 2, 1)[:5])
+        with JournaledFleet(str(tmp_path)) as store:
+            assert store.sequence == 2
+            store.apply(2, "power")
+        with JournaledFleet(str(tmp_path)) as store:
+            assert store.sequence == 3
+            assert os.path.getsize(tmp_path / journal) == 3 * JOURNAL_RECORD.size
+
+    def test_negative_and_large_channels(self, tmp_path):
+        """
+        This tests that negative and large channels, which Television accepts, are journaled and recovered.
+        """
+        with JournaledFleet(str(tmp_path), 3, durable=False) as store:
+            for device in range(3):
+                store.apply(device, "power")
+            store.apply(0, "set_channel", -2)
+            store.apply(1, "set_channel", 1 << 23)
+            store.apply(2, "set_channel", 1 << 40)
+            store.apply(0, "channel_up")
+            with pytest.raises(ValueError):
+                store.apply(2, "set_channel", 1 << 60)
+        with JournaledFleet(str(tmp_path)) as store:
+            assert [store.tv(device).getChannel() for device in range(3)] == [-1, 1 << 23, 1 << 40]
+            store.snapshot()
+        with JournaledFleet(str(tmp_path)) as store:
+            assert [store.tv(device).getChannel() for device in range(3)] == [-1, 1 << 23, 1 << 40]
@@ -0,0 +1,66 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify lineup.ChannelLineup
+"""
+### Import packages ###
+import pytest
+from lineup import ChannelLineup
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    def setup_method(self):
+        """
+        Configures a sparse lineup.
+        """
+        self.lineup = ChannelLineup([702, 2, 5, 13, 5, 130, 4])
+
+    ### Test cases ###
+    def test_step(self):
+        """
+        This tests stepping through a sparse lineup, wrapping at both ends and moving channels missing from the lineup to their neighbour first.
+        """
+        assert list(self.lineup.channels) == [2, 4, 5, 13, 130, 702]
+        assert self.lineup.step(5, 1) == 13
+        assert self.lineup.step(702, 1) == 2
+        assert self.lineup.step(2, -1) == 702
+        assert self.lineup.step(13, 6) == 13
+        assert self.lineup.step(4, -13) == 2
+        # channels missing from the lineup move to their neighbour first
+        assert self.lineup.step(6, 1) == 13
+        assert self.lineup.step(6, -1) == 5
+        assert self.lineup.step(900, 1) == 2
+        assert self.lineup.step(0, -2) == 130
+        assert self.lineup.step(6, 0) == 6
+
+    def test_extendable(self):
+        """
+        This tests whether a partly typed channel number can still grow into a channel of the lineup.
+        """
+        assert self.lineup.digits == 3
+        assert self.lineup.extendable(1) # 13, 130
+        assert self.lineup.extendable(13)
+        assert not self.lineup.extendable(130)
+        assert not self.lineup.extendable(5) # 5x and 5xx are missing
+        assert self.lineup.extendable(7)
+        assert self.lineup.extendable(0, 1) # 0 then 13 types 013
+        assert not self.lineup.extendable(13, 3)
+
+    def test_load(self, tmp_path):
+        """
+        This tests loading a lineup file with names, comments and blank lines, and rejecting malformed or empty lineups.
+        """
+        path = tmp_path / "lineup.txt"
+        path.write_text("# number name\n2 KTVU Fox\n\n4,KRON\n5\n", encoding="utf-8")
+        lineup = ChannelLineup.load(str(path))
+        assert list(lineup.channels) == [2, 4, 5]
+        assert lineup.name(2) == "KTVU Fox" and lineup.name(4) == "KRON" and lineup.name(5) == ""
+        assert 4 in lineup and 3 not in lineup
+        path.write_text("two\n", encoding="utf-8")
+        with pytest.raises(ValueError):
+            ChannelLineup.load(str(path))
+        with pytest.raises(ValueError):
+            ChannelLineup([])
@@ -0,0 +1,232 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the TVRemote window in logic.py under the offscreen Qt platform
+"""
+### Import packages ###
+import json
+import os
+import threading
+import time
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtCore import QCoreApplication, QThread, Qt
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication
+from gui import KEYPAD, Key, load_layout
+from guide import ProgramGuide
+from lineup import ChannelLineup
+from logic import TVRemote
+from tuner import PrefetchingTuner, SimulatedTuner
+
+### Variable Declaration ###
+ANIMATE_CLICK: int = 150 # ms for a button pressed by its shortcut to click, Qt animating the press for 100 ms
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    @classmethod
+    def setup_class(cls):
+        """
+        Creates the QApplication shared by every test case.
+        """
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setup_method(self):
+        """
+        Configures a powered-on remote for each test case.
+        """
+        self.remote = TVRemote()
+        self.remote.buttonPOWER.click()
+
+    def teardown_method(self):
+        """
+        Closes the remote after each test case has been completed to keep each interaction isolated.
+        """
+        self.remote.close()
+        del self.remote
+
+    def settle(self):
+        """
+        Lets pending volumeBar repaints fire.
+        """
+        QThread.msleep(2 * TVRemote.FRAME_INTERVAL)
+        QCoreApplication.processEvents()
+
+    ### Test cases ###
+    def test_coalesced_volume_bar(self):
+        """
+        This tests that a burst of VOL clicks changes the volume per click but updates the volumeBar once.
+        """
+        updates = []
+        self.remote.volumeBar.valueChanged.connect(updates.append)
+        for _ in range(10):
+            self.remote.buttonVOLUP.click()
+        assert self.remote.getVolume() == 10
+        assert updates == []
+        self.settle()
+        assert updates == [10]
+
+        self.remote.buttonMUTE.click()
+        self.settle()
+        assert self.remote.volumeBar.value() == 0
+        self.remote.buttonVOLDWN.click()
+        self.settle()
+        assert self.remote.volumeBar.value() == 9
+
+    def test_auto_repeat_buttons(self):
+        """
+        This tests that only the VOL and CH buttons repeat while held, and that scripted clicks step once each.
+        """
+        for button in (self.remote.buttonVOLUP, self.remote.buttonVOLDWN, self.remote.buttonCHUP, self.remote.buttonCHDWN):
+            assert button.autoRepeat()
+        assert not self.remote.buttonPOWER.autoRepeat()
+        for _ in range(3):
+            self.remote.buttonCHUP.click()
+        assert self.remote.getChannel() == 3
+
+    def test_apply_batch(self):
+        """
+        This tests that a batch matches the same presses made one at a time and updates the volumeBar once.
+        """
+        updates = []
+        self.remote.volumeBar.valueChanged.connect(updates.append)
+        self.remote.apply("VOL+ x150, MUTE, VOL- x3, CH- x13, POWER x2")
+        assert str(self.remote) == "Power - True, Mute - False, Channel - 7, Volume - 97"
+        self.settle()
+        assert updates == [97]
+
+    def test_digit_entry(self):
+        """
+        This tests multi-digit channel entry over a sparse lineup, tuning early once no longer channel is possible.
+        """
+        remote = TVRemote(ChannelLineup(range(2, 50_000, 3)))
+        remote.power()
+        remote.button1.click()
+        remote.button2.click()
+        assert remote.getChannel() == 0 # 12 could still become 12xxx
+        for digit in (3, 4, 7):
+            getattr(remote, f"button{digit}").click()
+        assert remote.getChannel() == 12347 # five digits is the longest channel
+        remote.buttonCHUP.click()
+        assert remote.getChannel() == 12350
+        remote.button4.click()
+        remote.button9.click()
+        remote.button9.click()
+        remote.button9.click()
+        remote.button9.click()
+        assert remote.getChannel() == 12350 # 49999 is not in the lineup
+        remote.button4.click()
+        remote.button4.click()
+        QThread.msleep(TVRemote.DIGIT_TIMEOUT * 11 // 10) # coarse timers may fire up to 5% late
+        QCoreApplication.processEvents()
+        assert remote.getChannel() == 44 # tuned by the timeout
+        remote.apply("CH- x16667") # one lap of 16666 channels, then one more
+        assert remote.getChannel() == 41
+        remote.close()
+
+    def test_now_playing(self, tmp_path):
+        """
+        This tests that the window title follows the programme on the current channel.
+        """
+        now = int(time.time())
+        start, stop = time.strftime("%Y%m%d%H%M%S", time.gmtime(now - 60)), time.strftime("%Y%m%d%H%M%S", time.gmtime(now + 3600))
+        source = tmp_path / "guide.xml"
+        source.write_text(f'<tv><channel id="3.example"/><programme start="{start}" stop="{stop}" channel="3.example">'
+                          f'<title>Nova</title></programme></tv>', encoding="utf-8")
+        with ProgramGuide(str(source)) as guide:
+            remote = TVRemote(guide=guide)
+            assert remote.nowPlaying() == ""
+            remote.power()
+            remote.button3.click()
+            assert remote.nowPlaying() == "Nova"
+            assert remote.windowTitle() == "TV Remote - 3: Nova"
+            remote.buttonCHUP.click()
+            assert remote.windowTitle() == "TV Remote"
+            remote.close()
+
+    def test_tuner_requests(self):
+        """
+        This tests that channel changes go to the tuner without waiting for the tune.
+        """
+        backend = SimulatedTuner(delay=0.0)
+        gate = threading.Event()
+        backend.tune = lambda channel : gate.wait(10) and SimulatedTuner.tune(backend, channel) # held until the gate opens
+        with PrefetchingTuner(backend, prefetch=False) as tuner:
+            remote = TVRemote(tuner=tuner)
+            remote.buttonCHUP.click() # off, so nothing is tuned
+            remote.power()
+            remote.buttonCHUP.click()
+            remote.button5.click()
+            assert tuner.cached() == [0, 1, 5]
+            assert tuner.histogram.count == 0 # the clicks returned while every tune was still held
+            gate.set()
+            remote.close()
+
+    def test_undo_redo(self):
+        """
+        This tests that undo and redo step over whole actions and restore the volumeBar at once.
+        """
+        for _ in range(3):
+            self.remote.buttonVOLUP.click()
+        self.remote.buttonMUTE.click()
+        self.remote.buttonVOLUP.click() # unmutes as part of the same action
+        self.remote.buttonCHUP.click()
+        self.remote.apply("VOL- x2, CH+ x2")
+        assert str(self.remote) == "Power - True, Mute - False, Channel - 3, Volume - 2"
+
+        assert self.remote.undo()
+        assert str(self.remote) == "Power - True, Mute - False, Channel - 1, Volume - 4"
+        assert self.remote.volumeBar.value() == 4 # no frame wait
+        self.remote.undo()
+        self.remote.undo()
+        assert str(self.remote) == "Power - True, Mute - True, Channel - 0, Volume - 0"
+        assert self.remote.volumeBar.value() == 0
+        assert self.remote.redo()
+        assert str(self.remote) == "Power - True, Mute - False, Channel - 0, Volume - 4"
+        while self.remote.undo():
+            pass
+        assert str(self.remote) == "Power - False, Mute - False, Channel - 0, Volume - 0"
+        self.remote.power()
+        assert not self.remote.redo()
+
+        for _ in range(3 * TVRemote.HISTORY_SIZE):
+            self.remote.channel_up()
+        assert len(self.remote.history) == TVRemote.HISTORY_SIZE
+
+    def test_keypad_layout(self, tmp_path):
+        """
+        This tests that buttons added to the layout, in code or from a file, work without any new wiring.
+        """
+        path = tmp_path / "keypad.json"
+        path.write_text(json.dumps([{"name": "buttonFAV1", "label": "NEWS", "geometry": [230, 400, 41, 25],
+                                     "action": "set_channel", "argument": 7, "shortcut": "F1"}]))
+        layout = load_layout(path) + (Key("buttonPARTY", "PARTY", (30, 400, 41, 25), "apply", "VOL+ x10, CH+ x2"),)
+        remote = TVRemote(layout=layout)
+        assert remote.buttonGroup.buttons()[:len(KEYPAD)] == [getattr(remote, key.name) for key in KEYPAD]
+        remote.buttonPOWER.click()
+        remote.buttonFAV1.click()
+        assert remote.getChannel() == 7
+        remote.buttonPARTY.click()
+        assert str(remote) == "Power - True, Mute - False, Channel - 9, Volume - 10"
+        assert remote.undo() and remote.getVolume() == 0 # one button, one step
+        remote.close()
+
+    def test_keyboard_shortcuts(self):
+        """
+        This tests that the keypad's keyboard shortcuts press its buttons, each press animated before it clicks.
+        """
+        self.remote.show()
+        self.remote.activateWindow()
+        assert QTest.qWaitForWindowActive(self.remote)
+        window = self.remote.windowHandle() # key events through the window, where Qt matches shortcuts
+        for key in (Qt.Key.Key_Up, Qt.Key.Key_Right):
+            QTest.keyClick(window, key)
+            QTest.qWait(ANIMATE_CLICK)
+        assert str(self.remote) == "Power - True, Mute - False, Channel - 1, Volume - 1"
+        for key in (Qt.Key.Key_M, Qt.Key.Key_4):
+            QTest.keyClick(window, key)
+            QTest.qWait(ANIMATE_CLICK)
+        assert str(self.remote) == "Power - True, Mute - True, Channel - 4, Volume - 0"
+        self.remote.close()
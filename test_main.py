@@ -0,0 +1,93 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the headless path of main.py
+"""
+### Import packages ###
+import io
+import os
+import subprocess
+import sys
+from main import run_headless
+
+### Test class ###
+class Test:
+
+    ### Test cases ###
+    def test_headless_commands(self):
+        """
+        This tests that headless commands drive the remote with the TVRemote limits and report bad lines.
+        """
+        out, err = io.StringIO(), io.StringIO()
+        script = ["# comment\n", "power\n", "\n", "channel_down\n", "4\n", "set_channel x\n", "mute\n", "status\n"]
+        assert run_headless(script, out, err) == 1
+        assert out.getvalue().splitlines() == [
+            "Power - True, Mute - False, Channel - 0, Volume - 0",
+            "Power - True, Mute - False, Channel - 9, Volume - 0",
+            "Power - True, Mute - False, Channel - 4, Volume - 0",
+            "Power - True, Mute - True, Channel - 4, Volume - 0",
+            "Power - True, Mute - True, Channel - 4, Volume - 0",
+        ]
+        assert err.getvalue().startswith("line 6:")
+
+    def test_headless_skips_qt(self):
+        """
+        This tests that the headless path never imports PyQt6.
+        """
+        code = "import sys, main; main.run_headless(['power']); print('PyQt6' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.splitlines()[-1] == "False"
+
+    def test_headless_apply(self):
+        """
+        This tests that apply lines run a whole batch and report one state.
+        """
+        out, err = io.StringIO(), io.StringIO()
+        assert run_headless(["apply POWER, VOL+ x50, CH- x13, 7\n", "apply VOL+ 3\n"], out, err) == 1
+        assert out.getvalue().splitlines() == ["Power - True, Mute - False, Channel - 7, Volume - 50"]
+        assert err.getvalue().startswith("line 2:")
+
+    def test_headless_profile(self, tmp_path):
+        """
+        This tests that --profile and --tracemalloc capture a headless run, still without importing PyQt6.
+        """
+        script = tmp_path / "script.txt"
+        script.write_text("power\nchannel_up\n")
+        profile, allocations = tmp_path / "run.prof", tmp_path / "allocations.txt"
+        code = ("import sys, main; code = main.main(sys.argv[1:]); print('PyQt6' in sys.modules); sys.exit(code)")
+        result = subprocess.run([sys.executable, "-c", code, "--headless", str(script), "--profile", str(profile),
+                                 "--tracemalloc", str(allocations)], capture_output=True, text=True, check=True)
+        assert result.stdout.splitlines()[-1] == "False"
+        assert profile.stat().st_size > 0 and allocations.read_text().startswith("# ")
+
+    def test_headless_ir(self, tmp_path):
+        """
+        This tests that --ir sends every understood headless command as IR, still without importing PyQt6.
+        """
+        script, timings = tmp_path / "script.txt", tmp_path / "ir.mode2"
+        script.write_text("power\n12\nbogus\nstatus\napply VOL+ x3\n")
+        code = ("import sys, main; code = main.main(sys.argv[1:]); print('PyQt6' in sys.modules); sys.exit(code)")
+        result = subprocess.run([sys.executable, "-c", code, "--headless", str(script), "--ir", str(timings)],
+                                capture_output=True, text=True)
+        assert result.returncode == 1 and result.stdout.splitlines()[-1] == "False"
+        assert timings.read_text().count("pulse") == 6 * 34 # POWER, 1, 2 and VOL+ x3, 34 marks per NEC frame
+
+    def test_gui_tuner_lineup(self):
+        """
+        This tests that without --lineup the GUI's tuner prefetches within the remote's default lineup, so channel 9
+        warms channel 0 rather than a channel 10 the remote cannot reach.
+        """
+        code = ("import sys, logic, main\n"
+                "remotes = []\n"
+                "class Remote(logic.TVRemote):\n"
+                "    def __init__(self, *args):\n"
+                "        super().__init__(*args)\n"
+                "        remotes.append(self)\n"
+                "logic.TVRemote = Remote\n"
+                "main.main(['--tune-delay', '0', '--exit-after-start'])\n"
+                "tuner = remotes[0].tuner\n"
+                "print(tuner.lineup is remotes[0].lineup, tuner.lineup.step(9, 1), tuner.lineup.step(0, -1))\n")
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+        assert result.stdout.splitlines()[-1] == "True 0 9"
@@ -0,0 +1,101 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the protocol, client and load generator in netserver.py
+"""
+### Import packages ###
+import asyncio
+from netserver import TVClient, TVServer, load
+
+### Test class ###
+class Test:
+
+    ### Test cases ###
+    def test_execute(self):
+        """
+        This tests single requests, batches and error replies without any sockets.
+        """
+        server = TVServer()
+        assert server.execute("a power") == "1 0 0 0"
+        assert server.execute("a volume_up;a set_channel 3;b get") == "1 0 1 0;1 0 1 3;0 0 0 0"
+        assert server.execute("a mute") == "1 1 0 3"
+        assert server.execute("a") == "ERR expected DEVICE ACTION [VALUE]"
+        assert server.execute("a set_channel x").startswith("ERR")
+        assert server.execute("a input") == "ERR unknown action input"
+        assert server.commands == 5
+
+    def test_rejects_bad_values(self):
+        """
+        This tests that negative channels and values given to buttons are rejected without touching the device.
+        """
+        server = TVServer()
+        server.execute("a power")
+        assert server.execute("a set_channel -1") == "ERR set_channel needs a non-negative integer VALUE"
+        assert server.execute("a set_channel") == "ERR set_channel needs a non-negative integer VALUE"
+        assert server.execute("a power 5") == "ERR power takes no VALUE"
+        assert server.execute("a get 1;a channel_up") == "ERR get takes no VALUE;1 0 0 1"
+        assert server.commands == 2
+
+    def test_tcp_and_udp(self):
+        """
+        This tests pipelined and batched requests over TCP, a UDP datagram, and a short load run.
+        """
+        async def scenario():
+            server = TVServer()
+            port = await server.start(port=0)
+            client = await TVClient().connect(port=port)
+            replies = await asyncio.gather(*(client.send("a", "power") for _ in range(5)))
+            assert replies == ["1 0 0 0", "0 0 0 0"] * 2 + ["1 0 0 0"]
+            assert await client.batch([("a", "channel_up", None), ("a", "set_channel", 2)]) == ["1 0 0 1", "1 0 0 2"]
+            await client.close()
+
+            loop = asyncio.get_running_loop()
+            reply = loop.create_future()
+            class Protocol(asyncio.DatagramProtocol):
+                def datagram_received(self, data, addr):
+                    reply.set_result(data.decode())
+            transport, _ = await loop.create_datagram_endpoint(Protocol, remote_addr=("127.0.0.1", port))
+            transport.sendto(b"a get")
+            assert await asyncio.wait_for(reply, 5) == "1 0 0 2"
+            transport.close()
+
+            results = await load(port=port, connections=5, commands=20, depth=4)
+            assert results["commands"] == 100 and results["p50"] <= results["p99"]
+            await server.close()
+
+        asyncio.run(scenario())
+
+    def test_bad_lines(self):
+        """
+        This tests that non-ASCII and oversized requests get an error reply over TCP and UDP, and the next request is
+        still answered.
+        """
+        async def scenario():
+            server = TVServer()
+            port = await server.start(port=0)
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"a p\xc3\xb6wer\n")
+            assert await reader.readline() == b"ERR requests must be ASCII\n"
+            writer.write(b"a " + b"x" * 100_000 + b"\na power\n")
+            replies = [await reader.readline()]
+            while replies[-1].startswith(b"ERR"): # the tail of the long line may be answered on its own
+                replies.append(await reader.readline())
+            assert replies[0] == b"ERR request too long\n" and replies[-1] == b"1 0 0 0\n"
+            writer.close()
+
+            loop = asyncio.get_running_loop()
+            replies = asyncio.Queue()
+            class Protocol(asyncio.DatagramProtocol):
+                def datagram_received(self, data, addr):
+                    replies.put_nowait(data)
+            transport, _ = await loop.create_datagram_endpoint(Protocol, remote_addr=("127.0.0.1", port))
+            for datagram in (b"a p\xffwer", b"a " + b"x" * 60_000, b"a get"):
+                transport.sendto(datagram)
+            assert await asyncio.wait_for(replies.get(), 5) == b"ERR requests must be ASCII"
+            assert (await asyncio.wait_for(replies.get(), 5)).startswith(b"ERR unknown action")
+            assert await asyncio.wait_for(replies.get(), 5) == b"1 0 0 0"
+            transport.close()
+            await server.close()
+
+        asyncio.run(scenario())
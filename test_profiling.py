@@ -0,0 +1,86 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the profiling hooks and stall watchdog in profiling.py
+"""
+### Import packages ###
+import os
+import pstats
+import time
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+from logic import TVRemote
+from profiling import Profiler, StallWatchdog
+
+### Class definition ###
+class BlockingTuner:
+    """
+    A tuner whose request() blocks, the kind of handler the watchdog is for
+    """
+    def request(self, channel: int) -> None:
+        time.sleep(0.25)
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    @classmethod
+    def setup_class(cls):
+        """
+        Creates the QApplication shared by every test case.
+        """
+        cls.app = QApplication.instance() or QApplication([])
+
+    def run_loop(self, milliseconds):
+        """
+        Runs the Qt event loop for a while.
+        """
+        loop = QEventLoop()
+        QTimer.singleShot(milliseconds, loop.quit)
+        loop.exec()
+
+    ### Test cases ###
+    def test_profiler(self, tmp_path, monkeypatch):
+        """
+        This tests that nothing is profiled unless asked, and that both dumps are written when it is.
+        """
+        monkeypatch.delenv("TVREMOTE_PROFILE", raising=False)
+        monkeypatch.delenv("TVREMOTE_TRACEMALLOC", raising=False)
+        assert Profiler.from_environment() is None
+        monkeypatch.setenv("TVREMOTE_TRACEMALLOC", str(tmp_path / "allocations.txt"))
+        profiler = Profiler.from_environment(str(tmp_path / "run.prof"))
+        profiler.start()
+        remote = TVRemote()
+        remote.power()
+        profiler.dump()
+        remote.channel_up()
+        profiler.stop()
+        remote.close()
+        names = {function for _, _, function in pstats.Stats(profiler.profile).stats}
+        assert {"power", "channel_up"} <= names
+        dumps = (tmp_path / "allocations.txt").read_text().split("\n\n")
+        assert dumps[0].startswith("# ") and dumps[1].startswith("# ") and "traced" in dumps[0]
+
+    def test_stall_watchdog(self):
+        """
+        This tests that a handler blocking the event loop is caught with its stack, and a quiet loop is not.
+        """
+        remote = TVRemote(tuner=BlockingTuner())
+        remote.power() # tunes once, before the watchdog starts
+        watchdog = StallWatchdog(100, out=None)
+        watchdog.start()
+        self.run_loop(200)
+        assert watchdog.stalls == []
+        QTimer.singleShot(0, remote.buttonCHUP.click)
+        self.run_loop(400)
+        watchdog.stop()
+        remote.close()
+        assert len(watchdog.stalls) == 1
+        stall = watchdog.stalls[0]
+        assert stall["handler"].startswith("__channelChanged (logic.py:")
+        assert "request" in stall["stack"] and "channel_up" in stall["stack"]
+        assert 200 <= stall["blocked_ms"] < 400
+        assert watchdog.latency.maximum > 100e6
+        assert "1 stall(s)" in watchdog.report()
@@ -6,7 +6,7 @@ This script executes unit testing with the PyTest module to verify the behavior
 """
 ### Import packages ###
 import pytest
-from television import Television
+from remote import Television
 
 ### Test class ###
 class Test:
@@ -32,8 +32,8 @@ class Test:
         This tests the construction of the television (tv) class of which the variables, tv1 and tv2, have been assigned.
         """
         # Verifying that the values are initalized properly
-        assert self.tv1.__str__() == "Power - False, Channel - 0, Volume - 0"
-        assert self.tv2.__str__() == "Power - False, Channel - 0, Volume - 0"
+        assert self.tv1.__str__() == "Power - False, Mute - False, Channel - 0, Volume - 0"
+        assert self.tv2.__str__() == "Power - False, Mute - False, Channel - 0, Volume - 0"
 
     def test_power(self):
         """
@@ -41,11 +41,11 @@ class Test:
         """
         # Verifying behavior when power is flipped to True
         self.tv1.power() # powered() == True
-        assert self.tv1.__str__() == "Power - True, Channel - 0, Volume - 0"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 0, Volume - 0"
 
         # Verifying behavior when power is flipped back to False
         self.tv1.power() # powered() == False
-        assert self.tv1.__str__() == "Power - False, Channel - 0, Volume - 0"
+        assert self.tv1.__str__() == "Power - False, Mute - False, Channel - 0, Volume - 0"
 
     def test_mute(self):
         """
@@ -55,19 +55,19 @@ class Test:
         self.tv1.power() # powered() == True
         self.tv1.volume_up() # getVolume() == 1
         self.tv1.mute() # muted() == True
-        assert self.tv1.__str__() == "Power - True, Channel - 0, Volume - 0"
+        assert self.tv1.__str__() == "Power - True, Mute - True, Channel - 0, Volume - 0"
 
         # Verifying behavior when tv is on and unmuted
         self.tv1.mute() # muted() == False
-        assert self.tv1.__str__() == "Power - True, Channel - 0, Volume - 1"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 0, Volume - 1"
         
         # Verifying behavior when tv is off and muted
         self.tv2.mute() # muted() == False b/c power is False
-        assert self.tv2.__str__() == "Power - False, Channel - 0, Volume - 0"
+        assert self.tv2.__str__() == "Power - False, Mute - False, Channel - 0, Volume - 0"
         
         # Verifying behavior when tv is off and unmuted
         self.tv2.mute() # muted() == False b/c power is still False
-        assert self.tv2.__str__() == "Power - False, Channel - 0, Volume - 0"
+        assert self.tv2.__str__() == "Power - False, Mute - False, Channel - 0, Volume - 0"
 
     def test_channel_up(self):
         """
@@ -75,20 +75,20 @@ class Test:
         """
         # verifying behavior when tv is off, channel does not incrament
         self.tv1.channel_up() # channel should still equal 0, since power is False
-        assert self.tv1.__str__() == "Power - False, Channel - 0, Volume - 0"
+        assert self.tv1.__str__() == "Power - False, Mute - False, Channel - 0, Volume - 0"
 
         # verifying behavior when tv is on, channel is incramented
         self.tv1.power() # powered() == True
         self.tv1.channel_up() # getChannel() == 1
-        assert self.tv1.__str__() == "Power - True, Channel - 1, Volume - 0"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 1, Volume - 0"
         
         # verifying behavior when tv is on, channel_up cycles back to 1st channel
         self.tv1.channel_up() # getChannel() == 2
-        assert self.tv1.__str__() == "Power - True, Channel - 2, Volume - 0"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 2, Volume - 0"
         self.tv1.channel_up() # getChannel() == 3; now at max channel
-        assert self.tv1.__str__() == "Power - True, Channel - 3, Volume - 0"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 3, Volume - 0"
         self.tv1.channel_up() # getChannel() == 0; back to first channel
-        assert self.tv1.__str__() == "Power - True, Channel - 0, Volume - 0"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 0, Volume - 0"
         
     def test_channel_down(self):
         """
@@ -96,20 +96,20 @@ class Test:
         """
         # verifying behavior when tv is off, channel does not incrament
         self.tv1.channel_down() # channel should still equal 0, since power is False
-        assert self.tv1.__str__() == "Power - False, Channel - 0, Volume - 0"
+        assert self.tv1.__str__() == "Power - False, Mute - False, Channel - 0, Volume - 0"
 
         # verifying behavior when tv is on, channel_down cycles to max channel
         self.tv1.power() # powered() == True
         self.tv1.channel_down() # getChannel() == 3; max channel since it was at min channel already
-        assert self.tv1.__str__() == "Power - True, Channel - 3, Volume - 0"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 3, Volume - 0"
         
         # verifying behavior when tv is on, channel_down decrements
         self.tv1.channel_down() # getChannel() == 2
-        assert self.tv1.__str__() == "Power - True, Channel - 2, Volume - 0"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 2, Volume - 0"
         self.tv1.channel_down() # getChannel() == 1
-        assert self.tv1.__str__() == "Power - True, Channel - 1, Volume - 0"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 1, Volume - 0"
         self.tv1.channel_down() # getChannel() == 0; now back to min channel
-        assert self.tv1.__str__() == "Power - True, Channel - 0, Volume - 0"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 0, Volume - 0"
 
     def test_volume_up(self):
         """
@@ -117,22 +117,22 @@ class Test:
         """
         # Verifying behavior when tv is off, volume does not increase
         self.tv1.volume_up() # getVolume() == 0, since powered() == False
-        assert self.tv1.__str__() == "Power - False, Channel - 0, Volume - 0"
+        assert self.tv1.__str__() == "Power - False, Mute - False, Channel - 0, Volume - 0"
 
         # Verifying behavior when tv is on, volume is incramented
         self.tv1.power() # powered() == True
         self.tv1.volume_up() # getVolume() == 1
-        assert self.tv1.__str__() == "Power - True, Channel - 0, Volume - 1"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 0, Volume - 1"
         
         # Verifying behavior when tv is on, muted, volume incraments and unmutes
         self.tv1.mute() # muted() == True, getVolume() == 0
-        assert self.tv1.__str__() == "Power - True, Channel - 0, Volume - 0"
+        assert self.tv1.__str__() == "Power - True, Mute - True, Channel - 0, Volume - 0"
         self.tv1.volume_up() # muted() == False, getVolume() == 2
-        assert self.tv1.__str__() == "Power - True, Channel - 0, Volume - 2"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 0, Volume - 2"
         
         # Verifying behavior when tv is on, volume does not incrament past maximum value
         self.tv1.volume_up() # getVolume() == 2; shouldn't breach maximum value
-        assert self.tv1.__str__() == "Power - True, Channel - 0, Volume - 2"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 0, Volume - 2"
 
     def test_volume_down(self):
         """
@@ -140,26 +140,26 @@ class Test:
         """
         # Verifying behavior when tv is off, volume does not decreacse
         self.tv1.volume_up() # getVolume() == 0, since powered() == False
-        assert self.tv1.__str__() == "Power - False, Channel - 0, Volume - 0"
+        assert self.tv1.__str__() == "Power - False, Mute - False, Channel - 0, Volume - 0"
 
         # Verifying behavior when tv is on, volume is decremented
         self.tv1.power() # powered() == True
         self.tv1.volume_up() # getVolume() == 1
         self.tv1.volume_down() # getVolume() == 0
-        assert self.tv1.__str__() == "Power - True, Channel - 0, Volume - 0"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 0, Volume - 0"
         
         # Verifying behavior when tv is on, muted, volume decrements and unmutes
         self.tv1.volume_up() # getVolume() == 1
         self.tv1.volume_up() # getVolume() == 2
         self.tv1.mute() # muted() == True, getVolume() == 0
-        assert self.tv1.__str__() == "Power - True, Channel - 0, Volume - 0"
+        assert self.tv1.__str__() == "Power - True, Mute - True, Channel - 0, Volume - 0"
         self.tv1.volume_down() # muted() == False, getVolume() == 1
-        assert self.tv1.__str__() == "Power - True, Channel - 0, Volume - 1"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 0, Volume - 1"
         
         # Verifying behavior when tv is on, volume does not decrement past minimum value
         self.tv1.volume_down() # getVolume() == 0; at minimum value
         self.tv1.volume_down() # getVolume() == 0; shouldn't breach minimum value
-        assert self.tv1.__str__() == "Power - True, Channel - 0, Volume - 0"
+        assert self.tv1.__str__() == "Power - True, Mute - False, Channel - 0, Volume - 0"
 
     def test_channel_select(self):
         # Testing behavior when power is off
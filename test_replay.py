@@ -0,0 +1,59 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the log readers and Replayer in replay.py
+"""
+### Import packages ###
+import json
+from remote import Television
+from replay import Replayer, read_events, synthesize
+
+### Test class ###
+class Test:
+
+    ### Test cases ###
+    def test_jsonl_replay(self, tmp_path):
+        """
+        This tests replaying a JSONL log into Television objects, including unknown actions and checkpoints.
+        """
+        events = [
+            {"device": "a", "action": "power"},
+            {"device": "b", "action": "power"},
+            {"device": "a", "action": "volume_up"},
+            {"device": "a", "action": "set_channel", "value": 3},
+            {"device": "b", "action": "input"},
+            {"device": "b", "action": "channel_down"},
+        ]
+        log = tmp_path / "events.jsonl"
+        log.write_text("\n".join(json.dumps(event) for event in events) + "\n")
+
+        replayer = Replayer(factory=Television, checkpoint_every=2)
+        checkpoints = list(replayer.replay(read_events(str(log))))
+        assert [applied for applied, _ in checkpoints] == [2, 4, 5]
+        assert checkpoints[0][1] == {"a": (True, False, 0, 0), "b": (True, False, 0, 0)}
+        assert replayer.devices["a"].__str__() == "Power - True, Mute - False, Channel - 3, Volume - 1"
+        assert replayer.devices["b"].__str__() == "Power - True, Mute - False, Channel - 3, Volume - 0"
+        assert (replayer.report.events, replayer.report.skipped, replayer.report.devices) == (5, 1, 2)
+
+    def test_csv_matches_television(self, tmp_path):
+        """
+        This tests that a synthesized CSV log replays identically into compact and plain Television objects.
+        """
+        log = tmp_path / "events.csv"
+        synthesize(str(log), 5000, devices=20)
+        compact = Replayer()
+        plain = Replayer(factory=Television)
+        assert compact.run(read_events(str(log))).events == 5000
+        plain.run(read_events(str(log)))
+        assert compact.checkpoint() == plain.checkpoint()
+
+    def test_mismatched_values_and_header(self, tmp_path):
+        """
+        This tests that events whose value does not match their action are skipped rather than aborting the replay,
+        and that only the first CSV row is taken as a header, so a device named "device" is still replayed.
+        """
+        log = tmp_path / "events.csv"
+        log.write_text("device,action,value\na,power,\na,set_channel,\na,power,5\ndevice,power,\na,set_channel,2\n")
+        report = Replayer(factory=Television).run(read_events(str(log)))
+        assert (report.events, report.skipped, report.devices) == (3, 2, 2)
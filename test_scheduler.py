@@ -0,0 +1,139 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the timed actions in scheduler.py and its asyncio and Qt drivers
+"""
+### Import packages ###
+import asyncio
+import os
+import random
+import time
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtWidgets import QApplication
+from fleet import TelevisionFleet
+from remote import Television
+from scheduler import POWER_OFF, POWER_ON, Scheduler, at, attach_qt, run_asyncio
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    def setup_method(self):
+        """
+        Configures a scheduler on a manual clock and a powered-on tv for each test case.
+        """
+        self.now = 0.0
+        self.scheduler = Scheduler(clock=lambda : self.now)
+        self.tv = Television()
+        self.tv.power()
+
+    def teardown_method(self):
+        """
+        Removes the scheduler and tv after each test case has been completed to keep each interaction isolated.
+        """
+        del self.scheduler
+        del self.tv
+
+    ### Test cases ###
+    def test_fire_in_order(self):
+        """
+        This tests that events fire once due, in time order, and that sleep timers only ever turn the tv off.
+        """
+        self.scheduler.schedule(20, self.tv, "set_channel", 3)
+        self.scheduler.schedule(10, self.tv, "channel_up")
+        self.scheduler.schedule_in(30, self.tv, POWER_OFF)
+        self.scheduler.schedule_in(31, self.tv, POWER_OFF)
+        assert (len(self.scheduler), self.scheduler.next_time()) == (4, 10)
+        assert self.scheduler.run_due(5) == 0
+        assert self.scheduler.run_due(10) == 1 and self.tv.getChannel() == 1
+        self.now = 40
+        assert self.scheduler.run_due() == 3
+        assert str(self.tv) == "Power - False, Mute - False, Channel - 3, Volume - 0"
+        self.scheduler.schedule(50, self.tv, POWER_ON)
+        self.scheduler.run_due(50)
+        assert self.tv.powered()
+        assert (len(self.scheduler), self.scheduler.next_time(), self.scheduler.fired) == (0, None, 5)
+
+    def test_cancel(self):
+        """
+        This tests that cancelled events never fire and fired events cannot be cancelled.
+        """
+        handles = self.scheduler.schedule_many((when, self.tv, "volume_up") for when in range(100))
+        for handle in handles[1:100:2]:
+            assert self.scheduler.cancel(handle)
+        assert not self.scheduler.cancel(handles[1])
+        assert len(self.scheduler) == 50
+        assert self.scheduler.run_due(10) == 6
+        assert not self.scheduler.cancel(handles[0])
+        assert self.tv.getVolume() == Television.MAX_VOLUME
+        assert self.scheduler.next_time() == 12
+
+    def test_fleet_matches_single_tvs(self):
+        """
+        This tests that batched fleet firing leaves every device as the same events would leave a single tv.
+        """
+        rng = random.Random(0)
+        fleet = TelevisionFleet(50)
+        tvs = [Television() for _ in range(50)]
+        events = []
+        for _ in range(5000):
+            action = rng.choice(("power", "mute", "channel_up", "channel_down", "volume_up", "volume_down",
+                                 "set_channel", POWER_OFF, POWER_ON))
+            value = rng.randint(0, 3) if action == "set_channel" else None
+            events.append((rng.randrange(1000), action, value, rng.randrange(50)))
+        self.scheduler.schedule_many((when, fleet, action, value, device) for when, action, value, device in events)
+        reference = Scheduler()
+        for when, action, value, device in events:
+            reference.schedule(when, tvs[device], action, value)
+        for now in (100, 500, 999):
+            self.scheduler.run_due(now)
+        reference.run_due(999)
+        assert [fleet.describe(device) for device in range(50)] == [str(tv) for tv in tvs]
+
+    def test_time_of_day(self):
+        """
+        This tests that at() picks the next occurrence of a local time.
+        """
+        now = time.mktime((2026, 10, 18, 21, 15, 0, 0, 0, -1))
+        assert time.localtime(at(20, 0, now))[:5] == (2026, 10, 19, 20, 0)
+        assert time.localtime(at(22, 30, now))[:5] == (2026, 10, 18, 22, 30)
+
+    def test_asyncio_driver(self):
+        """
+        This tests that the asyncio driver sleeps until events are due, and wakes early for an earlier one.
+        """
+        scheduler = Scheduler(clock=time.monotonic)
+
+        async def drive():
+            task = asyncio.create_task(run_asyncio(scheduler))
+            scheduler.schedule_in(0.3, self.tv, "channel_up")
+            await asyncio.sleep(0.01)
+            scheduler.schedule_in(0.05, self.tv, "set_channel", 2)
+            await asyncio.sleep(0.15)
+            early = self.tv.getChannel()
+            await asyncio.sleep(0.25)
+            task.cancel()
+            return early
+
+        assert asyncio.run(drive()) == 2
+        assert self.tv.getChannel() == 3
+        assert scheduler.listener is None
+
+    def test_qt_driver(self):
+        """
+        This tests that the Qt driver fires events from the event loop.
+        """
+        app = QApplication.instance() or QApplication([])
+        scheduler = Scheduler(clock=time.monotonic)
+        timer = attach_qt(scheduler)
+        assert not timer.isActive()
+        scheduler.schedule_in(0.05, self.tv, POWER_OFF)
+        assert timer.isActive()
+        deadline = time.monotonic() + 2
+        while self.tv.powered() and time.monotonic() < deadline:
+            QCoreApplication.processEvents()
+            time.sleep(0.005)
+        assert not self.tv.powered()
+        assert not timer.isActive()
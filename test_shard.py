@@ -0,0 +1,49 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify that shard.ShardedFleet matches remote.Television
+"""
+### Import packages ###
+import random
+import pytest
+from remote import Television
+from shard import ShardedFleet
+
+### Test class ###
+class Test:
+
+    ### Test cases ###
+    @pytest.mark.parametrize("shards", [1, 3])
+    def test_matches_television(self, shards):
+        """
+        This tests random batches, with many events per device, against one Television per device.
+        """
+        rng = random.Random(shards)
+        tvs = [Television() for _ in range(10)]
+        with ShardedFleet(10, shards) as fleet:
+            assert fleet.shards == shards
+            for _ in range(5):
+                devices, actions = [], []
+                for _ in range(200):
+                    device, action = rng.randrange(10), rng.choice(fleet.machine.actions)
+                    devices.append(device)
+                    actions.append(action)
+                    if isinstance(action, tuple):
+                        tvs[device].set_channel(action[1])
+                    else:
+                        getattr(tvs[device], action)()
+                assert fleet.apply(devices, actions) == 200
+                assert [fleet.describe(device) for device in range(10)] == [str(tv) for tv in tvs]
+
+    def test_empty_and_invalid_batches(self):
+        """
+        This tests that an empty batch is a no-op and that out-of-range devices and mismatched batches are rejected.
+        """
+        with ShardedFleet(4, 2) as fleet:
+            assert fleet.apply([], []) == 0
+            assert fleet.state(3) == (False, False, 0, 0)
+            with pytest.raises(IndexError):
+                fleet.apply([4], ["power"])
+            with pytest.raises(ValueError):
+                fleet.apply([0, 1], ["power"])
@@ -0,0 +1,99 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the binary fleet snapshot format in snapshot.py
+"""
+### Import packages ###
+import numpy as np
+import pytest
+from compact import CompactTelevision, unpack
+from fleet import TelevisionFleet
+from remote import Television
+from snapshot import HEADER, Snapshot, from_fleet, from_json, from_televisions, write
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    def setup_method(self):
+        """
+        Configures a random fleet for each test case.
+        """
+        rng = np.random.default_rng(0)
+        self.fleet = TelevisionFleet.from_columns(rng.random(100_003) < 0.5, rng.random(100_003) < 0.3,
+                                                  rng.integers(0, 3, 100_003), rng.integers(0, 4, 100_003))
+
+    def teardown_method(self):
+        """
+        Removes the fleet after each test case has been completed to keep each interaction isolated.
+        """
+        del self.fleet
+
+    ### Test cases ###
+    def test_fleet_round_trip(self, tmp_path):
+        """
+        This tests that a fleet survives a snapshot, including the stored volume of muted tvs.
+        """
+        path = str(tmp_path / "fleet.tvfs")
+        assert from_fleet(path, self.fleet) == len(self.fleet)
+        with Snapshot(path) as snapshot:
+            assert (len(snapshot), snapshot.limits) == (len(self.fleet), (0, 2, 0, 3))
+            for index in (0, 1, 65_536, -1):
+                assert snapshot.describe(index) == self.fleet.describe(index % len(self.fleet))
+            loaded = snapshot.to_fleet()
+            columns = snapshot.columns()
+            assert not columns.flags.writeable
+            assert np.array_equal(columns["volume"], self.fleet.storedVolume())
+            del columns
+        for mine, theirs in zip((loaded.powered(), loaded.muted(), loaded.storedVolume(), loaded.getChannel()),
+                                (self.fleet.powered(), self.fleet.muted(), self.fleet.storedVolume(), self.fleet.getChannel())):
+            assert np.array_equal(mine, theirs)
+        assert loaded.MAX_CHANNEL == Television.MAX_CHANNEL
+
+    def test_objects_and_json(self, tmp_path):
+        """
+        This tests exporting tv objects and converting through JSON and back.
+        """
+        tvs = [CompactTelevision() for _ in range(5)]
+        for tv in tvs[1:]:
+            tv.power()
+            tv.volume_up()
+        tvs[2].mute()
+        tvs[3].set_channel(3)
+        path, text = str(tmp_path / "tvs.tvfs"), str(tmp_path / "tvs.json")
+        from_televisions(path, tvs)
+        with Snapshot(path) as snapshot:
+            assert snapshot[2] == (True, True, 1, 0) # muted, but remembers its volume
+            assert [str(tv) for tv in snapshot.to_televisions()] == [str(tv) for tv in tvs]
+            snapshot.to_json(text)
+        from_json(path, text)
+        with Snapshot(path) as snapshot:
+            assert list(snapshot) == [unpack(tv.state()) for tv in tvs]
+
+        plain = Television()
+        plain.power()
+        plain.volume_up()
+        plain.mute()
+        from_televisions(path, [plain])
+        with Snapshot(path) as snapshot:
+            assert snapshot[0] == (True, True, 0, 0) # a plain Television only shows its volume
+
+    def test_invalid_files(self, tmp_path):
+        """
+        This tests that foreign, truncated and out-of-range reads are refused.
+        """
+        path = tmp_path / "bad.tvfs"
+        path.write_bytes(b"not a snapshot at all, but long enough")
+        with pytest.raises(ValueError):
+            Snapshot(str(path))
+        write(str(path), [(True, False, 1, 2)] * 3, (0, 2, 0, 3))
+        with Snapshot(str(path)) as snapshot:
+            with pytest.raises(IndexError):
+                snapshot[3]
+        path.write_bytes(path.read_bytes()[:HEADER.size + 10])
+        with pytest.raises(ValueError):
+            Snapshot(str(path))
+        write(str(path), [], (0, 2, 0, 3))
+        with Snapshot(str(path)) as snapshot:
+            assert (len(snapshot), list(snapshot)) == (0, [])
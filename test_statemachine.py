@@ -0,0 +1,92 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the transition tables built by statemachine.py
+"""
+### Import packages ###
+import random
+import pytest
+from remote import Television
+from statemachine import StateMachine
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    def setup_method(self):
+        """
+        Configures a state machine over the Television limits and a random action sequence.
+        """
+        self.machine = StateMachine()
+        rng = random.Random(42)
+        self.actions = [rng.choice(self.machine.actions) for _ in range(300)]
+
+    def teardown_method(self):
+        """
+        Removes the machine and actions after each test case has been completed to keep each interaction isolated.
+        """
+        del self.machine
+        del self.actions
+
+    def press(self, tv, action):
+        """
+        Applies a state machine action to a Television object.
+        """
+        if isinstance(action, tuple):
+            getattr(tv, action[0])(action[1])
+        else:
+            getattr(tv, action)()
+
+    ### Test cases ###
+    def test_encoding(self):
+        """
+        This tests that every state number round-trips through decode() and encode().
+        """
+        assert self.machine.size == 2 * 2 * 3 * 4
+        for state in range(self.machine.size):
+            assert self.machine.encode(*self.machine.decode(state)) == state
+        assert self.machine.from_tv(Television()) == 0
+        tv = Television()
+        tv.apply("POWER, VOL+ x2, MUTE, CH+")
+        assert (tv.getVolume(), tv.storedVolume()) == (0, 2)
+        assert self.machine.decode(self.machine.from_tv(tv)) == (True, True, 2, 1)
+
+    def test_tables_match_television(self):
+        """
+        This tests every action table against Television, one press at a time.
+        """
+        tv = Television()
+        state = self.machine.from_tv(tv)
+        for action in self.actions:
+            self.press(tv, action)
+            state = int(self.machine.table(action)[state])
+            assert self.machine.describe(state) == tv.__str__()
+            assert self.machine.from_tv(tv) == state
+
+    def test_compile_and_run(self):
+        """
+        This tests that a compiled sequence and a table walk give the same result as the individual presses.
+        """
+        table = self.machine.compile(self.actions)
+        for state in range(self.machine.size):
+            assert table[state] == self.machine.run(self.actions, state)
+        assert (self.machine.compile(["volume_up"] * 50) == self.machine.repeat("volume_up", 50)).all()
+        assert (self.machine.compile([]) == self.machine.identity()).all()
+
+    def test_reduce_and_scan(self):
+        """
+        This tests the parallel reduction and prefix scan against their sequential counterparts.
+        """
+        assert (self.machine.reduce(self.actions, processes=3) == self.machine.compile(self.actions)).all()
+        trace = self.machine.trace(self.actions, 7)
+        assert (self.machine.scan(self.actions, 7, processes=3) == trace).all()
+
+    def test_unknown_action(self):
+        """
+        This tests that actions outside the state space are rejected.
+        """
+        with pytest.raises(ValueError):
+            self.machine.table(("set_channel", 9))
+        with pytest.raises(ValueError):
+            self.machine.table("input")
@@ -0,0 +1,75 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script executes unit testing with the PyTest module to verify the prefetching tuner in tuner.py
+"""
+### Import packages ###
+import threading
+from lineup import ChannelLineup
+from tuner import PrefetchingTuner, SimulatedTuner
+
+### Class definition ###
+class GatedTuner(SimulatedTuner):
+    """
+    A SimulatedTuner whose tunes cannot finish until the gate is opened, so tests need no wall-clock bounds
+    """
+
+    def __init__(self) -> None:
+        super().__init__(delay=0.0)
+        self.gate = threading.Event()
+
+    def tune(self, channel: int) -> tuple:
+        assert self.gate.wait(10), "the gate was never opened"
+        return super().tune(channel)
+
+### Test class ###
+class Test:
+
+    ### Setup and teardown ###
+    def setup_method(self):
+        """
+        Configures a sparse lineup and a fast simulated tuner.
+        """
+        self.lineup = ChannelLineup([2, 5, 9, 14, 20])
+        self.backend = SimulatedTuner(delay=0.05)
+
+    ### Test cases ###
+    def test_request_does_not_block(self):
+        """
+        This tests that a request returns before its tune finishes, and that tuned channels stay cached.
+        """
+        backend = GatedTuner()
+        with PrefetchingTuner(backend, self.lineup, prefetch=False) as tuner:
+            future = tuner.request(9) # the tune cannot finish yet, so returning at all shows request() did not wait
+            assert not future.done()
+            backend.gate.set()
+            assert future.result()[0] == 9
+            assert tuner.misses == 1 and tuner.hits == 0
+            assert tuner.request(9).done() # tuned channels stay cached
+            assert tuner.hits == 1
+
+    def test_prefetch_neighbours_and_history(self):
+        """
+        This tests that the neighbours of a channel and the previous channel are prefetched, so switching to them hits.
+        """
+        with PrefetchingTuner(self.backend, self.lineup, history=1) as tuner:
+            tuner.request(9).result()
+            assert set(tuner.cached()) == {5, 9, 14}
+            # the neighbours of 9 were queued while it was watched, so switching to one reuses that tune
+            tuner.request(14).result()
+            assert tuner.misses == 1 and tuner.hits == 1
+            assert {9, 20}.issubset(tuner.cached()) # back to 9 and on to 20 are queued too
+            tuner.request(2).result()
+            assert tuner.misses == 2 and tuner.hits == 1
+            assert tuner.histogram.count == 3
+
+    def test_capacity(self):
+        """
+        This tests that the cache keeps at most capacity channels, the most recently requested last.
+        """
+        with PrefetchingTuner(self.backend, self.lineup, capacity=4, neighbours=1, history=1) as tuner:
+            for channel in self.lineup.channels:
+                tuner.request(channel)
+            cached = tuner.cached()
+            assert len(cached) == 4 and cached[-1] == 20
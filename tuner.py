@@ -0,0 +1,260 @@
+"""
+:Author: Seth Johnson
+:Date: 10-18-2026
+:Description:
+This script houses the tuner backends behind TVRemote channel changes. A backend's tune(channel) blocks until the
+channel is ready, like real tuner hardware, and SimulatedTuner stands in for one by sleeping for a configurable delay.
+
+PrefetchingTuner sits in front of a backend. Channel requests return a Future at once, so the caller (the Qt event
+loop in TVRemote) never waits on a tune. Tunes run on background threads, and while the viewer watches, neighbouring
+channels in the lineup and recently watched channels are tuned ahead of time into an LRU cache, so the next
+channel_up, channel_down or jump back is usually already tuned. Switch latency, from request until the channel is
+ready, is recorded in an instrumentation.LatencyHistogram.
+
+Running it directly surfs a simulated tuner with prefetch off and on and prints both latency distributions.
+"""
+
+### Import packages ###
+import argparse
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from instrumentation import LatencyHistogram
+from lineup import ChannelLineup
+
+### Class definition ###
+class SimulatedTuner:
+    """
+    A local stand-in for tuner hardware: tune() sleeps for delay seconds, plus up to jitter seconds more
+
+    Attributes
+    ----------
+    delay : float
+        The fixed tune time in seconds
+    jitter : float
+        The most random extra tune time in seconds
+    tunes : int
+        The number of tunes performed
+    """
+
+    def __init__(self, delay: float = 0.3, jitter: float = 0.0, seed: int = 0) -> None:
+        """
+        :param delay: The fixed tune time in seconds
+        :param jitter: The most random extra tune time in seconds
+        :param seed: The random seed for the jitter
+        """
+        self.delay: float = delay
+        self.jitter: float = jitter
+        self.tunes: int = 0
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+
+    def tune(self, channel: int) -> tuple:
+        """
+        Tunes to a channel, blocking until it is ready
+        :param channel: The channel number
+        :return: tuple of the channel and the monotonic time it became ready
+        """
+        with self.__lock:
+            self.tunes += 1
+            extra = self.__random.uniform(0, self.jitter) if self.jitter else 0.0
+        time.sleep(self.delay + extra)
+        return channel, time.monotonic()
+
+class PrefetchingTuner:
+    """
+    A non-blocking front end for a tuner backend, with an LRU cache of tuned and tuning channels
+
+    Attributes
+    ----------
+    backend
+        Any object with a blocking tune(channel) method
+    histogram : LatencyHistogram
+        Nanoseconds from each request() until its channel was ready
+    hits / misses : int
+        Requests served from the cache (tuned or still tuning) and requests that started a new tune
+
+    Methods
+    -------
+    request(channel):
+        Starts switching to a channel and returns a Future of the backend's tune() result
+    close():
+        Stops the background threads
+    """
+
+    ### Constructors ###
+    def __init__(self, backend, lineup: ChannelLineup = None, capacity: int = 8, neighbours: int = 1,
+                 history: int = 2, workers: int = 4, prefetch: bool = True) -> None:
+        """
+        :param backend: Any object with a blocking tune(channel) method
+        :param lineup: The channels neighbours are taken from, defaulting to every channel
+        :param capacity: The most channels kept tuned or tuning at once
+        :param neighbours: Channels prefetched on each side of the current channel
+        :param history: Recently watched channels kept prefetched
+        :param workers: Background threads for prefetching, the number of spare tuners
+        :param prefetch: Whether to prefetch at all
+        """
+        self.backend = backend
+        self.lineup: ChannelLineup = lineup
+        self.capacity: int = max(capacity, 1 + 2 * neighbours + history)
+        self.neighbours: int = neighbours
+        self.prefetch: bool = prefetch
+        self.histogram: LatencyHistogram = LatencyHistogram()
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self.__cache: OrderedDict = OrderedDict() # channel to Future, least recently used first
+        self.__history: deque = deque(maxlen=history)
+        self.__lock = threading.Lock()
+        # requested tunes get their own thread so they never queue behind prefetches
+        self.__foreground = ThreadPoolExecutor(1, thread_name_prefix="tune")
+        self.__background = ThreadPoolExecutor(workers, thread_name_prefix="prefetch")
+
+    def close(self) -> None:
+        """
+        Cancels queued prefetches and waits for running tunes to finish
+        """
+        self.__background.shutdown(cancel_futures=True)
+        self.__foreground.shutdown()
+
+    def __enter__(self) -> "PrefetchingTuner":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    ### Mutators ###
+    def request(self, channel: int) -> Future:
+        """
+        Starts switching to a channel without blocking. A tuned channel is ready at once, one being prefetched is
+        ready when its tune finishes, and any other is tuned on the foreground thread.
+        :param channel: The channel number
+        :return: a Future of the backend's tune() result
+        """
+        start = time.perf_counter_ns()
+        with self.__lock:
+            future = self.__cache.get(channel)
+            if future is None or future.cancelled():
+                self.misses += 1
+                future = self.__cache[channel] = self.__foreground.submit(self.backend.tune, channel)
+            else:
+                self.hits += 1
+            if channel in self.__history:
+                self.__history.remove(channel)
+            if self.prefetch:
+                self.__prefetch(channel)
+            self.__history.append(channel)
+            self.__cache.move_to_end(channel)
+            self.__evict()
+        future.add_done_callback(lambda done : done.cancelled() or self.__record(time.perf_counter_ns() - start))
+        return future
+
+    def __record(self, latency: int) -> None:
+        """
+        Records a switch latency from whichever thread finished the tune. Never called with the lock held, since
+        cancelled futures, whose callbacks run inside __evict(), are not recorded.
+        :param latency: Nanoseconds from the request until its channel was ready
+        """
+        with self.__lock:
+            self.histogram.record(latency)
+
+    def __prefetch(self, channel: int) -> None:
+        """
+        Queues background tunes of the channels likely to be watched next, nearest first. Called with the lock held.
+        :param channel: The channel being switched to
+        """
+        wanted = []
+        for distance in range(1, self.neighbours + 1):
+            if self.lineup is None:
+                wanted += [channel + distance, channel - distance]
+            else:
+                wanted += [self.lineup.step(channel, distance), self.lineup.step(channel, -distance)]
+        wanted += reversed(self.__history)
+        wanted = [candidate for candidate in wanted if candidate != channel and candidate >= 0]
+        for candidate in wanted:
+            future = self.__cache.get(candidate)
+            if future is None or future.cancelled():
+                self.__cache[candidate] = self.__background.submit(self.backend.tune, candidate)
+        for candidate in reversed(wanted): # nearest ends up most recently used, so it is evicted last
+            self.__cache.move_to_end(candidate)
+
+    def __evict(self) -> None:
+        """
+        Drops least recently used channels beyond capacity, cancelling their tunes if they have not started
+        """
+        while len(self.__cache) > self.capacity:
+            _, future = self.__cache.popitem(last=False)
+            future.cancel()
+
+    ### Accessors ###
+    def cached(self) -> list:
+        """
+        Returns the channels that are tuned or tuning, least recently used first
+        :return: list of channel numbers
+        """
+        with self.__lock:
+            return list(self.__cache)
+
+    def report(self) -> str:
+        """
+        Summarises the switch latencies recorded so far
+        :return: string of the hit rate and latency percentiles in milliseconds
+        """
+        histogram = self.histogram
+        requests = self.hits + self.misses
+        return (f"{requests} switches, {self.hits / max(1, requests):.0%} cached, backend tunes {getattr(self.backend, 'tunes', '?')}: "
+                f"mean {histogram.total / max(1, histogram.count) / 1e6:.1f} ms, p50 {histogram.percentile(0.5) / 1e6:.1f} ms, "
+                f"p75 {histogram.percentile(0.75) / 1e6:.1f} ms, p90 {histogram.percentile(0.9) / 1e6:.1f} ms, "
+                f"p99 {histogram.percentile(0.99) / 1e6:.1f} ms, max {histogram.maximum / 1e6:.1f} ms")
+
+### Benchmark ###
+def surf(tuner: PrefetchingTuner, lineup: ChannelLineup, presses: int, think: float, seed: int = 0) -> None:
+    """
+    Simulates a viewer: mostly channel_up/channel_down, sometimes a jump back to a recent channel or to a random one,
+    pausing think seconds between presses
+    :param tuner: The tuner to drive
+    :param lineup: The channels surfed
+    :param presses: The number of channel changes
+    :param think: Seconds between presses
+    :param seed: The random seed
+    """
+    rng = random.Random(seed)
+    channel, previous = lineup.first(), lineup.first()
+    futures = []
+    for _ in range(presses):
+        roll = rng.random()
+        if roll < 0.7:
+            target = lineup.step(channel, rng.choice((1, 1, 1, -1)))
+        elif roll < 0.9:
+            target = previous
+        else:
+            target = rng.choice(lineup.channels)
+        channel, previous = target, channel
+        futures.append(tuner.request(channel))
+        time.sleep(think)
+    for future in futures:
+        if not future.cancelled():
+            future.result()
+
+## Main Function ##
+def main() -> None:
+    """
+    Surfs the same simulated viewer with prefetch off and on, printing both latency reports
+    """
+    parser = argparse.ArgumentParser(description="Tuner prefetch benchmark")
+    parser.add_argument("--delay", type=float, default=0.3, help="seconds per tune")
+    parser.add_argument("--jitter", type=float, default=0.1, help="most extra seconds per tune")
+    parser.add_argument("--think", type=float, default=0.5, help="seconds between presses")
+    parser.add_argument("--presses", type=int, default=60, help="channel changes per run")
+    args = parser.parse_args()
+
+    lineup = ChannelLineup(range(2, 200, 3))
+    for prefetch in (False, True):
+        with PrefetchingTuner(SimulatedTuner(args.delay, args.jitter), lineup, prefetch=prefetch) as tuner:
+            surf(tuner, lineup, args.presses, args.think)
+            print(f"prefetch {'on ' if prefetch else 'off'}: {tuner.report()}")
+
+if __name__ == "__main__":
+    main()